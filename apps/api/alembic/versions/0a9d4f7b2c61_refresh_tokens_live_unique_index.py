@@ -0,0 +1,75 @@
+"""refresh_tokens: partial unique index on live tokens, partial expiry index
+
+Revision ID: 0a9d4f7b2c61
+Revises: f3a5c8e2d016
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0a9d4f7b2c61"
+down_revision = "f3a5c8e2d016"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Every lookup/revoke filters revoked_at IS NULL, so the full unique index over all
+    # token history (and the non-unique partial one from 8c4f2e6a1d37) is replaced by a
+    # single unique index over live tokens only.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ux_refresh_tokens_live",
+            "refresh_tokens",
+            ["token_hash"],
+            unique=True,
+            postgresql_where=sa.text("revoked_at IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_refresh_tokens_expired",
+            "refresh_tokens",
+            ["expires_at"],
+            postgresql_where=sa.text("revoked_at IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_refresh_tokens_active_token_hash",
+            table_name="refresh_tokens",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_refresh_tokens_token_hash",
+            table_name="refresh_tokens",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_refresh_tokens_token_hash",
+            "refresh_tokens",
+            ["token_hash"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_refresh_tokens_active_token_hash",
+            "refresh_tokens",
+            ["token_hash"],
+            postgresql_where=sa.text("revoked_at IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index("ix_refresh_tokens_expired", table_name="refresh_tokens", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ux_refresh_tokens_live", table_name="refresh_tokens", postgresql_concurrently=True, if_exists=True)
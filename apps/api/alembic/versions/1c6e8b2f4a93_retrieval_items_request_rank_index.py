@@ -0,0 +1,51 @@
+"""retrieval_request_items (request_id, rank) index
+
+Revision ID: 1c6e8b2f4a93
+Revises: 0a9d4f7b2c61
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "1c6e8b2f4a93"
+down_revision = "0a9d4f7b2c61"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_rri_request_rank",
+            "retrieval_request_items",
+            ["request_id", "rank"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Leading request_id column covers the single-column index.
+        op.drop_index(
+            "ix_retrieval_request_items_request_id",
+            table_name="retrieval_request_items",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_retrieval_request_items_request_id",
+            "retrieval_request_items",
+            ["request_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_rri_request_rank",
+            table_name="retrieval_request_items",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
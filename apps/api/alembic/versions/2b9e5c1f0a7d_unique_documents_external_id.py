@@ -0,0 +1,58 @@
+"""unique documents (workspace_id, source_id, external_id) for ON CONFLICT upserts
+
+Revision ID: 2b9e5c1f0a7d
+Revises: 7d4dbe514152
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2b9e5c1f0a7d"
+down_revision = "7d4dbe514152"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Older racing ingests may have produced duplicates. Keep the newest row as the
+    # upsert target and delete the older copies: their chunks/embeddings cascade, so
+    # stale text stops showing up in retrieval (trace rows keep a NULL document_id).
+    op.execute(
+        """
+        DELETE FROM documents d
+        USING (
+            SELECT id,
+                   row_number() OVER (
+                       PARTITION BY workspace_id, source_id, external_id
+                       ORDER BY updated_at DESC, created_at DESC, id DESC
+                   ) AS rn
+            FROM documents
+            WHERE external_id IS NOT NULL
+        ) dup
+        WHERE d.id = dup.id AND dup.rn > 1
+        """
+    )
+
+    # Built outside the migration transaction so ingests keep writing meanwhile.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_documents_workspace_source_external_id",
+            "documents",
+            ["workspace_id", "source_id", "external_id"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "uq_documents_workspace_source_external_id",
+            table_name="documents",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
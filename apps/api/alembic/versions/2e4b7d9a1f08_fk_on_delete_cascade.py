@@ -0,0 +1,92 @@
+"""DB-level ON DELETE for FKs that only had ORM cascades
+
+Revision ID: 2e4b7d9a1f08
+Revises: 1c6e8b2f4a93
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2e4b7d9a1f08"
+down_revision = "1c6e8b2f4a93"
+branch_labels = None
+depends_on = None
+
+
+# (table, column, referenced table, ON DELETE action)
+_FKS = [
+    ("workspaces", "owner_user_id", "users", "CASCADE"),
+    ("refresh_tokens", "user_id", "users", "CASCADE"),
+    ("runs", "workspace_id", "workspaces", "CASCADE"),
+    ("artifacts", "run_id", "runs", "CASCADE"),
+    ("evidence", "run_id", "runs", "CASCADE"),
+    ("pipeline_templates", "workspace_id", "workspaces", "CASCADE"),
+    ("pipeline_runs", "workspace_id", "workspaces", "CASCADE"),
+    ("pipeline_runs", "template_id", "pipeline_templates", "CASCADE"),
+    ("pipeline_steps", "pipeline_run_id", "pipeline_runs", "CASCADE"),
+    # Run.pipeline_steps had no ORM cascade: the ORM nulled the link on run delete.
+    ("pipeline_steps", "run_id", "runs", "SET NULL"),
+    ("documents", "source_id", "sources", "CASCADE"),
+    ("chunks", "document_id", "documents", "CASCADE"),
+    ("embeddings", "chunk_id", "chunks", "CASCADE"),
+]
+
+
+def _drop_fk(table: str, column: str) -> None:
+    # Constraint names differ between autogenerated and hand-written migrations;
+    # find the single-column FK on this column instead of guessing.
+    op.execute(
+        f"""
+        DO $$
+        DECLARE r record;
+        BEGIN
+            FOR r IN
+                SELECT con.conname
+                FROM pg_constraint con
+                JOIN pg_attribute a ON a.attrelid = con.conrelid AND a.attnum = con.conkey[1]
+                WHERE con.conrelid = '{table}'::regclass
+                  AND con.contype = 'f'
+                  AND array_length(con.conkey, 1) = 1
+                  AND a.attname = '{column}'
+            LOOP
+                EXECUTE format('ALTER TABLE {table} DROP CONSTRAINT %I', r.conname);
+            END LOOP;
+        END $$;
+        """
+    )
+
+
+def _add_fk(table: str, column: str, ref: str, action: str | None) -> None:
+    # NOT VALID skips the scan of existing rows, so the ACCESS EXCLUSIVE lock taken
+    # by ADD CONSTRAINT is brief; rows are checked later by _validate_fks.
+    on_delete = f" ON DELETE {action}" if action else ""
+    op.execute(
+        f"ALTER TABLE {table} ADD CONSTRAINT {table}_{column}_fkey "
+        f"FOREIGN KEY ({column}) REFERENCES {ref}(id){on_delete} NOT VALID"
+    )
+
+
+def _validate_fks() -> None:
+    # VALIDATE CONSTRAINT only takes SHARE UPDATE EXCLUSIVE, but inside the migration
+    # transaction the table would still hold the lock from ADD CONSTRAINT. Commit the
+    # DROP/ADD first and validate each constraint in its own autocommit statement.
+    with op.get_context().autocommit_block():
+        for table, column, _ref, _action in _FKS:
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {table}_{column}_fkey")
+
+
+def upgrade() -> None:
+    for table, column, ref, action in _FKS:
+        _drop_fk(table, column)
+        _add_fk(table, column, ref, action)
+    _validate_fks()
+
+
+def downgrade() -> None:
+    for table, column, ref, _action in reversed(_FKS):
+        _drop_fk(table, column)
+        _add_fk(table, column, ref, None)
+    _validate_fks()
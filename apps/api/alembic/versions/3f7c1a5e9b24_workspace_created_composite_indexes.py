@@ -0,0 +1,45 @@
+"""composite (workspace_id, created_at) indexes on runs, pipeline_runs, ingestion_jobs, retrieval_requests
+
+Revision ID: 3f7c1a5e9b24
+Revises: 2e4b7d9a1f08
+Create Date: 2026-10-16 22:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3f7c1a5e9b24"
+down_revision = "2e4b7d9a1f08"
+branch_labels = None
+depends_on = None
+
+
+# (name, table, single-column workspace_id index it replaces)
+_INDEXES = [
+    ("ix_runs_ws_created", "runs", "ix_runs_workspace_id"),
+    ("ix_pipeline_runs_ws_created", "pipeline_runs", "ix_pipeline_runs_workspace_id"),
+    ("ix_ingestion_jobs_ws_created", "ingestion_jobs", "ix_ingestion_jobs_workspace_id"),
+    ("ix_retrieval_requests_ws_created", "retrieval_requests", "ix_retrieval_requests_workspace_id"),
+]
+
+
+def upgrade() -> None:
+    # "Recent activity in workspace" lists filter on workspace_id and ORDER BY
+    # created_at DESC LIMIT n; a backward scan of this index serves that without a
+    # sort. Built CONCURRENTLY, so it needs the autocommit block.
+    with op.get_context().autocommit_block():
+        for name, table, old in _INDEXES:
+            op.create_index(
+                name, table, ["workspace_id", "created_at"], postgresql_concurrently=True, if_not_exists=True
+            )
+            # Prefix-covered by the composite.
+            op.drop_index(old, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, old in _INDEXES:
+            op.create_index(old, table, ["workspace_id"], postgresql_concurrently=True, if_not_exists=True)
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,49 @@
+"""CHECK constraint on action_items.status + partial index for the queued inbox
+
+Revision ID: 4a8d2f6c1e37
+Revises: 3f7c1a5e9b24
+Create Date: 2026-10-16 23:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "4a8d2f6c1e37"
+down_revision = "3f7c1a5e9b24"
+branch_labels = None
+depends_on = None
+
+
+_STATUSES = ("queued", "approved", "rejected", "cancelled")
+
+
+def upgrade() -> None:
+    values = ", ".join(f"'{v}'" for v in _STATUSES)
+
+    # Every write path validates or hardcodes the status; park any stray legacy
+    # value as cancelled rather than failing the migration.
+    op.execute(f"UPDATE action_items SET status = 'cancelled' WHERE status NOT IN ({values})")
+    op.execute(
+        f"ALTER TABLE action_items ADD CONSTRAINT ck_action_items_status CHECK (status IN ({values})) NOT VALID"
+    )
+    op.execute("ALTER TABLE action_items VALIDATE CONSTRAINT ck_action_items_status")
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_action_items_ws_queued",
+            "action_items",
+            ["workspace_id", "created_at"],
+            postgresql_where="status = 'queued'",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_action_items_ws_queued", table_name="action_items", postgresql_concurrently=True, if_exists=True
+        )
+    op.drop_constraint("ck_action_items_status", "action_items", type_="check")
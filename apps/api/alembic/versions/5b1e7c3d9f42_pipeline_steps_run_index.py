@@ -0,0 +1,50 @@
+"""composite (pipeline_run_id, step_index) index on pipeline_steps
+
+Revision ID: 5b1e7c3d9f42
+Revises: 4a8d2f6c1e37
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5b1e7c3d9f42"
+down_revision = "4a8d2f6c1e37"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Steps are always read per pipeline run ordered by step_index (or looked up
+    # by both); the composite serves the ORDER BY without a sort and prefix-covers
+    # the single-column index it replaces.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_pipeline_steps_run_idx",
+            "pipeline_steps",
+            ["pipeline_run_id", "step_index"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_pipeline_steps_pipeline_run_id",
+            table_name="pipeline_steps",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_pipeline_steps_pipeline_run_id",
+            "pipeline_steps",
+            ["pipeline_run_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_pipeline_steps_run_idx", table_name="pipeline_steps", postgresql_concurrently=True, if_exists=True
+        )
@@ -0,0 +1,25 @@
+"""store refresh_tokens.token_hash as raw HMAC bytes (bytea)
+
+Revision ID: 5e1a7c3d9b20
+Revises: 2b9e5c1f0a7d
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5e1a7c3d9b20"
+down_revision = "2b9e5c1f0a7d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing rows hold the same HMAC hex-encoded; decode in place so live tokens keep working.
+    op.execute("ALTER TABLE refresh_tokens ALTER COLUMN token_hash TYPE bytea USING decode(token_hash, 'hex')")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE refresh_tokens ALTER COLUMN token_hash TYPE varchar(64) USING encode(token_hash, 'hex')")
@@ -0,0 +1,40 @@
+"""native ENUM for pipeline_runs.status and pipeline_steps.status
+
+Revision ID: 6c2f8a4d0b15
+Revises: 5b1e7c3d9f42
+Create Date: 2026-10-17 01:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "6c2f8a4d0b15"
+down_revision = "5b1e7c3d9f42"
+branch_labels = None
+depends_on = None
+
+
+_ENUM = "pipeline_status"
+_VALUES = ("created", "running", "completed", "failed")
+_TABLES = ("pipeline_runs", "pipeline_steps")
+
+
+def _quoted(values) -> str:
+    return ", ".join(f"'{v}'" for v in values)
+
+
+def upgrade() -> None:
+    op.execute(f"CREATE TYPE {_ENUM} AS ENUM ({_quoted(_VALUES)})")
+    for table in _TABLES:
+        # Only the pipeline engine writes these (hardcoded values); map any stray
+        # legacy value rather than failing the cast.
+        op.execute(f"UPDATE {table} SET status = 'failed' WHERE status NOT IN ({_quoted(_VALUES)})")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN status TYPE {_ENUM} USING status::text::{_ENUM}")
+
+
+def downgrade() -> None:
+    for table in reversed(_TABLES):
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN status TYPE varchar(32) USING status::text")
+    op.execute(f"DROP TYPE {_ENUM}")
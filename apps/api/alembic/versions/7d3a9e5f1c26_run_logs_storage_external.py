@@ -0,0 +1,32 @@
+"""run_logs.message / run_logs.meta: STORAGE EXTERNAL (no TOAST compression)
+
+Revision ID: 7d3a9e5f1c26
+Revises: 6c2f8a4d0b15
+Create Date: 2026-10-17 02:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7d3a9e5f1c26"
+down_revision = "6c2f8a4d0b15"
+branch_labels = None
+depends_on = None
+
+
+_COLUMNS = ("message", "meta")
+
+
+def upgrade() -> None:
+    # run_logs is append-heavy and read back rarely (run detail / export). Oversized
+    # values still move out of line, but inserts skip pglz compression. Catalog-only
+    # change: affects newly written values, existing rows are not rewritten.
+    for col in _COLUMNS:
+        op.execute(f"ALTER TABLE run_logs ALTER COLUMN {col} SET STORAGE EXTERNAL")
+
+
+def downgrade() -> None:
+    for col in _COLUMNS:
+        op.execute(f"ALTER TABLE run_logs ALTER COLUMN {col} SET STORAGE EXTENDED")
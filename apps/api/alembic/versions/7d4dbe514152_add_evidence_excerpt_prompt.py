@@ -0,0 +1,33 @@
+"""add evidence.excerpt_prompt (prompt-ready excerpt, computed on write)
+
+Revision ID: 7d4dbe514152
+Revises: 32b0802ebe63
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7d4dbe514152"
+down_revision = "32b0802ebe63"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("evidence", sa.Column("excerpt_prompt", sa.Text(), nullable=False, server_default=""))
+
+    # Backfill: same shape as Evidence._sync_excerpt_prompt (trimmed, capped at 600 chars)
+    op.execute(
+        r"""
+        UPDATE evidence
+        SET excerpt_prompt = left(regexp_replace(excerpt, '^\s+|\s+$', '', 'g'), 600)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("evidence", "excerpt_prompt")
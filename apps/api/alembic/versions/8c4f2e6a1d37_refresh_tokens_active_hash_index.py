@@ -0,0 +1,33 @@
+"""partial index on active refresh tokens
+
+Revision ID: 8c4f2e6a1d37
+Revises: 5e1a7c3d9b20
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8c4f2e6a1d37"
+down_revision = "5e1a7c3d9b20"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Only unrevoked tokens are indexed, so the index tracks live sessions rather than
+    # token history. Expiry can't be part of the predicate (now() is not immutable);
+    # it is filtered at query time.
+    op.create_index(
+        "ix_refresh_tokens_active_token_hash",
+        "refresh_tokens",
+        ["token_hash"],
+        postgresql_where=sa.text("revoked_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_refresh_tokens_active_token_hash", table_name="refresh_tokens")
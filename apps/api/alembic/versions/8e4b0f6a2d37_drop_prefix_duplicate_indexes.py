@@ -0,0 +1,42 @@
+"""drop single-column indexes prefix-covered by unique constraints/indexes
+
+Revision ID: 8e4b0f6a2d37
+Revises: 7d3a9e5f1c26
+Create Date: 2026-10-17 03:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8e4b0f6a2d37"
+down_revision = "7d3a9e5f1c26"
+branch_labels = None
+depends_on = None
+
+
+# (index, table, columns, covered by)
+_INDEXES = [
+    ("ix_workspace_members_workspace_id", "workspace_members", ["workspace_id"], "ux_workspace_members_workspace_user"),
+    ("ix_connectors_workspace_id", "connectors", ["workspace_id"], "uq_connectors_ws_type_name"),
+    ("ix_connectors_workspace_type", "connectors", ["workspace_id", "type"], "uq_connectors_ws_type_name"),
+    ("ix_agent_bases_workspace_id", "agent_bases", ["workspace_id"], "uq_agent_bases_workspace_key"),
+    ("ix_agent_versions_agent_base_id", "agent_versions", ["agent_base_id"], "uq_agent_versions_base_version"),
+    ("ix_action_item_decisions_action_id", "action_item_decisions", ["action_id"], "uq_action_reviewer_once"),
+    ("ix_documents_workspace_id", "documents", ["workspace_id"], "uq_documents_workspace_source_external_id"),
+]
+
+
+def upgrade() -> None:
+    # Each of these is a leading-column prefix of the unique index named alongside it,
+    # so it only costs an extra B-tree write per insert.
+    with op.get_context().autocommit_block():
+        for name, table, _cols, _covered_by in _INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, cols, _covered_by in reversed(_INDEXES):
+            op.create_index(name, table, cols, postgresql_concurrently=True, if_not_exists=True)
@@ -0,0 +1,52 @@
+"""composite (artifact_id, requested_at) index on artifact_reviews
+
+Revision ID: 9f5c1b7e3a48
+Revises: 8e4b0f6a2d37
+Create Date: 2026-10-17 04:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9f5c1b7e3a48"
+down_revision = "8e4b0f6a2d37"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Every review read is "reviews of artifact X, newest request first" (latest
+    # state, open request, review history); serve it without a sort.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_artifact_reviews_artifact_requested",
+            "artifact_reviews",
+            ["artifact_id", "requested_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_artifact_reviews_artifact_id",
+            table_name="artifact_reviews",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_artifact_reviews_artifact_id",
+            "artifact_reviews",
+            ["artifact_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_artifact_reviews_artifact_requested",
+            table_name="artifact_reviews",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,76 @@
+"""unique (run_id, logical_key, version) on artifacts
+
+Revision ID: a0b6d2c8e419
+Revises: 9f5c1b7e3a48
+Create Date: 2026-10-17 05:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a0b6d2c8e419"
+down_revision = "9f5c1b7e3a48"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Racing version writes may have stored the same version twice. Keep the oldest
+    # row's number and move later duplicates past the current max for their key,
+    # preserving creation order, instead of deleting content.
+    op.execute(
+        """
+        WITH ranked AS (
+            SELECT id, run_id, logical_key, created_at,
+                   row_number() OVER (
+                       PARTITION BY run_id, logical_key, version
+                       ORDER BY created_at, id
+                   ) AS rn,
+                   max(version) OVER (PARTITION BY run_id, logical_key) AS max_version
+            FROM artifacts
+        ),
+        moved AS (
+            SELECT id,
+                   max_version + row_number() OVER (
+                       PARTITION BY run_id, logical_key
+                       ORDER BY created_at, id
+                   ) AS new_version
+            FROM ranked
+            WHERE rn > 1
+        )
+        UPDATE artifacts a
+        SET version = moved.new_version
+        FROM moved
+        WHERE a.id = moved.id
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_artifacts_run_logical_version",
+            "artifacts",
+            ["run_id", "logical_key", "version"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Same columns; the unique index serves every lookup the plain one did.
+        op.drop_index(
+            "ix_artifacts_run_logical_version", table_name="artifacts", postgresql_concurrently=True, if_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_artifacts_run_logical_version",
+            "artifacts",
+            ["run_id", "logical_key", "version"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "uq_artifacts_run_logical_version", table_name="artifacts", postgresql_concurrently=True, if_exists=True
+        )
@@ -0,0 +1,52 @@
+"""embeddings.embedding_vec_h halfvec(1536) + HNSW cosine index
+
+Revision ID: a3d6f0b8e415
+Revises: 8c4f2e6a1d37
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a3d6f0b8e415"
+down_revision = "8c4f2e6a1d37"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Requires pgvector >= 0.7 (halfvec). Generated from embedding_vec, so the write
+    # path is unchanged and existing rows are filled by the table rewrite.
+    op.execute(
+        """
+        ALTER TABLE embeddings
+        ADD COLUMN IF NOT EXISTS embedding_vec_h halfvec(1536)
+        GENERATED ALWAYS AS (embedding_vec::halfvec(1536)) STORED;
+        """
+    )
+    # The HNSW build is the slow part; build it outside the migration transaction so
+    # embeddings stays writable meanwhile.
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_embeddings_embedding_vec_h
+            ON embeddings USING hnsw (embedding_vec_h halfvec_cosine_ops);
+            """
+        )
+        # Vector search now orders by embedding_vec_h; the fp32 ivfflat index is unused.
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_embeddings_embedding_vec;")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_embeddings_embedding_vec
+            ON embeddings USING ivfflat (embedding_vec vector_cosine_ops)
+            WITH (lists = 100);
+            """
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_embeddings_embedding_vec_h;")
+    op.execute("ALTER TABLE embeddings DROP COLUMN IF EXISTS embedding_vec_h;")
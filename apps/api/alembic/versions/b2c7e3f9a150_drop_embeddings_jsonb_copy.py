@@ -0,0 +1,38 @@
+"""drop the unused JSONB copy embeddings.embedding
+
+Revision ID: b2c7e3f9a150
+Revises: a0b6d2c8e419
+Create Date: 2026-10-17 06:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b2c7e3f9a150"
+down_revision = "a0b6d2c8e419"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Search reads embedding_vec_h (HNSW) and the write path fills embedding_vec; the
+    # JSONB array (~30 KB of text per 1536-d row) was a write-only duplicate.
+    # Rows written before embedding_vec existed only have the JSONB copy: carry those
+    # over first (this is what the old runtime backfill in embed_document did).
+    op.execute(
+        """
+        UPDATE embeddings
+        SET embedding_vec = (embedding::text)::vector
+        WHERE embedding_vec IS NULL AND embedding IS NOT NULL
+        """
+    )
+    # DROP COLUMN is catalog-only; space is reclaimed as rows are rewritten/vacuumed.
+    op.execute("ALTER TABLE embeddings DROP COLUMN IF EXISTS embedding")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE embeddings ADD COLUMN IF NOT EXISTS embedding jsonb")
+    # pgvector's text form '[x,y,...]' is a valid JSON array.
+    op.execute("UPDATE embeddings SET embedding = embedding_vec::text::jsonb WHERE embedding_vec IS NOT NULL")
@@ -0,0 +1,36 @@
+"""expression index on documents (workspace_id, effective timestamp) for retrieval timeframes
+
+Revision ID: c3d8f4a0b261
+Revises: b2c7e3f9a150
+Create Date: 2026-10-17 07:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c3d8f4a0b261"
+down_revision = "b2c7e3f9a150"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Must match retrieval_search._TS_EXPR (minus the table alias) for the planner
+    # to use it. The single-column source_created_at/source_updated_at indexes can't
+    # serve the COALESCE, so timeframe-bounded retrieval had no index on time.
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_documents_ws_effective_ts
+            ON documents (workspace_id, (COALESCE(source_updated_at, source_created_at, updated_at, created_at)))
+            """
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_documents_ws_effective_ts", table_name="documents", postgresql_concurrently=True, if_exists=True
+        )
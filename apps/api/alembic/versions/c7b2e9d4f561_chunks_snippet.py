@@ -0,0 +1,32 @@
+"""chunks.snippet: stored 240-char prefix of chunks.text for retrieval results
+
+Revision ID: c7b2e9d4f561
+Revises: a3d6f0b8e415
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c7b2e9d4f561"
+down_revision = "a3d6f0b8e415"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Generated (like tsv_tsvector): always in sync with text, filled for existing rows
+    # by the rewrite, and small enough to stay inline so search never detoasts text.
+    op.execute(
+        """
+        ALTER TABLE chunks
+        ADD COLUMN IF NOT EXISTS snippet varchar(240)
+        GENERATED ALWAYS AS (left(text, 240)) STORED;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE chunks DROP COLUMN IF EXISTS snippet;")
@@ -0,0 +1,41 @@
+"""composite (run_id, ...) indexes on run_logs, evidence, artifacts
+
+Revision ID: d4e8a1c6b903
+Revises: c7b2e9d4f561
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d4e8a1c6b903"
+down_revision = "c7b2e9d4f561"
+branch_labels = None
+depends_on = None
+
+
+# (name, table, columns, single-column run_id index it replaces)
+_INDEXES = [
+    ("ix_run_logs_run_created", "run_logs", ["run_id", "created_at"], "ix_run_logs_run_id"),
+    ("ix_evidence_run_created", "evidence", ["run_id", "created_at"], "ix_evidence_run_id"),
+    ("ix_artifacts_run_logical_version", "artifacts", ["run_id", "logical_key", "version"], "ix_artifacts_run_id"),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY: no write lock on these hot tables while building; it cannot run
+    # inside a transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        for name, table, cols, old in _INDEXES:
+            op.create_index(name, table, cols, postgresql_concurrently=True, if_not_exists=True)
+            # The composite's leading run_id column covers plain run_id lookups.
+            op.drop_index(old, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, cols, old in _INDEXES:
+            op.create_index(old, table, ["run_id"], postgresql_concurrently=True, if_not_exists=True)
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
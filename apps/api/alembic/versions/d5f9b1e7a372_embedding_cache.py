@@ -0,0 +1,47 @@
+"""embedding_cache keyed by (model, sha256(text)) so re-ingested chunks reuse vectors
+
+Revision ID: d5f9b1e7a372
+Revises: c3d8f4a0b261
+Create Date: 2026-10-17 08:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d5f9b1e7a372"
+down_revision = "c3d8f4a0b261"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Raw SQL because of the pgvector column (same as embeddings.embedding_vec).
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS embedding_cache (
+            model varchar(80) NOT NULL,
+            content_sha256 bytea NOT NULL,
+            embedding_vec vector(1536) NOT NULL,
+            created_at timestamptz NOT NULL DEFAULT now(),
+            PRIMARY KEY (model, content_sha256)
+        )
+        """
+    )
+    # Seed from vectors that already exist so the first re-ingest after deploy hits.
+    op.execute(
+        """
+        INSERT INTO embedding_cache (model, content_sha256, embedding_vec)
+        SELECT DISTINCT ON (e.model, sha256(convert_to(c.text, 'UTF8')))
+               e.model, sha256(convert_to(c.text, 'UTF8')), e.embedding_vec
+        FROM embeddings e
+        JOIN chunks c ON c.id = e.chunk_id
+        WHERE e.embedding_vec IS NOT NULL
+        ON CONFLICT DO NOTHING
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS embedding_cache")
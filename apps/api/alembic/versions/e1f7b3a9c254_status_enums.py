@@ -0,0 +1,63 @@
+"""native ENUM types for closed status/role/state/level vocabularies
+
+Revision ID: e1f7b3a9c254
+Revises: d4e8a1c6b903
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e1f7b3a9c254"
+down_revision = "d4e8a1c6b903"
+branch_labels = None
+depends_on = None
+
+
+# (table, column, enum type, values, fallback for out-of-vocabulary rows, server default,
+#  previous varchar length)
+_COLUMNS = [
+    ("workspace_members", "role", "workspace_role", ("admin", "member", "viewer"), "viewer", None, 16),
+    ("agent_versions", "status", "agent_version_status", ("draft", "published", "archived"), "draft", "draft", 16),
+    ("artifacts", "status", "artifact_status", ("draft", "in_review", "final"), "draft", None, 32),
+    ("artifact_reviews", "state", "review_state", ("requested", "approved", "rejected"), "requested", "requested", 16),
+    ("run_logs", "level", "log_level", ("debug", "info", "warn", "error"), "info", "info", 16),
+    ("connectors", "status", "connector_status", ("connected", "disconnected"), "disconnected", "disconnected", 32),
+    (
+        "ingestion_jobs",
+        "status",
+        "ingestion_job_status",
+        ("queued", "running", "success", "failed"),
+        "failed",
+        "queued",
+        32,
+    ),
+]
+
+
+def _quoted(values) -> str:
+    return ", ".join(f"'{v}'" for v in values)
+
+
+def upgrade() -> None:
+    for table, col, enum, values, fallback, default, _length in _COLUMNS:
+        op.execute(f"CREATE TYPE {enum} AS ENUM ({_quoted(values)})")
+        # The API validated these vocabularies, but map any stray legacy value rather
+        # than failing the cast (roles fall back to least privilege).
+        op.execute(f"UPDATE {table} SET {col} = '{fallback}' WHERE {col} NOT IN ({_quoted(values)})")
+        # A varchar default can't be cast automatically; drop it around the type change.
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {col} DROP DEFAULT")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {col} TYPE {enum} USING {col}::text::{enum}")
+        if default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {col} SET DEFAULT '{default}'::{enum}")
+
+
+def downgrade() -> None:
+    for table, col, enum, _values, _fallback, default, length in reversed(_COLUMNS):
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {col} DROP DEFAULT")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {col} TYPE varchar({length}) USING {col}::text")
+        if default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {col} SET DEFAULT '{default}'")
+        op.execute(f"DROP TYPE {enum}")
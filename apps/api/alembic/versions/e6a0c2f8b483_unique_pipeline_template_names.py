@@ -0,0 +1,67 @@
+"""unique pipeline_templates (workspace_id, name) for ON CONFLICT template seeding
+
+Revision ID: e6a0c2f8b483
+Revises: d5f9b1e7a372
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e6a0c2f8b483"
+down_revision = "d5f9b1e7a372"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Earlier re-seeds/creates could leave same-named templates in a workspace. Keep the
+    # oldest name as-is and suffix the others with their id prefix (unique, still readable).
+    op.execute(
+        """
+        UPDATE pipeline_templates t
+        SET name = left(t.name, 189) || ' [' || left(t.id::text, 8) || ']'
+        FROM (
+            SELECT id,
+                   row_number() OVER (PARTITION BY workspace_id, name ORDER BY created_at, id) AS rn
+            FROM pipeline_templates
+        ) dup
+        WHERE t.id = dup.id AND dup.rn > 1
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_pipeline_templates_workspace_name",
+            "pipeline_templates",
+            ["workspace_id", "name"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Leading-column prefix of the unique index above.
+        op.drop_index(
+            "ix_pipeline_templates_workspace_id",
+            table_name="pipeline_templates",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_pipeline_templates_workspace_id",
+            "pipeline_templates",
+            ["workspace_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "uq_pipeline_templates_workspace_name",
+            table_name="pipeline_templates",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,33 @@
+"""retrieval_request_items scores as real (float4)
+
+Revision ID: f3a5c8e2d016
+Revises: e1f7b3a9c254
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f3a5c8e2d016"
+down_revision = "e1f7b3a9c254"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = ("score_fts", "score_vec", "score_hybrid")
+
+
+def upgrade() -> None:
+    # One ALTER TABLE so the table is rewritten once, not per column.
+    op.execute(
+        "ALTER TABLE retrieval_request_items "
+        + ", ".join(f"ALTER COLUMN {c} TYPE real USING {c}::real" for c in _COLUMNS)
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE retrieval_request_items "
+        + ", ".join(f"ALTER COLUMN {c} TYPE double precision USING {c}::double precision" for c in _COLUMNS)
+    )
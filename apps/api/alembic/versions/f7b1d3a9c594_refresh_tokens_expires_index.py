@@ -0,0 +1,54 @@
+"""refresh_tokens: expiry index over all rows for the expired-token purge
+
+Revision ID: f7b1d3a9c594
+Revises: e6a0c2f8b483
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f7b1d3a9c594"
+down_revision = "e6a0c2f8b483"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The purge now removes every expired token, revoked or not (each rotation leaves a
+    # revoked row behind), so the expiry index can no longer be partial.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_refresh_tokens_expires_at",
+            "refresh_tokens",
+            ["expires_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_refresh_tokens_expired",
+            table_name="refresh_tokens",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_refresh_tokens_expired",
+            "refresh_tokens",
+            ["expires_at"],
+            postgresql_where=sa.text("revoked_at IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_refresh_tokens_expires_at",
+            table_name="refresh_tokens",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
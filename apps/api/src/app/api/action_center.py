@@ -176,6 +176,28 @@ def _my_decision(db: Session, action_id: uuid.UUID, user_id: uuid.UUID) -> Optio
     return str(row) if row else None
 
 
+def _decision_summary_map(
+    db: Session, action_ids: List[uuid.UUID], user_id: uuid.UUID
+) -> Dict[uuid.UUID, Tuple[int, int, Optional[str]]]:
+    """
+    (approved_count, rejected_count, my_decision) for many action items in ONE grouped query.
+    Items without decisions are absent from the map.
+    """
+    if not action_ids:
+        return {}
+    rows = db.execute(
+        select(
+            ActionItemDecision.action_id,
+            func.count(ActionItemDecision.id).filter(ActionItemDecision.decision == "approved"),
+            func.count(ActionItemDecision.id).filter(ActionItemDecision.decision == "rejected"),
+            func.max(ActionItemDecision.decision).filter(ActionItemDecision.reviewer_user_id == user_id),
+        )
+        .where(ActionItemDecision.action_id.in_(action_ids))
+        .group_by(ActionItemDecision.action_id)
+    ).all()
+    return {aid: (int(ap or 0), int(rj or 0), str(mine) if mine else None) for aid, ap, rj, mine in rows}
+
+
 def _recompute_status(a: ActionItem, approved: int, rejected: int) -> str:
     if a.status == "cancelled":
         return "cancelled"
@@ -186,9 +208,18 @@ def _recompute_status(a: ActionItem, approved: int, rejected: int) -> str:
     return "queued"
 
 
-def _to_out(a: ActionItem, *, db: Session, user: User) -> ActionItemOut:
-    approved, rejected = _decision_counts(db, a.id)
-    mine = _my_decision(db, a.id, user.id)
+def _to_out(
+    a: ActionItem,
+    *,
+    db: Session,
+    user: User,
+    summary: Optional[Tuple[int, int, Optional[str]]] = None,
+) -> ActionItemOut:
+    if summary is None:
+        approved, rejected = _decision_counts(db, a.id)
+        mine = _my_decision(db, a.id, user.id)
+    else:
+        approved, rejected, mine = summary
 
     return ActionItemOut(
         id=str(a.id),
@@ -271,7 +302,8 @@ def list_actions(
 
     q = q.order_by(ActionItem.created_at.desc())
     items = db.execute(q).scalars().all()
-    return [_to_out(x, db=db, user=user) for x in items]
+    summaries = _decision_summary_map(db, [x.id for x in items], user.id)
+    return [_to_out(x, db=db, user=user, summary=summaries.get(x.id, (0, 0, None))) for x in items]
 
 
 @router.post("/workspaces/{workspace_id}/actions", response_model=ActionItemOut)
@@ -7,12 +7,14 @@ from typing import Optional, Any, Dict
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 from sqlalchemy import select, func
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
 
 import re
 from app.db.models import WorkspaceMember, ArtifactComment, ArtifactCommentMention
 from app.schemas.core import ArtifactAssignIn, ArtifactCommentCreateIn, ArtifactCommentOut, ArtifactCommentMentionOut
 from app.api.deps import require_user, require_workspace_access, require_workspace_role_min
+from app.db.base import default_loader_opts
 from app.db.session import get_db
 from app.db.models import (
     Run,
@@ -78,6 +80,51 @@ def _ensure_artifact_admin_access(db: Session, art: Artifact, user: User) -> Run
     return run
 
 
+def _next_version_expr(run_id: uuid.UUID, logical_key: str):
+    """
+    Next version as a scalar subquery evaluated inside the INSERT (no separate
+    SELECT max round trip). uq_artifacts_run_logical_version rejects a racing
+    duplicate instead of silently storing two rows with the same version.
+    """
+    return (
+        select(func.coalesce(func.max(Artifact.version), 0) + 1)
+        .where(Artifact.run_id == run_id, Artifact.logical_key == logical_key)
+        .scalar_subquery()
+    )
+
+
+def _is_version_conflict(e: IntegrityError) -> bool:
+    diag = getattr(getattr(e, "orig", None), "diag", None)
+    return getattr(diag, "constraint_name", None) == "uq_artifacts_run_logical_version"
+
+
+def add_next_artifact_version(db: Session, **fields: Any) -> Artifact:
+    """
+    Flush a new Artifact whose version is max(version)+1 for its (run_id, logical_key),
+    computed inside the INSERT (_next_version_expr). Used by every "new version" path.
+
+    Two concurrent inserts for the same key compute the same number; the loser trips
+    uq_artifacts_run_logical_version once the winner commits. The savepoint keeps the
+    caller's transaction usable, the retry then sees the committed row, and a second
+    collision is reported as 409 instead of a 500. The caller commits.
+    """
+    for attempt in range(2):
+        art = Artifact(**fields, version=_next_version_expr(fields["run_id"], fields["logical_key"]))
+        try:
+            with db.begin_nested():
+                db.add(art)
+        except IntegrityError as e:
+            if not _is_version_conflict(e):
+                raise
+            if attempt:
+                raise HTTPException(
+                    status_code=409, detail="Another version of this artifact was created concurrently; retry"
+                ) from e
+            continue
+        return art
+    raise AssertionError("unreachable")
+
+
 def _to_out(a: Artifact) -> ArtifactOut:
     return ArtifactOut(
         id=str(a.id),
@@ -238,24 +285,15 @@ def create_artifact(
     # member+ only
     _ensure_run_write_access(db, run, user)
 
-    max_ver = db.execute(
-        select(func.max(Artifact.version)).where(
-            Artifact.run_id == run.id,
-            Artifact.logical_key == payload.logical_key,
-        )
-    ).scalar_one_or_none()
-    next_ver = int(max_ver or 0) + 1
-
-    art = Artifact(
+    art = add_next_artifact_version(
+        db,
         run_id=run.id,
         type=payload.type,
         title=payload.title,
         content_md=payload.content_md or "",
         logical_key=payload.logical_key,
-        version=next_ver,
         status="draft",
     )
-    db.add(art)
     db.commit()
     db.refresh(art)
 
@@ -274,7 +312,12 @@ def list_artifacts(run_id: str, db: Session = Depends(get_db), user: User = Depe
     _ensure_run_read_access(db, run, user)
 
     arts = (
-        db.execute(select(Artifact).where(Artifact.run_id == run.id).order_by(Artifact.created_at.desc()))
+        db.execute(
+            select(Artifact)
+            .where(Artifact.run_id == run.id)
+            .order_by(Artifact.created_at.desc())
+            .options(*default_loader_opts())
+        )
         .scalars()
         .all()
     )
@@ -389,21 +432,15 @@ def new_artifact_version(
     if payload.status not in ALLOWED_STATUSES:
         raise HTTPException(status_code=400, detail="Invalid status")
 
-    max_ver = db.execute(
-        select(func.max(Artifact.version)).where(Artifact.run_id == art.run_id, Artifact.logical_key == art.logical_key)
-    ).scalar_one_or_none()
-    next_ver = int(max_ver or 0) + 1
-
-    new_art = Artifact(
+    new_art = add_next_artifact_version(
+        db,
         run_id=art.run_id,
         type=art.type,
         title=(payload.title if payload.title is not None else art.title),
         content_md=payload.content_md,
         logical_key=art.logical_key,
-        version=next_ver,
         status=payload.status,
     )
-    db.add(new_art)
     db.commit()
     db.refresh(new_art)
 
@@ -687,11 +724,14 @@ def list_artifact_comments(
     if not ws:
         raise HTTPException(status_code=404, detail="Workspace not found")
 
+    # Authors and mentions are batch-loaded (one IN query each) instead of two
+    # queries per comment.
     rows = (
         db.execute(
             select(ArtifactComment)
             .where(ArtifactComment.artifact_id == art.id)
             .order_by(ArtifactComment.created_at.desc())
+            .options(selectinload(ArtifactComment.author), selectinload(ArtifactComment.mentions))
         )
         .scalars()
         .all()
@@ -699,20 +739,13 @@ def list_artifact_comments(
 
     out: list[ArtifactCommentOut] = []
     for c in rows:
-        author = db.get(User, c.author_user_id)
-        mention_rows = (
-            db.execute(
-                select(ArtifactCommentMention).where(ArtifactCommentMention.comment_id == c.id)
-            )
-            .scalars()
-            .all()
-        )
+        author = c.author
         mentions = [
             ArtifactCommentMentionOut(
                 mentioned_user_id=str(m.mentioned_user_id),
                 mentioned_email=m.mentioned_email,
             )
-            for m in mention_rows
+            for m in c.mentions
         ]
         out.append(
             ArtifactCommentOut(
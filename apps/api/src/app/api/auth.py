@@ -13,6 +13,7 @@ from app.core.security import (
     ACCESS_COOKIE_PATH,
     ACCESS_COOKIE_HTTPONLY,
     get_current_user_from_cookie,
+    invalidate_user_cache,
 )
 from app.core.refresh_tokens import (
     REFRESH_COOKIE_NAME,
@@ -24,7 +25,7 @@ from app.core.refresh_tokens import (
     revoke_refresh_token,
 )
 from app.core.config import settings
-from app.core.security_passwords import hash_password, verify_password  # NEW file below
+from app.core.security_passwords import hash_password, verify_password, password_needs_rehash
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -88,7 +89,14 @@ def login(payload: LoginIn, response: Response, db: Session = Depends(get_db)):
     access_token = create_access_token(user_id=user.id, email=user.email)
     refresh_token = generate_refresh_token()
 
+    # Upgrade legacy bcrypt / outdated argon2 hashes; committed with the refresh token.
+    if password_needs_rehash(user.password_hash):
+        user.password_hash = hash_password(payload.password)
+        db.add(user)
+
     store_refresh_token(db, user_id=user.id, token=refresh_token)
+    # the row may have just been rehashed; drop any cached current-user snapshot
+    invalidate_user_cache(user.id)
 
     _set_access_cookie(response, access_token)
     _set_refresh_cookie(response, refresh_token)
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import itertools
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Iterator, Optional, List
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select, text as sql_text
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer
 
 from app.api.deps import (
     require_user,
@@ -14,8 +15,8 @@ from app.api.deps import (
     require_workspace_role_min,
     get_workspace_role,
 )
-from app.core.github_client import GitHubClient, GitHubAPIError
-from app.core.ingest_common import get_or_create_source, upsert_document, rebuild_chunks, embed_document
+from app.core.github_client import GitHubAPIError, fetch_github_all
+from app.core.ingest_common import get_or_create_source, upsert_document, upsert_documents, rebuild_chunks, embed_document
 from app.core.google_client import GoogleClient, GoogleAPIError
 from app.core.config import settings
 from app.core.governance import (
@@ -571,31 +572,29 @@ def create_docs_ingestion_job(
     embed_after = _embed_after_effective(payload.embed_after)
 
     try:
-        for d in payload.docs or []:
-            stats["docs_seen"] += 1
-            ext_id = d.external_id if payload.upsert else None
-
-            meta = {
-                "kind": "doc",
-                "external_id": d.external_id,
-                "connector_id": str(c.id),
-                "ingestion_job_id": str(job.id),
-                "fetched_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-                **(d.meta or {}),
+        fetched_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        # Manual docs payload has no canonical upstream timestamps; leave as None.
+        doc_rows = [
+            {
+                "external_id": d.external_id if payload.upsert else None,
+                "title": d.title,
+                "raw_text": d.text,
+                "meta": {
+                    "kind": "doc",
+                    "external_id": d.external_id,
+                    "connector_id": str(c.id),
+                    "ingestion_job_id": str(job.id),
+                    "fetched_at": fetched_at,
+                    **(d.meta or {}),
+                },
             }
+            for d in payload.docs or []
+        ]
+        # One batched upsert for the whole payload instead of a round-trip + commit per doc.
+        upserted = upsert_documents(db, workspace_id=ws.id, source_id=src.id, docs=doc_rows)
 
-            # Manual docs payload has no canonical upstream timestamps; leave as None.
-            doc, created = upsert_document(
-                db,
-                workspace_id=ws.id,
-                source_id=src.id,
-                external_id=ext_id,
-                title=d.title,
-                raw_text=d.text,
-                meta=meta,
-                source_created_at=None,
-                source_updated_at=None,
-            )
+        for doc, created in upserted:
+            stats["docs_seen"] += 1
             stats["docs_created" if created else "docs_updated"] += 1
             stats["chunks_created"] += rebuild_chunks(db, document_id=doc.id, raw_text=doc.raw_text)
 
@@ -729,18 +728,26 @@ def create_github_ingestion_job(
         "issues_updated": 0,
     }
 
-    client = GitHubClient()
-
     try:
+        # Releases / PRs / issues are independent listings: fetch them concurrently.
+        fetched = fetch_github_all(
+            owner,
+            repo,
+            include_releases=payload.include_releases,
+            include_prs=payload.include_prs,
+            include_issues=payload.include_issues,
+            releases_per_page=releases_per_page,
+            prs_state=prs_state,
+            prs_per_page=prs_per_page,
+            issues_state=issues_state,
+            issues_per_page=issues_per_page,
+            max_pages=max_pages,
+            max_items=max_items,
+        )
+
         # Releases
         if payload.include_releases:
-            releases, _dbg_rel = client.list_releases(
-                owner,
-                repo,
-                per_page=releases_per_page,
-                max_pages=max_pages,
-                max_items=max_items,
-            )
+            releases, _dbg_rel = fetched["releases"]
             for rel in releases:
                 stats["releases_seen"] += 1
 
@@ -791,14 +798,7 @@ def create_github_ingestion_job(
 
         # PRs
         if payload.include_prs:
-            prs, _dbg_prs = client.list_pull_requests(
-                owner,
-                repo,
-                state=prs_state,
-                per_page=prs_per_page,
-                max_pages=max_pages,
-                max_items=max_items,
-            )
+            prs, _dbg_prs = fetched["prs"]
             for pr in prs:
                 stats["prs_seen"] += 1
 
@@ -853,14 +853,7 @@ def create_github_ingestion_job(
 
         # Issues (filter PRs out)
         if payload.include_issues:
-            items, _dbg_issues = client.list_issues(
-                owner,
-                repo,
-                state=issues_state,
-                per_page=issues_per_page,
-                max_pages=max_pages,
-                max_items=max_items,
-            )
+            items, _dbg_issues = fetched["issues"]
             issues = [it for it in items if it.get("pull_request") is None]
 
             for issue in issues:
@@ -1043,6 +1036,8 @@ def create_google_docs_ingestion_job(
         "docx_empty_text": 0,
     }
 
+    client: Optional[GoogleClient] = None
+    files_iter: Optional[Iterator[Dict[str, Any]]] = None
     try:
         client = GoogleClient(
             client_id=client_id,
@@ -1050,48 +1045,64 @@ def create_google_docs_ingestion_job(
             refresh_token=refresh_token,
         )
 
-        fetched = 0
-        page_token: Optional[str] = None
-
-        while True:
-            files, dbg = client.list_docs_in_folder(
-                folder_id=str(folder_id),
-                page_size=int(payload.page_size),
-                page_token=page_token,
-                include_docx=True,
-            )
-            page_token = dbg.get("nextPageToken")
-
-            for f in files:
-                if fetched >= int(payload.max_docs):
-                    page_token = None
-                    break
+        # List with the largest page we could need (fewest round-trips); the
+        # request's page_size bounds how many files are exported per batch.
+        files_iter = client.iter_docs_in_folder(
+            folder_id=str(folder_id),
+            page_size=min(int(payload.max_docs), 1000),
+            include_docx=True,
+            limit=int(payload.max_docs),
+        )
+        batch_size = int(payload.page_size)
+        page_files: List[Dict[str, Any]] = []
 
-                fetched += 1
+        for f in itertools.chain(files_iter, [None]):
+            if f is not None:
                 stats["docs_seen"] += 1
 
                 file_id = f.get("id")
-                title = f.get("name") or "Untitled"
                 mime = f.get("mimeType") or ""
                 if not file_id:
                     continue
-
-                text = ""
                 if mime == GoogleClient.GOOGLE_DOC_MIME:
                     stats["google_docs_seen"] += 1
-                    text, _dbg2 = client.export_google_doc_text(file_id=str(file_id))
-                    ext_id = f"gdoc:{file_id}" if payload.upsert else None
-                    kind = "google_doc"
                 elif mime == GoogleClient.DOCX_MIME:
                     stats["docx_seen"] += 1
-                    blob, _dbg3 = client.download_file_bytes(file_id=str(file_id))
-                    text = client.extract_text_from_docx_bytes(blob)
+                else:
+                    continue
+                page_files.append(f)
+                if len(page_files) < batch_size:
+                    continue
+
+            # Export this batch concurrently (None marks the end of the listing).
+            texts: Dict[str, str] = {}
+            for fid, text, err in client.export_many([(str(f["id"]), f["mimeType"]) for f in page_files]):
+                if err is not None:
+                    stats["errors"] += 1
+                    stats["error_samples"].append(
+                        {"status": err.status_code, "message": str(err), "details": err.details, "file_id": fid}
+                    )
+                    continue
+                texts[fid] = text
+
+            # DB writes stay sequential on the request session, in listing order.
+            for f in page_files:
+                file_id = str(f["id"])
+                if file_id not in texts:
+                    continue
+
+                title = f.get("name") or "Untitled"
+                mime = f["mimeType"]
+                text = texts[file_id]
+
+                if mime == GoogleClient.GOOGLE_DOC_MIME:
+                    ext_id = f"gdoc:{file_id}" if payload.upsert else None
+                    kind = "google_doc"
+                else:
                     if not text.strip():
                         stats["docx_empty_text"] += 1
                     ext_id = f"docx:{file_id}" if payload.upsert else None
                     kind = "docx"
-                else:
-                    continue
 
                 # Canonical upstream timestamps
                 src_created = _parse_rfc3339(f.get("createdTime"))
@@ -1131,8 +1142,7 @@ def create_google_docs_ingestion_job(
                 if embed_after:
                     stats["embedded_chunks"] += embed_document(db, document_id=doc.id)
 
-            if not page_token:
-                break
+            page_files = []
 
         job.status = "success"
         c.last_sync_at = datetime.now(timezone.utc)
@@ -1149,6 +1159,10 @@ def create_google_docs_ingestion_job(
         job.status = "failed"
         c.last_error = str(e)
     finally:
+        if files_iter is not None:
+            files_iter.close()
+        if client is not None:
+            client.close()
         job.stats = stats
         job.finished_at = datetime.now(timezone.utc)
         db.add(job)
@@ -1197,7 +1211,14 @@ def embeddings_run_once(
     lim = int(limit_docs)
     max_chunks = int(max_total_chunks)
 
-    base_q = select(Document).where(Document.workspace_id == ws.id).order_by(Document.updated_at.desc())
+    # The loop reads id, title, source_id and updated_at but never raw_text (the bulk of
+    # each row), so keep it out of the scan.
+    base_q = (
+        select(Document)
+        .options(defer(Document.raw_text))
+        .where(Document.workspace_id == ws.id)
+        .order_by(Document.updated_at.desc())
+    )
 
     if source_type:
         st = source_type.strip().lower()
@@ -1213,27 +1234,32 @@ def embeddings_run_once(
     embedded_chunks_total = 0
     skipped_no_missing = 0
 
-    for d in docs:
-        considered += 1
-
-        missing_count = db.execute(
+    # Missing-embedding counts for all candidate docs in one grouped query.
+    missing_by_doc: dict[str, int] = {}
+    if docs:
+        missing_rows = db.execute(
             sql_text(
                 """
-                SELECT count(*)
+                SELECT c.document_id::text AS document_id, count(*) AS missing
                 FROM chunks c
-                WHERE c.document_id = :doc_id
+                WHERE c.document_id = ANY(:doc_ids)
                 AND NOT EXISTS (
                   SELECT 1
                   FROM embeddings e
                   WHERE e.chunk_id = c.id
                   AND e.model = :model
                 )
+                GROUP BY c.document_id
                 """
             ),
-            {"doc_id": str(d.id), "model": model},
-        ).scalar_one()
+            {"doc_ids": [d.id for d in docs], "model": model},
+        ).all()
+        missing_by_doc = {r.document_id: int(r.missing) for r in missing_rows}
+
+    for d in docs:
+        considered += 1
 
-        missing_count = int(missing_count or 0)
+        missing_count = missing_by_doc.get(str(d.id), 0)
 
         if missing_count <= 0:
             skipped_no_missing += 1
@@ -7,7 +7,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
 from app.api.deps import require_user
-from app.core.github_client import GitHubClient, GitHubAPIError
+from app.core.github_client import GitHubClient, GitHubAPIError, fetch_github_all
 from app.core.ingest_common import get_or_create_source, upsert_document, rebuild_chunks, embed_document
 from app.db.session import get_db
 from app.db.models import Workspace, User
@@ -108,11 +108,17 @@ def sync_github(
     prs_per_page = int(cfg.get("prs_per_page", 30))
     prs_state = cfg.get("prs_state", "all")
 
-    client = GitHubClient()
-
     try:
-        releases, rel_debug = client.list_releases(owner, repo, per_page=releases_per_page)
-        prs, pr_debug = client.list_pull_requests(owner, repo, state=prs_state, per_page=prs_per_page)
+        fetched = fetch_github_all(
+            owner,
+            repo,
+            include_issues=False,
+            releases_per_page=releases_per_page,
+            prs_state=prs_state,
+            prs_per_page=prs_per_page,
+        )
+        releases, rel_debug = fetched["releases"]
+        prs, pr_debug = fetched["prs"]
     except GitHubAPIError as e:
         raise HTTPException(status_code=e.status_code, detail={"message": str(e), **(e.details or {})})
 
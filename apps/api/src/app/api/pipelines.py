@@ -5,13 +5,17 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, load_only
 
+from app.api.artifacts import add_next_artifact_version
 from app.api.deps import require_user, require_workspace_access, require_workspace_role_min
 from app.core.generator import build_initial_artifact, build_run_summary, AGENT_TO_DEFAULT_ARTIFACT_TYPE
 from app.core.config import settings
 from app.core.evidence_format import format_evidence_for_prompt
+from app.core.pipeline_templates import CANONICAL_PIPELINES
 from app.core.citations import (
     build_citation_pack,
     output_has_any_citations,
@@ -50,69 +54,18 @@ router = APIRouter(tags=["pipelines"])
 VALID_STEP_STATUS = {"created", "running", "completed", "failed"}
 VALID_PIPELINE_STATUS = {"created", "running", "completed", "failed"}
 
-# -------------------------
-# Canonical templates (V1)
-# -------------------------
-CANONICAL_PIPELINES: List[Dict[str, Any]] = [
-    {
-        "key": "discovery_strategy_prd",
-        "name": "Discovery → Strategy → PRD",
-        "description": "End-to-end early phase flow: identify opportunities, pick direction, write PRD.",
-        "definition_json": {
-            "version": "v1",
-            "auto_regenerate_with_evidence": True,
-            "steps": [
-                {"name": "Discovery", "agent_id": "discovery"},
-                {"name": "Strategy & Roadmap", "agent_id": "strategy_roadmap"},
-                {"name": "PRD", "agent_id": "prd"},
-            ],
-        },
-    },
-    {
-        "key": "prd_ux_feasibility",
-        "name": "PRD → UX → Feasibility",
-        "description": "Turn PRD into UX flow spec, then validate feasibility and architecture.",
-        "definition_json": {
-            "version": "v1",
-            "auto_regenerate_with_evidence": True,
-            "steps": [
-                {"name": "PRD", "agent_id": "prd"},
-                {"name": "UX Flow", "agent_id": "ux_flow"},
-                {"name": "Feasibility & Architecture", "agent_id": "feasibility_architecture"},
-            ],
-        },
-    },
-    {
-        "key": "analytics_qa_launch",
-        "name": "Analytics → QA → Launch",
-        "description": "Operationalization flow: tracking + experiment plan → QA suite → launch plan/runbook.",
-        "definition_json": {
-            "version": "v1",
-            "auto_regenerate_with_evidence": True,
-            "steps": [
-                {"name": "Analytics & Experiment", "agent_id": "analytics_experiment"},
-                {"name": "QA & Test", "agent_id": "qa_test"},
-                {"name": "Launch", "agent_id": "launch"},
-            ],
-        },
-    },
-    {
-        "key": "launch_monitoring_stakeholder",
-        "name": "Launch → Monitoring → Stakeholders",
-        "description": "Post-release loop: launch → health monitoring → stakeholder update pack.",
-        "definition_json": {
-            "version": "v1",
-            "auto_regenerate_with_evidence": True,
-            "steps": [
-                {"name": "Launch", "agent_id": "launch"},
-                {"name": "Post-launch Monitoring", "agent_id": "post_launch_monitoring"},
-                {"name": "Stakeholder Alignment", "agent_id": "stakeholder_alignment"},
-            ],
-        },
-    },
+# (name, lowercase key, description, definition_json) per canonical template, derived
+# once; the seed endpoint matches existing templates on the key.
+_CANONICAL_TEMPLATES: List[Tuple[str, str, str, Dict[str, Any]]] = [
+    (
+        str(tpl["name"]).strip(),
+        str(tpl["name"]).strip().lower(),
+        str(tpl.get("description") or ""),
+        tpl.get("definition_json") or {},
+    )
+    for tpl in CANONICAL_PIPELINES
 ]
 
-
 # -------------------------
 # Helpers
 # -------------------------
@@ -160,8 +113,10 @@ def _latest_artifact_map(db: Session, steps: List[PipelineStep]) -> Dict[str, Di
     if not run_ids:
         return {}
 
+    # Metadata only: content_md is the bulk of each row and is not needed here.
     q = (
         select(Artifact)
+        .options(load_only(Artifact.id, Artifact.run_id, Artifact.version, Artifact.type, Artifact.title))
         .where(Artifact.run_id.in_(run_ids))
         .distinct(Artifact.run_id)
         .order_by(Artifact.run_id, Artifact.created_at.desc())
@@ -188,12 +143,14 @@ def _run_retrieval_meta_map(db: Session, steps: List[PipelineStep]) -> Dict[str,
     if not run_ids:
         return {}
 
-    rows = db.execute(select(Run).where(Run.id.in_(run_ids))).scalars().all()
+    # Extract the key server-side instead of shipping whole input_payload documents.
+    rows = db.execute(
+        select(Run.id, Run.input_payload["_retrieval"].label("retrieval")).where(Run.id.in_(run_ids))
+    ).all()
 
     out: Dict[str, Dict[str, Any]] = {}
     for r in rows:
-        ip = r.input_payload or {}
-        meta = ip.get("_retrieval")
+        meta = r.retrieval
         if isinstance(meta, dict):
             out[str(r.id)] = meta
         else:
@@ -279,7 +236,7 @@ def _run_to_out(db: Session, pr: PipelineRun, steps: List[PipelineStep]) -> Pipe
         status=pr.status,
         current_step_index=pr.current_step_index,
         input_payload=pr.input_payload or {},
-        steps=[_step_to_out(s, prev_map, latest_map, retrieval_map) for s in sorted(steps, key=lambda x: x.step_index)],
+        steps=[_step_to_out(s, prev_map, latest_map, retrieval_map) for s in steps],  # callers load steps ordered by step_index
     )
 
 
@@ -287,44 +244,86 @@ def _validate_pipeline_definition(db: Session, steps_def: Any) -> None:
     if not isinstance(steps_def, list) or len(steps_def) == 0:
         raise HTTPException(status_code=400, detail="Template has no steps")
 
+    agent_ids: List[str] = []
     for idx, sd in enumerate(steps_def):
         agent_id = (sd or {}).get("agent_id")
         if not agent_id:
             raise HTTPException(status_code=400, detail=f"Invalid step at index {idx}: missing agent_id")
+        agent_ids.append(agent_id)
 
-        agent = db.get(AgentDefinition, agent_id)
-        if not agent:
+    # One lookup for all steps instead of a db.get per step.
+    known = set(db.execute(select(AgentDefinition.id).where(AgentDefinition.id.in_(agent_ids))).scalars())
+    for agent_id in agent_ids:
+        if agent_id not in known:
             raise HTTPException(status_code=400, detail=f"Invalid agent_id in pipeline step: {agent_id}")
 
 
+def _is_template_name_conflict(e: IntegrityError) -> bool:
+    diag = getattr(getattr(e, "orig", None), "diag", None)
+    return getattr(diag, "constraint_name", None) == "uq_pipeline_templates_workspace_name"
+
+
 def _seed_canonical_templates_for_workspace(db: Session, ws: Workspace) -> Tuple[List[PipelineTemplate], List[PipelineTemplate]]:
-    existing = db.execute(select(PipelineTemplate).where(PipelineTemplate.workspace_id == ws.id)).scalars().all()
+    # Only id/name are needed for the existence check; skip definition_json/description.
+    existing = (
+        db.execute(
+            select(PipelineTemplate)
+            .options(load_only(PipelineTemplate.id, PipelineTemplate.name))
+            .where(PipelineTemplate.workspace_id == ws.id)
+        )
+        .scalars()
+        .all()
+    )
     by_name = {t.name.strip().lower(): t for t in existing}
 
     created: List[PipelineTemplate] = []
     existing_out: List[PipelineTemplate] = []
+    to_create: List[Dict[str, Any]] = []
 
-    for tpl in CANONICAL_PIPELINES:
-        name = str(tpl["name"]).strip()
-        key = name.lower()
+    for name, key, description, definition in _CANONICAL_TEMPLATES:
         if key in by_name:
             existing_out.append(by_name[key])
             continue
 
-        definition = tpl.get("definition_json") or {}
         steps_def = definition.get("steps") or []
         _validate_pipeline_definition(db, steps_def)
 
-        t = PipelineTemplate(
-            workspace_id=ws.id,
-            name=name,
-            description=str(tpl.get("description") or ""),
-            definition_json=definition,
+        to_create.append(
+            {
+                "workspace_id": ws.id,
+                "name": name,
+                "description": description,
+                "definition_json": definition,
+            }
+        )
+
+    if to_create:
+        # ORM bulk INSERT ... RETURNING (insertmanyvalues), committed once, instead of
+        # an add/commit/refresh round-trip per template. ON CONFLICT DO NOTHING on
+        # uq_pipeline_templates_workspace_name: a concurrent seed or create may have
+        # inserted a name since the lookup above; those rows are not returned.
+        stmt = (
+            pg_insert(PipelineTemplate)
+            .on_conflict_do_nothing(index_elements=[PipelineTemplate.workspace_id, PipelineTemplate.name])
+            .returning(PipelineTemplate)
         )
-        db.add(t)
+        created = list(db.execute(stmt, to_create).scalars().all())
+        # Detach before commit so callers read the loaded values without a refresh per row.
+        for t in created:
+            db.expunge(t)
+
+        raced = {r["name"] for r in to_create} - {t.name for t in created}
+        if raced:
+            existing_out.extend(
+                db.execute(
+                    select(PipelineTemplate)
+                    .options(load_only(PipelineTemplate.id, PipelineTemplate.name))
+                    .where(PipelineTemplate.workspace_id == ws.id, PipelineTemplate.name.in_(raced))
+                )
+                .scalars()
+                .all()
+            )
         db.commit()
-        db.refresh(t)
-        created.append(t)
 
     return created, existing_out
 
@@ -919,29 +918,17 @@ Evidence Pack (cite as [n]):
     except Exception:
         pass
 
-    max_ver = (
-        db.execute(
-            select(Artifact.version)
-            .where(Artifact.run_id == r.id, Artifact.logical_key == artifact_type)
-            .order_by(Artifact.version.desc())
-            .limit(1)
-        )
-        .scalar_one_or_none()
-    )
-    next_ver = int(max_ver or 0) + 1
-
-    new_art = Artifact(
+    new_art = add_next_artifact_version(
+        db,
         run_id=r.id,
         type=artifact_type,
         title=title,
         content_md=md,
         logical_key=artifact_type,
-        version=next_ver,
         status="draft",
     )
-    db.add(new_art)
 
-    r.output_summary = f"Auto-regenerated via pipeline using {len(ev_items)} evidence item(s). Latest version: v{next_ver}."
+    r.output_summary = f"Auto-regenerated via pipeline using {len(ev_items)} evidence item(s). Latest version: v{new_art.version}."
     try:
         rep2 = citation_enforcement_report(artifact_type=artifact_type, md=md, evidence_count=len(ev_items))
         if not rep2.get("ok"):
@@ -1106,7 +1093,14 @@ def create_pipeline_template(
         definition_json=payload.definition_json or {},
     )
     db.add(t)
-    db.commit()
+    # unique by (workspace_id, name): let the index decide, so concurrent creates get a 409 too
+    try:
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if not _is_template_name_conflict(e):
+            raise
+        raise HTTPException(status_code=409, detail="A pipeline template with this name already exists") from e
     db.refresh(t)
     return _template_to_out(t)
 
@@ -1157,43 +1151,35 @@ def start_pipeline_run(
         input_payload=payload.input_payload or {},
     )
     db.add(pr)
-    db.commit()
-    db.refresh(pr)
+    db.flush()  # assigns pr.id; run + steps commit together below
 
-    steps_rows: List[PipelineStep] = []
+    # Agent ids were checked by _validate_pipeline_definition above.
+    steps_rows: List[Dict[str, Any]] = []
     for idx, sd in enumerate(steps_def):
-        agent_id = (sd or {}).get("agent_id")
-        name = (sd or {}).get("name") or agent_id or f"Step {idx+1}"
-        if not agent_id:
-            raise HTTPException(status_code=400, detail=f"Invalid step at index {idx}: missing agent_id")
-
-        agent = db.get(AgentDefinition, agent_id)
-        if not agent:
-            raise HTTPException(status_code=400, detail=f"Invalid agent_id in pipeline step: {agent_id}")
-
-        step_payload = {"agent_step": idx, "agent_id": agent_id, "pipeline_step_name": name}
-
+        agent_id = sd["agent_id"]
+        name = sd.get("name") or agent_id or f"Step {idx+1}"
         steps_rows.append(
-            PipelineStep(
-                pipeline_run_id=pr.id,
-                step_index=idx,
-                step_name=name,
-                agent_id=agent_id,
-                status="created",
-                input_payload=step_payload,
-                run_id=None,
-            )
+            {
+                "pipeline_run_id": pr.id,
+                "step_index": idx,
+                "step_name": name,
+                "agent_id": agent_id,
+                "status": "created",
+                "input_payload": {"agent_step": idx, "agent_id": agent_id, "pipeline_step_name": name},
+                "run_id": None,
+            }
         )
 
-    db.add_all(steps_rows)
-    db.commit()
+    # ORM bulk INSERT (insertmanyvalues batches) instead of one unit-of-work row per step.
+    db.execute(insert(PipelineStep), steps_rows)
 
     pr.status = "running"
-    db.add(pr)
     db.commit()
     db.refresh(pr)
 
-    steps = db.execute(select(PipelineStep).where(PipelineStep.pipeline_run_id == pr.id)).scalars().all()
+    steps = db.execute(
+        select(PipelineStep).where(PipelineStep.pipeline_run_id == pr.id).order_by(PipelineStep.step_index.asc())
+    ).scalars().all()
     return _run_to_out(db, pr, steps)
 
 
@@ -1210,7 +1196,9 @@ def get_pipeline_run(
 
     require_workspace_access(str(pr.workspace_id), db, user)
 
-    steps = db.execute(select(PipelineStep).where(PipelineStep.pipeline_run_id == pr.id)).scalars().all()
+    steps = db.execute(
+        select(PipelineStep).where(PipelineStep.pipeline_run_id == pr.id).order_by(PipelineStep.step_index.asc())
+    ).scalars().all()
     return _run_to_out(db, pr, steps)
 
 
@@ -1228,7 +1216,9 @@ def run_next_step(
     ws, _role = require_workspace_role_min(str(pr.workspace_id), "member", db, user)
 
     if (pr.status or "").lower() == "failed":
-        steps = db.execute(select(PipelineStep).where(PipelineStep.pipeline_run_id == pr.id)).scalars().all()
+        steps = db.execute(
+            select(PipelineStep).where(PipelineStep.pipeline_run_id == pr.id).order_by(PipelineStep.step_index.asc())
+        ).scalars().all()
         return PipelineNextOut(ok=False, pipeline_run=_run_to_out(db, pr, steps), created_run_id=None)
 
     tpl = db.get(PipelineTemplate, pr.template_id)
@@ -1259,7 +1249,9 @@ def run_next_step(
         pr.current_step_index += 1
         db.add(pr)
         db.commit()
-        steps = db.execute(select(PipelineStep).where(PipelineStep.pipeline_run_id == pr.id)).scalars().all()
+        steps = db.execute(
+            select(PipelineStep).where(PipelineStep.pipeline_run_id == pr.id).order_by(PipelineStep.step_index.asc())
+        ).scalars().all()
         return PipelineNextOut(ok=True, pipeline_run=_run_to_out(db, pr, steps), created_run_id=None)
 
     if (pr.status or "").lower() == "created":
@@ -1271,7 +1263,9 @@ def run_next_step(
         created_run_id = _execute_one_step(db=db, ws=ws, user=user, pr=pr, steps=steps, step=step, auto_regen=auto_regen)
     except Exception as e:
         _mark_step_failed(db, pr, step, error=str(e))
-        steps = db.execute(select(PipelineStep).where(PipelineStep.pipeline_run_id == pr.id)).scalars().all()
+        steps = db.execute(
+            select(PipelineStep).where(PipelineStep.pipeline_run_id == pr.id).order_by(PipelineStep.step_index.asc())
+        ).scalars().all()
         return PipelineNextOut(ok=False, pipeline_run=_run_to_out(db, pr, steps), created_run_id=None)
 
     pr.current_step_index += 1
@@ -1281,7 +1275,9 @@ def run_next_step(
         db.commit()
         db.refresh(pr)
 
-    steps = db.execute(select(PipelineStep).where(PipelineStep.pipeline_run_id == pr.id)).scalars().all()
+    steps = db.execute(
+        select(PipelineStep).where(PipelineStep.pipeline_run_id == pr.id).order_by(PipelineStep.step_index.asc())
+    ).scalars().all()
     return PipelineNextOut(ok=True, pipeline_run=_run_to_out(db, pr, steps), created_run_id=created_run_id)
 
 
@@ -1299,7 +1295,9 @@ def execute_all_steps(
     ws, _role = require_workspace_role_min(str(pr.workspace_id), "member", db, user)
 
     if (pr.status or "").lower() == "failed":
-        steps = db.execute(select(PipelineStep).where(PipelineStep.pipeline_run_id == pr.id)).scalars().all()
+        steps = db.execute(
+            select(PipelineStep).where(PipelineStep.pipeline_run_id == pr.id).order_by(PipelineStep.step_index.asc())
+        ).scalars().all()
         return PipelineExecuteAllOut(ok=False, pipeline_run=_run_to_out(db, pr, steps), created_run_ids=[])
 
     tpl = db.get(PipelineTemplate, pr.template_id)
@@ -1366,7 +1364,9 @@ def execute_all_steps(
         db.commit()
         db.refresh(pr)
 
-    steps = db.execute(select(PipelineStep).where(PipelineStep.pipeline_run_id == pr.id)).scalars().all()
+    steps = db.execute(
+        select(PipelineStep).where(PipelineStep.pipeline_run_id == pr.id).order_by(PipelineStep.step_index.asc())
+    ).scalars().all()
     return PipelineExecuteAllOut(
         ok=ok,
         pipeline_run=_run_to_out(db, pr, steps),
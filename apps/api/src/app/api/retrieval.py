@@ -6,13 +6,12 @@ from typing import Any, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
-from sqlalchemy import select, text as sql_text
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session, defer
 
 from app.api.deps import require_user, require_workspace_access, require_workspace_role_min
-from app.core.chunker import chunk_text
 from app.core.config import settings
-from app.core.embeddings import embed_texts
+from app.core.ingest_common import embed_texts_cached, insert_chunks, insert_embeddings
 from app.core.retrieval_search import hybrid_retrieve
 from app.db.session import get_db
 from app.db.models import User, RetrievalRequest, RetrievalRequestItem, Workspace
@@ -254,30 +253,11 @@ def ingest_docs_text(
     db.commit()
     db.refresh(doc)
 
-    parts = chunk_text(
-        payload.text,
-        chunk_size=settings.CHUNK_SIZE_CHARS,
-        overlap=settings.CHUNK_OVERLAP_CHARS,
-    )
-
-    chunks: List[Chunk] = []
-    for i, (start, end, txt) in enumerate(parts):
-        chunks.append(
-            Chunk(
-                document_id=doc.id,
-                chunk_index=i,
-                text=txt,
-                meta={"start": start, "end": end},
-            )
-        )
-
-    if chunks:
-        db.add_all(chunks)
-        db.commit()
+    chunks_created = insert_chunks(db, document_id=doc.id, raw_text=payload.text)
 
     return IngestResult(
         document=_doc_out(doc),
-        chunks_created=len(chunks),
+        chunks_created=chunks_created,
     )
 
 
@@ -293,7 +273,8 @@ def list_documents(
     if source_type:
         _enforce_policy_sources(db, ws, user, [source_type.strip().lower()], "policy.allowlist.documents.list")
 
-    q = select(Document).where(Document.workspace_id == ws.id)
+    # DocumentOut has no body; don't read/detoast raw_text for every listed document.
+    q = select(Document).options(defer(Document.raw_text)).where(Document.workspace_id == ws.id)
 
     if source_type:
         q = q.join(Source, Source.id == Document.source_id).where(Source.type == source_type.strip().lower())
@@ -334,21 +315,6 @@ def embed_document_chunks(
 
     chunk_ids = [c.id for c in chunks]
 
-    db.execute(
-        sql_text(
-            """
-            UPDATE embeddings
-            SET embedding_vec = (embedding::text)::vector
-            WHERE model = :model
-            AND chunk_id = ANY(:chunk_ids)
-            AND embedding_vec IS NULL
-            AND embedding IS NOT NULL
-            """
-        ),
-        {"model": settings.EMBEDDINGS_MODEL, "chunk_ids": chunk_ids},
-    )
-    db.commit()
-
     if force:
         todo = chunks
     else:
@@ -358,9 +324,7 @@ def embed_document_chunks(
                     Embedding.model == settings.EMBEDDINGS_MODEL,
                     Embedding.chunk_id.in_(chunk_ids),
                 )
-            )
-            .scalars()
-            .all()
+            ).scalars()
         )
         todo = [c for c in chunks if c.id not in existing_chunk_ids]
 
@@ -370,22 +334,9 @@ def embed_document_chunks(
     if not settings.OPENAI_API_KEY:
         raise HTTPException(status_code=400, detail="OPENAI_API_KEY is missing for embeddings")
 
-    texts = [c.text for c in todo]
-    vectors = embed_texts(texts)
+    vectors = embed_texts_cached(db, [c.text for c in todo])
 
-    embedded_count = 0
-    for c, vec in zip(todo, vectors):
-        emb = Embedding(chunk_id=c.id, model=settings.EMBEDDINGS_MODEL, embedding=vec)
-        db.add(emb)
-        db.commit()
-        db.refresh(emb)
-
-        db.execute(
-            sql_text("UPDATE embeddings SET embedding_vec = CAST(:v AS vector) WHERE id = :id"),
-            {"v": vec, "id": str(emb.id)},
-        )
-        db.commit()
-        embedded_count += 1
+    embedded_count = insert_embeddings(db, chunk_ids=[c.id for c in todo], vectors=vectors)
 
     return EmbedResult(document_id=str(doc.id), model=settings.EMBEDDINGS_MODEL, chunks_embedded=embedded_count)
 
@@ -447,30 +398,33 @@ def retrieve(
         timeframe=tf,
     )
     db.add(rr)
-    db.commit()
-    db.refresh(rr)
-
-    for idx, it in enumerate(items, start=1):
-
-        def _u(v: Any) -> Optional[uuid.UUID]:
-            try:
-                return uuid.UUID(str(v)) if v else None
-            except Exception:
-                return None
-
-        ri = RetrievalRequestItem(
-            request_id=rr.id,
-            rank=int(idx),
-            chunk_id=_u(it.get("chunk_id")),
-            document_id=_u(it.get("document_id")),
-            source_id=_u(it.get("source_id")),
-            snippet=policy_apply_pii_masking(ws, str(it.get("snippet") or "")),
-            meta=it.get("meta") or {},
-            score_fts=float(it.get("score_fts") or 0.0),
-            score_vec=float(it.get("score_vec") or 0.0),
-            score_hybrid=float(it.get("score_hybrid") or 0.0),
-        )
-        db.add(ri)
+    db.flush()  # assigns rr.id; request + items commit together below
+
+    def _u(v: Any) -> Optional[uuid.UUID]:
+        try:
+            return uuid.UUID(str(v)) if v else None
+        except Exception:
+            return None
+
+    item_rows = [
+        {
+            "request_id": rr.id,
+            "rank": int(idx),
+            "chunk_id": _u(it.get("chunk_id")),
+            "document_id": _u(it.get("document_id")),
+            "source_id": _u(it.get("source_id")),
+            "snippet": policy_apply_pii_masking(ws, str(it.get("snippet") or "")),
+            "meta": it.get("meta") or {},
+            # hybrid_retrieve scores are already float8 from SQL (COALESCEd, never NULL)
+            "score_fts": it["score_fts"],
+            "score_vec": it["score_vec"],
+            "score_hybrid": it["score_hybrid"],
+        }
+        for idx, it in enumerate(items, start=1)
+    ]
+    if item_rows:
+        # ORM bulk INSERT: batched via insertmanyvalues instead of one unit-of-work row per item.
+        db.execute(insert(RetrievalRequestItem), item_rows)
 
     db.commit()
     return RetrieveResponse(
@@ -512,15 +466,15 @@ def list_retrieval_requests(
     for r in rows:
         out.append(
             RetrievalRequestOut(
-                id=str(r.id),
-                workspace_id=str(r.workspace_id),
-                created_by_user_id=str(r.created_by_user_id),
+                id=r.id,
+                workspace_id=r.workspace_id,
+                created_by_user_id=r.created_by_user_id,
                 q=r.q,
                 k=int(r.k),
                 alpha=float(r.alpha),
                 source_types=r.source_types,
                 timeframe=r.timeframe or {},
-                created_at=r.created_at.isoformat().replace("+00:00", "Z"),
+                created_at=r.created_at,
             )
         )
     return out
@@ -544,15 +498,15 @@ def get_retrieval_request(
     require_workspace_access(str(rr.workspace_id), db, user)
 
     return RetrievalRequestOut(
-        id=str(rr.id),
-        workspace_id=str(rr.workspace_id),
-        created_by_user_id=str(rr.created_by_user_id),
+        id=rr.id,
+        workspace_id=rr.workspace_id,
+        created_by_user_id=rr.created_by_user_id,
         q=rr.q,
         k=int(rr.k),
         alpha=float(rr.alpha),
         source_types=rr.source_types,
         timeframe=rr.timeframe or {},
-        created_at=rr.created_at.isoformat().replace("+00:00", "Z"),
+        created_at=rr.created_at,
     )
 
 
@@ -587,18 +541,18 @@ def list_retrieval_request_items(
     for it in rows:
         out.append(
             RetrievalRequestItemOut(
-                id=str(it.id),
-                request_id=str(it.request_id),
+                id=it.id,
+                request_id=it.request_id,
                 rank=int(it.rank),
-                chunk_id=str(it.chunk_id) if it.chunk_id else None,
-                document_id=str(it.document_id) if it.document_id else None,
-                source_id=str(it.source_id) if it.source_id else None,
+                chunk_id=it.chunk_id,
+                document_id=it.document_id,
+                source_id=it.source_id,
                 snippet=it.snippet or "",
                 meta=it.meta or {},
                 score_fts=float(it.score_fts or 0.0),
                 score_vec=float(it.score_vec or 0.0),
                 score_hybrid=float(it.score_hybrid or 0.0),
-                created_at=it.created_at.isoformat().replace("+00:00", "Z"),
+                created_at=it.created_at,
             )
         )
     return out
\ No newline at end of file
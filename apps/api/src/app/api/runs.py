@@ -8,6 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.api.artifacts import add_next_artifact_version
 from app.api.deps import require_user, require_workspace_access, require_workspace_role_min
 from app.core.generator import build_initial_artifact, build_run_summary, AGENT_TO_DEFAULT_ARTIFACT_TYPE
 from app.core.config import settings
@@ -24,6 +25,7 @@ from app.core.citations import (
 )
 from app.core.governance import policy_assert_allowed_sources, policy_apply_pii_masking
 from app.core.retrieval_search import hybrid_retrieve
+from app.db.base import default_loader_opts
 from app.db.session import get_db
 from app.db.models import (
     Workspace,
@@ -325,20 +327,6 @@ def _latest_artifact_for_run(db: Session, run_id: uuid.UUID) -> Optional[Artifac
     )
 
 
-def _next_version_for_logical_key(db: Session, run_id: uuid.UUID, logical_key: str) -> int:
-    max_ver = (
-        db.execute(
-            select(Artifact.version)
-            .where(Artifact.run_id == run_id, Artifact.logical_key == logical_key)
-            .order_by(Artifact.version.desc())
-            .limit(1)
-        )
-        .scalars()
-        .first()
-    )
-    return int(max_ver or 0) + 1
-
-
 # -------------------------
 # Routes
 # -------------------------
@@ -605,7 +593,6 @@ def regenerate_with_retrieval(
 
     logical_key = latest.logical_key or latest.type
     artifact_type = latest.type
-    next_ver = _next_version_for_logical_key(db, r.id, logical_key)
 
     rcfg = payload.retrieval
     if not rcfg.enabled or not (rcfg.query or "").strip():
@@ -707,15 +694,6 @@ def regenerate_with_retrieval(
     )
     db.commit()
 
-    _write_status_event(
-        db,
-        run=r,
-        from_status=r.status,
-        to_status=r.status,
-        message="Regenerate with retrieval",
-        meta={"artifact_type": artifact_type, "logical_key": logical_key, "new_version": next_ver, **retrieval_meta},
-    )
-
     if len(ev_items) == 0:
         _atype, _title, md = _no_evidence_md(r.agent_id, r.input_payload, retrieval_meta)
         title = latest.title or f"{artifact_type.replace('_', ' ').title()} — Draft"
@@ -751,20 +729,30 @@ def regenerate_with_retrieval(
     except Exception:
         pass
 
-    new_art = Artifact(
+    new_art = add_next_artifact_version(
+        db,
         run_id=r.id,
         type=artifact_type,
         title=title,
         content_md=md,
         logical_key=logical_key,
-        version=next_ver,
         status="draft",
     )
-    db.add(new_art)
     db.commit()
+    new_version = new_art.version
+
+    # Written after the INSERT so new_version is the version it actually assigned.
+    _write_status_event(
+        db,
+        run=r,
+        from_status=r.status,
+        to_status=r.status,
+        message="Regenerate with retrieval",
+        meta={"artifact_type": artifact_type, "logical_key": logical_key, "new_version": new_version, **retrieval_meta},
+    )
 
     r.output_summary = build_run_summary(agent_id=r.agent_id, artifact_type=artifact_type)
-    r.output_summary += f" Regenerated v{next_ver}."
+    r.output_summary += f" Regenerated v{new_version}."
     if ev_items:
         r.output_summary += f" Evidence attached: {len(ev_items)} snippet(s)."
 
@@ -802,7 +790,16 @@ def regenerate_with_retrieval(
 def list_runs(workspace_id: str, db: Session = Depends(get_db), user: User = Depends(require_user)):
     ws, _role = require_workspace_access(workspace_id, db, user)
 
-    runs = db.execute(select(Run).where(Run.workspace_id == ws.id).order_by(Run.created_at.desc())).scalars().all()
+    runs = (
+        db.execute(
+            select(Run)
+            .where(Run.workspace_id == ws.id)
+            .order_by(Run.created_at.desc())
+            .options(*default_loader_opts())
+        )
+        .scalars()
+        .all()
+    )
     return [
         RunOut(
             id=str(r.id),
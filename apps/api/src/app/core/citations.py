@@ -8,11 +8,11 @@ import hashlib
 # -------------------------
 # Existing helpers (kept)
 # -------------------------
-def _fingerprint(ev: Dict[str, Any]) -> str:
+def _fingerprint(ev: Dict[str, Any]) -> bytes:
+    # raw 8-byte digest: only used as a dedupe key, never rendered
     source_ref = str(ev.get("source_ref") or "").strip()
     excerpt = str(ev.get("excerpt") or "").strip()
-    h = hashlib.sha256((source_ref + "\n" + excerpt).encode("utf-8")).hexdigest()[:16]
-    return h
+    return hashlib.blake2b((source_ref + "\n" + excerpt).encode("utf-8"), digest_size=8).digest()
 
 
 def build_citation_pack(evidence: List[Dict[str, Any]]) -> Tuple[str, str, List[Dict[str, Any]]]:
@@ -23,7 +23,7 @@ def build_citation_pack(evidence: List[Dict[str, Any]]) -> Tuple[str, str, List[
     Dedupes evidence rows to avoid exploding citation lists when auto-evidence is run multiple times.
     """
     normalized: List[Dict[str, Any]] = []
-    seen: set[str] = set()
+    seen: set[bytes] = set()
 
     deduped: List[Dict[str, Any]] = []
     for ev in evidence:
@@ -97,25 +97,28 @@ def body_has_inline_citations(md: str) -> bool:
     return bool(re.search(r"\[[0-9]+\]", body or ""))
 
 
+_PATCH_HEADER = (
+    "## Evidence-backed notes\n"
+    "_Inline citations were missing in the draft body. This section was auto-added to anchor key statements to sources._\n"
+    "\n"
+)
+_PATCH_FOOTER = (
+    "\n"
+    "\n"
+    "## Inline citation checklist\n"
+    "- Add citations like `[1]` at the end of sentences that rely on evidence.\n"
+    "- If a claim cannot be grounded, move it to **Unknowns / Assumptions**."
+)
+
+
 def build_inline_citation_patch(citations: List[Dict[str, Any]]) -> str:
     if not citations:
         return ""
 
-    lines: List[str] = []
-    lines.append("## Evidence-backed notes")
-    lines.append("_Inline citations were missing in the draft body. This section was auto-added to anchor key statements to sources._")
-    lines.append("")
-
-    for c in citations[:10]:
-        t = c.get("title") or "Source"
-        n = c.get("n")
-        lines.append(f"- Relevant source available: **{t}**. [{n}]")
-
-    lines.append("")
-    lines.append("## Inline citation checklist")
-    lines.append("- Add citations like `[1]` at the end of sentences that rely on evidence.")
-    lines.append("- If a claim cannot be grounded, move it to **Unknowns / Assumptions**.")
-    return "\n".join(lines).strip()
+    bullets = "\n".join(
+        f"- Relevant source available: **{c.get('title') or 'Source'}**. [{c.get('n')}]" for c in citations[:10]
+    )
+    return _PATCH_HEADER + bullets + _PATCH_FOOTER
 
 
 # -------------------------
@@ -4,14 +4,6 @@ import re
 from io import BytesIO
 from typing import Optional, Tuple
 
-try:
-    from docx import Document as DocxDocument
-    from docx.shared import Pt
-except Exception:  # pragma: no cover
-    DocxDocument = None  # type: ignore
-    Pt = None  # type: ignore
-
-
 _HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)$")
 _BULLET_RE = re.compile(r"^(\-|\*)\s+(.*)$")
 _NUMBERED_RE = re.compile(r"^(\d+)\.\s+(.*)$")
@@ -46,7 +38,11 @@ def markdown_to_docx_bytes(title: str, markdown: str) -> bytes:
       - blank lines
       - inline links [text](url) (stored as text + url in parentheses; reliable & simple)
     """
-    if DocxDocument is None:
+    # Imported lazily: python-docx (lxml) is heavy and only needed on export.
+    try:
+        from docx import Document as DocxDocument
+        from docx.shared import Pt
+    except Exception:  # pragma: no cover
         raise RuntimeError("python-docx is not installed")
 
     doc = DocxDocument()
@@ -67,7 +63,7 @@ def markdown_to_docx_bytes(title: str, markdown: str) -> bytes:
         # monospace-ish
         try:
             run.font.name = "Courier New"
-            run.font.size = Pt(9)  # type: ignore[misc]
+            run.font.size = Pt(9)
         except Exception:
             pass
         code_buf = []
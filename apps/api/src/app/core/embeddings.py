@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 from openai import OpenAI
@@ -18,18 +19,34 @@ def _get_client() -> OpenAI:
     return _client
 
 
+def _embed_batch(texts: List[str]) -> List[List[float]]:
+    client = _get_client()
+    resp = client.embeddings.create(
+        model=settings.EMBEDDINGS_MODEL,
+        input=texts,
+    )
+    # Ensure ordering preserved
+    return [d.embedding for d in resp.data]
+
+
 def embed_texts(texts: List[str]) -> List[List[float]]:
     """
-    Returns list of embeddings (each is a list[float]).
+    Returns list of embeddings (each is a list[float]), in input order.
     Uses OpenAI embeddings API.
+
+    Inputs are sent in batches of EMBED_BATCH_SIZE; multiple batches run
+    concurrently (EMBED_MAX_WORKERS). 429 Retry-After is handled by the SDK's retries.
     """
     if not texts:
         return []
 
-    client = _get_client()
-    resp = client.embeddings.create(
-        model=settings.EMBEDDINGS_MODEL,
-        input=texts,
-    )
-    # Ensure ordering preserved
-    return [d.embedding for d in resp.data]
\ No newline at end of file
+    size = max(1, int(settings.EMBED_BATCH_SIZE))
+    batches = [texts[i : i + size] for i in range(0, len(texts), size)]
+    if len(batches) == 1:
+        return _embed_batch(batches[0])
+
+    workers = max(1, min(int(settings.EMBED_MAX_WORKERS), len(batches)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # map() yields results in submission order
+        results = pool.map(_embed_batch, batches)
+        return [vec for batch in results for vec in batch]
@@ -14,8 +14,7 @@ def format_evidence_for_prompt(items: List[Evidence], limit: int = 8) -> str:
     lines: list[str] = []
     for e in items[:limit]:
         ref = f" ({e.source_ref})" if e.source_ref else ""
-        excerpt = (e.excerpt or "").strip()
-        excerpt = excerpt[:600]  # keep prompt bounded
-        lines.append(f"- kind={e.kind}, source={e.source_name}{ref}: {excerpt}")
+        # excerpt_prompt is already trimmed + bounded at write time (see Evidence model)
+        lines.append(f"- kind={e.kind}, source={e.source_name}{ref}: {e.excerpt_prompt}")
 
     return "\n".join(lines)
\ No newline at end of file
@@ -24,6 +24,14 @@ AGENT_TO_DEFAULT_ARTIFACT_TYPE: dict[str, str] = {
     "trust_safety_policy": "safety_spec",
 }
 
+# Decide once at startup whether the LLM path is live; only then load the
+# prompt builders and the OpenAI client. Must stay below the mapping above:
+# app.core.prompts imports it from this module.
+_LLM_AVAILABLE = bool(settings.LLM_ENABLED and settings.OPENAI_API_KEY)
+if _LLM_AVAILABLE:
+    from app.core import llm_client as _llm_client
+    from app.core import prompts as _prompts
+
 
 def _safe_str(v: Any) -> str:
     if v is None:
@@ -31,34 +39,56 @@ def _safe_str(v: Any) -> str:
     return str(v).strip()
 
 
-def _deterministic_template(agent_id: str, input_payload: Dict[str, Any]) -> Tuple[str, str, str]:
-    artifact_type = AGENT_TO_DEFAULT_ARTIFACT_TYPE.get(agent_id, "strategy_memo")
+def _draft_title(artifact_type: str) -> str:
+    return f"{artifact_type.replace('_', ' ').title()} — Draft"
 
-    goal = _safe_str(input_payload.get("goal"))
-    context = _safe_str(input_payload.get("context"))
-    constraints = _safe_str(input_payload.get("constraints"))
 
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
-
-    title = f"{artifact_type.replace('_', ' ').title()} — Draft"
-    md = f"""# {title}
-
-**Agent:** `{agent_id}`  
+# Deterministic scaffold: everything except the per-run fields is fixed per
+# artifact type, so render it once at import and only .format() per call.
+_SCAFFOLD_BODY = """**Agent:** `{agent_id}`  
 **Generated:** {now}
 
 ## Goal
-{goal or "- (not provided)"}
+{goal}
 
 ## Context
-{context or "- (not provided)"}
+{context}
 
 ## Constraints
-{constraints or "- (not provided)"}
+{constraints}
 
 ## Draft Output (V0 Template)
 This is a deterministic draft scaffold.
 """
 
+
+def _scaffold_for(artifact_type: str) -> str:
+    # the title is literal text inside a format string, so escape braces
+    title = _draft_title(artifact_type).replace("{", "{{").replace("}", "}}")
+    return f"# {title}\n\n" + _SCAFFOLD_BODY
+
+
+_SCAFFOLDS: dict[str, str] = {t: _scaffold_for(t) for t in set(AGENT_TO_DEFAULT_ARTIFACT_TYPE.values()) | {"strategy_memo"}}
+
+
+def _deterministic_template(agent_id: str, input_payload: Dict[str, Any]) -> Tuple[str, str, str]:
+    artifact_type = AGENT_TO_DEFAULT_ARTIFACT_TYPE.get(agent_id, "strategy_memo")
+
+    goal = _safe_str(input_payload.get("goal"))
+    context = _safe_str(input_payload.get("context"))
+    constraints = _safe_str(input_payload.get("constraints"))
+
+    now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+
+    title = _draft_title(artifact_type)
+    md = _SCAFFOLDS[artifact_type].format(
+        agent_id=agent_id,
+        now=now,
+        goal=goal or "- (not provided)",
+        context=context or "- (not provided)",
+        constraints=constraints or "- (not provided)",
+    )
+
     return artifact_type, title, md
 
 
@@ -76,16 +106,13 @@ def build_initial_artifact(
     - Otherwise fallback to deterministic template.
     """
     artifact_type = AGENT_TO_DEFAULT_ARTIFACT_TYPE.get(agent_id, "strategy_memo")
-    title = f"{artifact_type.replace('_', ' ').title()} — Draft"
+    title = _draft_title(artifact_type)
 
-    if settings.LLM_ENABLED and settings.OPENAI_API_KEY:
+    if _LLM_AVAILABLE:
         try:
-            from app.core.prompts import build_system_prompt, build_user_prompt
-            from app.core.llm_client import llm_generate_markdown
-
-            system_prompt = build_system_prompt()
-            user_prompt = build_user_prompt(agent_id=agent_id, input_payload=input_payload, evidence_text=evidence_text or "")
-            md = llm_generate_markdown(system_prompt=system_prompt, user_prompt=user_prompt)
+            system_prompt = _prompts.build_system_prompt()
+            user_prompt = _prompts.build_user_prompt(agent_id=agent_id, input_payload=input_payload, evidence_text=evidence_text or "")
+            md = _llm_client.llm_generate_markdown(system_prompt=system_prompt, user_prompt=user_prompt)
 
             if not md.lstrip().startswith("#"):
                 md = f"# {title}\n\n" + md
@@ -98,6 +125,6 @@ def build_initial_artifact(
 
 
 def build_run_summary(agent_id: str, artifact_type: str) -> str:
-    if settings.LLM_ENABLED and settings.OPENAI_API_KEY:
+    if _LLM_AVAILABLE:
         return f"Run completed. Generated initial draft artifact via LLM: {artifact_type}."
     return f"Run completed. Generated initial draft artifact: {artifact_type}."
\ No newline at end of file
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
+import asyncio
 import time
 import random
 
+import httpx
 import requests
 
 from app.core.config import settings
@@ -25,6 +27,90 @@ class _RetryPolicy:
     reset_sleep_cap_s: float = 60.0  # don't sleep more than this per request
 
 
+def _primary_rate_limit_wait_s(headers: Any, cap_s: float) -> Optional[float]:
+    """
+    Seconds to wait for the primary rate limit to reset, or None when the
+    response is not a rate-limit exhaustion (works for requests + httpx headers).
+    """
+    remaining = headers.get("X-RateLimit-Remaining") or headers.get("x-ratelimit-remaining")
+    reset = headers.get("X-RateLimit-Reset") or headers.get("x-ratelimit-reset")
+    if remaining is None or reset is None:
+        return None
+
+    try:
+        remaining_i = int(remaining)
+        reset_i = int(reset)
+    except Exception:
+        return None
+
+    if remaining_i > 0:
+        return None
+
+    now = int(time.time())
+    sleep_for = max(0, reset_i - now)
+    return min(float(sleep_for), float(cap_s))
+
+
+def _backoff_s(policy: _RetryPolicy, attempt: int, retry_after: Optional[str] = None) -> float:
+    if retry_after:
+        try:
+            s = float(retry_after)
+            return max(0.0, min(s, policy.max_sleep_s))
+        except Exception:
+            pass
+
+    # exponential backoff + small jitter
+    base = policy.base_sleep_s * (2 ** max(0, attempt - 1))
+    jitter = random.uniform(0.0, 0.25 * base)
+    return min(policy.max_sleep_s, base + jitter)
+
+
+def _debug_for(status_code: int, headers: Any, *, attempt: int, url: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "status_code": status_code,
+        "x_ratelimit_remaining": headers.get("x-ratelimit-remaining") or headers.get("X-RateLimit-Remaining"),
+        "x_ratelimit_limit": headers.get("x-ratelimit-limit") or headers.get("X-RateLimit-Limit"),
+        "x_ratelimit_reset": headers.get("x-ratelimit-reset") or headers.get("X-RateLimit-Reset"),
+        "retry_after": headers.get("Retry-After"),
+        "attempt": attempt,
+        "url": url,
+        "params": params or {},
+    }
+
+
+def _error_from_response(status_code: int, json_fn: Any, text: str, debug: Dict[str, Any]) -> GitHubAPIError:
+    try:
+        body = json_fn()
+    except Exception:
+        body = {"message": text}
+    if not isinstance(body, dict):
+        body = {"message": text}
+
+    return GitHubAPIError(
+        status_code,
+        body.get("message", "GitHub API error"),
+        details={"debug": debug, "body": body},
+    )
+
+
+def _clamp_paging(per_page: int, max_pages: int, max_items: Optional[int]) -> Tuple[int, int, Optional[int]]:
+    per_page = max(1, min(int(per_page), 100))
+    max_pages = max(1, min(int(max_pages), 50))
+    max_items_i = int(max_items) if max_items is not None else None
+    if max_items_i is not None:
+        max_items_i = max(1, min(max_items_i, 5000))
+    return per_page, max_pages, max_items_i
+
+
+def _default_headers(token: str) -> Dict[str, str]:
+    return {
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+        "User-Agent": "pm-agent-os/1.0",
+    }
+
+
 class GitHubClient:
     """
     V1.5:
@@ -51,14 +137,7 @@ class GitHubClient:
         self.retry = retry or _RetryPolicy()
 
         self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "Authorization": f"Bearer {self.token}",
-                "Accept": "application/vnd.github+json",
-                "X-GitHub-Api-Version": "2022-11-28",
-                "User-Agent": "pm-agent-os/1.0",
-            }
-        )
+        self.session.headers.update(_default_headers(self.token))
 
     def _maybe_sleep_for_primary_rate_limit(self, r: requests.Response) -> Optional[float]:
         """
@@ -67,41 +146,13 @@ class GitHubClient:
           - X-RateLimit-Remaining: 0
           - X-RateLimit-Reset: epoch seconds
         """
-        remaining = r.headers.get("X-RateLimit-Remaining") or r.headers.get("x-ratelimit-remaining")
-        reset = r.headers.get("X-RateLimit-Reset") or r.headers.get("x-ratelimit-reset")
-        if remaining is None or reset is None:
-            return None
-
-        try:
-            remaining_i = int(remaining)
-            reset_i = int(reset)
-        except Exception:
-            return None
-
-        if remaining_i > 0:
-            return None
-
-        now = int(time.time())
-        sleep_for = max(0, reset_i - now)
-        sleep_for = min(float(sleep_for), float(self.retry.reset_sleep_cap_s))
-        if sleep_for > 0:
+        sleep_for = _primary_rate_limit_wait_s(r.headers, self.retry.reset_sleep_cap_s)
+        if sleep_for:
             time.sleep(sleep_for)
         return sleep_for
 
     def _retry_sleep(self, attempt: int, retry_after: Optional[str] = None) -> float:
-        if retry_after:
-            try:
-                s = float(retry_after)
-                s = max(0.0, min(s, self.retry.max_sleep_s))
-                time.sleep(s)
-                return s
-            except Exception:
-                pass
-
-        # exponential backoff + small jitter
-        base = self.retry.base_sleep_s * (2 ** max(0, attempt - 1))
-        jitter = random.uniform(0.0, 0.25 * base)
-        s = min(self.retry.max_sleep_s, base + jitter)
+        s = _backoff_s(self.retry, attempt, retry_after)
         time.sleep(s)
         return s
 
@@ -115,16 +166,7 @@ class GitHubClient:
         for attempt in range(1, self.retry.max_retries + 1):
             r = self.session.get(url, params=params or {}, timeout=self.timeout_s)
 
-            debug = {
-                "status_code": r.status_code,
-                "x_ratelimit_remaining": r.headers.get("x-ratelimit-remaining") or r.headers.get("X-RateLimit-Remaining"),
-                "x_ratelimit_limit": r.headers.get("x-ratelimit-limit") or r.headers.get("X-RateLimit-Limit"),
-                "x_ratelimit_reset": r.headers.get("x-ratelimit-reset") or r.headers.get("X-RateLimit-Reset"),
-                "retry_after": r.headers.get("Retry-After"),
-                "attempt": attempt,
-                "url": url,
-                "params": params or {},
-            }
+            debug = _debug_for(r.status_code, r.headers, attempt=attempt, url=url, params=params)
 
             # success
             if 200 <= r.status_code < 300:
@@ -146,16 +188,7 @@ class GitHubClient:
                     continue
 
             # fail
-            try:
-                body = r.json()
-            except Exception:
-                body = {"message": r.text}
-
-            last_err = GitHubAPIError(
-                r.status_code,
-                body.get("message", "GitHub API error"),
-                details={"debug": debug, "body": body},
-            )
+            last_err = _error_from_response(r.status_code, r.json, r.text, debug)
             break
 
         if last_err:
@@ -171,11 +204,7 @@ class GitHubClient:
         max_pages: int,
         max_items: Optional[int],
     ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
-        per_page = max(1, min(int(per_page), 100))
-        max_pages = max(1, min(int(max_pages), 50))
-        max_items_i = int(max_items) if max_items is not None else None
-        if max_items_i is not None:
-            max_items_i = max(1, min(max_items_i, 5000))
+        per_page, max_pages, max_items_i = _clamp_paging(per_page, max_pages, max_items)
 
         out: List[Dict[str, Any]] = []
         pages_fetched = 0
@@ -253,4 +282,225 @@ class GitHubClient:
         """
         url = f"{self.base}/repos/{owner}/{repo}/issues"
         params = {"state": state, "sort": "updated", "direction": "desc"}
-        return self._paginate(url=url, params=params, per_page=per_page, max_pages=max_pages, max_items=max_items)
\ No newline at end of file
+        return self._paginate(url=url, params=params, per_page=per_page, max_pages=max_pages, max_items=max_items)
+
+
+class AsyncGitHubClient:
+    """
+    Async twin of GitHubClient on httpx.AsyncClient.
+
+    Releases / PRs / issues are independent listings, so fetch_all() issues them
+    concurrently over one pooled client (same retry + error mapping as the sync client).
+    Use as an async context manager so the connection pool is closed.
+    """
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        *,
+        timeout_s: int = 30,
+        retry: Optional[_RetryPolicy] = None,
+    ):
+        self.token = token or settings.GITHUB_TOKEN
+        if not self.token:
+            raise GitHubAPIError(401, "GITHUB_TOKEN is missing")
+
+        self.base = "https://api.github.com"
+        self.timeout_s = int(timeout_s)
+        self.retry = retry or _RetryPolicy()
+
+        try:
+            import h2  # noqa: F401
+
+            http2 = True
+        except ImportError:
+            http2 = False
+
+        self.client = httpx.AsyncClient(
+            http2=http2,
+            headers=_default_headers(self.token),
+            timeout=self.timeout_s,
+        )
+
+    async def __aenter__(self) -> "AsyncGitHubClient":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def _request_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Any, Dict[str, Any]]:
+        last_err: Optional[GitHubAPIError] = None
+
+        for attempt in range(1, self.retry.max_retries + 1):
+            r = await self.client.get(url, params=params or {})
+
+            debug = _debug_for(r.status_code, r.headers, attempt=attempt, url=url, params=params)
+
+            # success
+            if 200 <= r.status_code < 300:
+                try:
+                    return r.json(), debug
+                except Exception:
+                    raise GitHubAPIError(r.status_code, "GitHub returned non-JSON response", {"debug": debug, "text": r.text})
+
+            # primary rate limit
+            if r.status_code == 403:
+                slept = _primary_rate_limit_wait_s(r.headers, self.retry.reset_sleep_cap_s)
+                if slept is not None and attempt < self.retry.max_retries:
+                    if slept:
+                        await asyncio.sleep(slept)
+                    continue
+
+            # retryable
+            if r.status_code == 429 or (500 <= r.status_code <= 599):
+                if attempt < self.retry.max_retries:
+                    await asyncio.sleep(_backoff_s(self.retry, attempt, r.headers.get("Retry-After")))
+                    continue
+
+            # fail
+            last_err = _error_from_response(r.status_code, r.json, r.text, debug)
+            break
+
+        if last_err:
+            raise last_err
+        raise GitHubAPIError(500, "GitHub request failed (unknown)", {})
+
+    async def _paginate(
+        self,
+        *,
+        url: str,
+        params: Dict[str, Any],
+        per_page: int,
+        max_pages: int,
+        max_items: Optional[int],
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        per_page, max_pages, max_items_i = _clamp_paging(per_page, max_pages, max_items)
+
+        out: List[Dict[str, Any]] = []
+        pages_fetched = 0
+        dbg_last: Dict[str, Any] = {}
+
+        for page in range(1, max_pages + 1):
+            pages_fetched += 1
+            js, dbg = await self._request_json(url, params={**params, "per_page": per_page, "page": page})
+            dbg_last = dbg
+
+            if not isinstance(js, list):
+                raise GitHubAPIError(500, "Unexpected GitHub response shape (expected list)", {"debug": dbg, "body": js})
+
+            out.extend(js)
+
+            if max_items_i is not None and len(out) >= max_items_i:
+                out = out[:max_items_i]
+                break
+
+            if len(js) == 0 or len(js) < per_page:
+                break
+
+        debug = {
+            "pages_fetched": pages_fetched,
+            "items": len(out),
+            "per_page": per_page,
+            "max_pages": max_pages,
+            "max_items": max_items_i,
+            "last_page_debug": dbg_last,
+        }
+        return out, debug
+
+    async def list_releases(
+        self,
+        owner: str,
+        repo: str,
+        *,
+        per_page: int = 20,
+        max_pages: int = 5,
+        max_items: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        url = f"{self.base}/repos/{owner}/{repo}/releases"
+        return await self._paginate(url=url, params={}, per_page=per_page, max_pages=max_pages, max_items=max_items)
+
+    async def list_pull_requests(
+        self,
+        owner: str,
+        repo: str,
+        *,
+        state: str = "all",
+        per_page: int = 30,
+        max_pages: int = 5,
+        max_items: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        url = f"{self.base}/repos/{owner}/{repo}/pulls"
+        params = {"state": state, "sort": "updated"}
+        return await self._paginate(url=url, params=params, per_page=per_page, max_pages=max_pages, max_items=max_items)
+
+    async def list_issues(
+        self,
+        owner: str,
+        repo: str,
+        *,
+        state: str = "all",
+        per_page: int = 50,
+        max_pages: int = 5,
+        max_items: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        url = f"{self.base}/repos/{owner}/{repo}/issues"
+        params = {"state": state, "sort": "updated", "direction": "desc"}
+        return await self._paginate(url=url, params=params, per_page=per_page, max_pages=max_pages, max_items=max_items)
+
+    async def fetch_all(
+        self,
+        owner: str,
+        repo: str,
+        *,
+        include_releases: bool = True,
+        include_prs: bool = True,
+        include_issues: bool = True,
+        releases_per_page: int = 20,
+        prs_state: str = "all",
+        prs_per_page: int = 30,
+        issues_state: str = "all",
+        issues_per_page: int = 50,
+        max_pages: int = 5,
+        max_items: Optional[int] = None,
+    ) -> Dict[str, Tuple[List[Dict[str, Any]], Dict[str, Any]]]:
+        """
+        Returns {"releases": (items, debug), "prs": (...), "issues": (...)} for the
+        requested kinds, fetched concurrently. Any GitHubAPIError propagates.
+        """
+        jobs: Dict[str, Any] = {}
+        if include_releases:
+            jobs["releases"] = self.list_releases(
+                owner, repo, per_page=releases_per_page, max_pages=max_pages, max_items=max_items
+            )
+        if include_prs:
+            jobs["prs"] = self.list_pull_requests(
+                owner, repo, state=prs_state, per_page=prs_per_page, max_pages=max_pages, max_items=max_items
+            )
+        if include_issues:
+            jobs["issues"] = self.list_issues(
+                owner, repo, state=issues_state, per_page=issues_per_page, max_pages=max_pages, max_items=max_items
+            )
+
+        results = await asyncio.gather(*jobs.values())
+        return dict(zip(jobs.keys(), results))
+
+
+def fetch_github_all(owner: str, repo: str, **kwargs: Any) -> Dict[str, Tuple[List[Dict[str, Any]], Dict[str, Any]]]:
+    """
+    Sync entrypoint for (sync) route handlers: runs AsyncGitHubClient.fetch_all
+    on a private event loop. FastAPI runs `def` routes in a worker thread, so
+    there is no running loop to collide with.
+    """
+
+    async def _run() -> Dict[str, Tuple[List[Dict[str, Any]], Dict[str, Any]]]:
+        async with AsyncGitHubClient() as client:
+            return await client.fetch_all(owner, repo, **kwargs)
+
+    return asyncio.run(_run())
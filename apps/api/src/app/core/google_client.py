@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.utils import parsedate_to_datetime
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import hashlib
+import threading
 import time
 import random
-import requests
 from io import BytesIO
 
-from docx import Document as DocxDocument  # python-docx
+import httpx
 
 from app.core.config import settings
 
@@ -18,11 +21,34 @@ class GoogleAPIError(RuntimeError):
         self.details = details or {}
 
 
+# Process-wide access-token cache shared by all GoogleClient instances:
+# (client_id, sha256(refresh_token)) -> (access_token, expires_at_epoch)
+_TOKEN_CACHE: Dict[Tuple[str, str], Tuple[str, float]] = {}
+_TOKEN_LOCK = threading.Lock()
+_TOKEN_REFRESH_SKEW_S = 300.0  # refresh 5 min before expiry
+
+
+def _retry_after_s(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After is either delta-seconds or an HTTP-date.
+    """
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(value).timestamp() - time.time()
+    except Exception:
+        return None
+
+
 class GoogleClient:
     """
     V1.5:
-      - Add retry/backoff for Drive calls (429 + 5xx)
-      - OAuth refresh remains strict (don't hide broken creds)
+      - Add retry/backoff for Drive calls (429 + 5xx + connection errors/timeouts)
+      - OAuth refresh retries only transient failures; 4xx stays strict (don't hide broken creds)
     """
 
     GOOGLE_DOC_MIME = "application/vnd.google-apps.document"
@@ -48,8 +74,7 @@ class GoogleClient:
                 "Provide via connector.config or env vars GOOGLE_CLIENT_ID/GOOGLE_CLIENT_SECRET/GOOGLE_REFRESH_TOKEN.",
             )
 
-        self._access_token: Optional[str] = None
-        self._access_token_exp: float = 0.0
+        self._token_key = (str(self.client_id), hashlib.sha256(str(self.refresh_token).encode("utf-8")).hexdigest())
 
         self.drive_base = "https://www.googleapis.com/drive/v3"
         self.oauth_token_url = "https://oauth2.googleapis.com/token"
@@ -57,13 +82,42 @@ class GoogleClient:
         self.timeout_s = int(timeout_s)
         self.max_retries = max(1, min(int(max_retries), 8))
 
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": "pm-agent-os/1.0"})
+        try:
+            import h2  # noqa: F401
+
+            http2 = True
+        except ImportError:
+            http2 = False
+
+        # One keep-alive pool for googleapis.com. With HTTP/2 the export_many workers
+        # multiplex over a single TLS connection; gzip is negotiated by default.
+        # Retries stay in _send.
+        self.client = httpx.Client(
+            http2=http2,
+            timeout=self.timeout_s,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            headers={"User-Agent": "pm-agent-os/1.0"},
+        )
+
+    def close(self) -> None:
+        self.client.close()
+
+    def __enter__(self) -> "GoogleClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
 
     def _refresh_access_token(self) -> str:
+        # Lock also serializes refreshes from export_many worker threads.
+        with _TOKEN_LOCK:
+            return self._refresh_access_token_locked()
+
+    def _refresh_access_token_locked(self) -> str:
         now = time.time()
-        if self._access_token and now < (self._access_token_exp - 30):
-            return self._access_token
+        cached = _TOKEN_CACHE.get(self._token_key)
+        if cached and now < (cached[1] - _TOKEN_REFRESH_SKEW_S):
+            return cached[0]
 
         data = {
             "client_id": self.client_id,
@@ -71,7 +125,7 @@ class GoogleClient:
             "refresh_token": self.refresh_token,
             "grant_type": "refresh_token",
         }
-        r = self.session.post(self.oauth_token_url, data=data, timeout=30)
+        r = self._send("POST", self.oauth_token_url, data=data, timeout=30)
         if r.status_code >= 400:
             try:
                 body = r.json()
@@ -85,8 +139,7 @@ class GoogleClient:
         if not token:
             raise GoogleAPIError(500, "OAuth token refresh returned no access_token", {"body": js})
 
-        self._access_token = token
-        self._access_token_exp = now + expires_in
+        _TOKEN_CACHE[self._token_key] = (token, now + expires_in)
         return token
 
     def _headers(self) -> Dict[str, str]:
@@ -94,14 +147,11 @@ class GoogleClient:
         return {"Authorization": f"Bearer {tok}"}
 
     def _sleep(self, attempt: int, retry_after: Optional[str] = None) -> float:
-        if retry_after:
-            try:
-                s = float(retry_after)
-                s = max(0.0, min(s, 15.0))
-                time.sleep(s)
-                return s
-            except Exception:
-                pass
+        s = _retry_after_s(retry_after)
+        if s is not None:
+            s = max(0.0, min(s, 15.0))
+            time.sleep(s)
+            return s
 
         base = 0.8 * (2 ** max(0, attempt - 1))
         jitter = random.uniform(0.0, 0.25 * base)
@@ -109,6 +159,29 @@ class GoogleClient:
         time.sleep(s)
         return s
 
+    def _send(self, method: str, url: str, *, stream: bool = False, **kwargs: Any) -> httpx.Response:
+        """
+        Send with retry on 429/5xx and connection errors/timeouts.
+        Returns the last response (which may be an error) for the caller to map.
+        With stream=True the body is left unread; the caller must close the response.
+        """
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                r = self.client.send(self.client.build_request(method, url, **kwargs), stream=stream)
+            except httpx.TransportError as e:
+                if attempt < self.max_retries:
+                    self._sleep(attempt)
+                    continue
+                raise GoogleAPIError(503, "Google API connection failed", {"url": url, "error": str(e)})
+
+            if (r.status_code == 429 or 500 <= r.status_code <= 599) and attempt < self.max_retries:
+                r.close()  # release the pooled connection (matters for stream=True)
+                self._sleep(attempt, r.headers.get("Retry-After"))
+                continue
+            return r
+
+        raise GoogleAPIError(500, "Google API request failed (unknown error)")
+
     def _request(
         self,
         method: str,
@@ -116,34 +189,24 @@ class GoogleClient:
         *,
         headers: Dict[str, str],
         params: Optional[Dict[str, Any]] = None,
-    ) -> requests.Response:
-        last_err: Optional[GoogleAPIError] = None
-        for attempt in range(1, self.max_retries + 1):
-            r = self.session.request(method, url, headers=headers, params=params, timeout=self.timeout_s)
-
-            if 200 <= r.status_code < 300:
-                return r
-
-            if r.status_code == 429 or (500 <= r.status_code <= 599):
-                if attempt < self.max_retries:
-                    self._sleep(attempt, r.headers.get("Retry-After"))
-                    continue
-
-            try:
-                body = r.json()
-            except Exception:
-                body = {"message": r.text}
-
-            last_err = GoogleAPIError(
-                r.status_code,
-                "Google API request failed",
-                {"url": url, "params": params or {}, "body": body, "status_code": r.status_code},
-            )
-            break
-
-        if last_err:
-            raise last_err
-        raise GoogleAPIError(500, "Google API request failed (unknown error)")
+        stream: bool = False,
+    ) -> httpx.Response:
+        r = self._send(method, url, headers=headers, params=params, stream=stream)
+        if 200 <= r.status_code < 300:
+            return r
+
+        r.read()
+        r.close()
+        try:
+            body = r.json()
+        except Exception:
+            body = {"message": r.text}
+
+        raise GoogleAPIError(
+            r.status_code,
+            "Google API request failed",
+            {"url": url, "params": params or {}, "body": body, "status_code": r.status_code},
+        )
 
     def list_docs_in_folder(
         self,
@@ -176,21 +239,131 @@ class GoogleClient:
         next_token = js.get("nextPageToken")
         return files, {"nextPageToken": next_token, "count": len(files), "q": q}
 
+    def iter_docs_in_folder(
+        self,
+        *,
+        folder_id: str,
+        page_size: int = 1000,
+        include_docx: bool = True,
+        limit: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every matching file in the folder (at most `limit`), paginating internally.
+
+        The next page is requested on a helper thread as soon as the current page's
+        token is known, so listing page N+1 overlaps with the caller exporting page N.
+        No page is prefetched once the pages already fetched cover `limit`.
+        Closing the generator early stops pagination.
+        """
+
+        def _page(token: Optional[str]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+            return self.list_docs_in_folder(
+                folder_id=folder_id,
+                page_size=page_size,
+                page_token=token,
+                include_docx=include_docx,
+            )
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            fut = pool.submit(_page, None)
+            fetched = 0
+            try:
+                while fut is not None:
+                    files, dbg = fut.result()
+                    if limit is not None:
+                        files = files[: max(0, limit - fetched)]
+                    fetched += len(files)
+                    token = dbg.get("nextPageToken")
+                    more = token and (limit is None or fetched < limit)
+                    fut = pool.submit(_page, token) if more else None
+                    yield from files
+            finally:
+                if fut is not None:
+                    fut.cancel()
+
     def export_google_doc_text(self, *, file_id: str) -> Tuple[str, Dict[str, Any]]:
         url = f"{self.drive_base}/files/{file_id}/export"
         params = {"mimeType": "text/plain"}
         r = self._request("GET", url, headers=self._headers(), params=params)
         return r.text or "", {"status_code": r.status_code}
 
-    def download_file_bytes(self, *, file_id: str) -> Tuple[bytes, Dict[str, Any]]:
+    def download_file_stream(self, *, file_id: str) -> Tuple[BytesIO, Dict[str, Any]]:
+        """
+        Stream the file body into a single in-memory buffer (no extra full-size copy),
+        positioned at 0 and ready to hand to python-docx.
+        """
         url = f"{self.drive_base}/files/{file_id}"
         params = {"alt": "media"}
-        r = self._request("GET", url, headers=self._headers(), params=params)
-        return r.content or b"", {"status_code": r.status_code}
+        r = self._request("GET", url, headers=self._headers(), params=params, stream=True)
+        buf = BytesIO()
+        try:
+            for part in r.iter_bytes(chunk_size=1 << 16):  # decoded (gzip/deflate undone)
+                buf.write(part)
+        finally:
+            r.close()
+        buf.seek(0)
+        return buf, {"status_code": r.status_code, "bytes": buf.getbuffer().nbytes}
+
+    def download_file_bytes(self, *, file_id: str) -> Tuple[bytes, Dict[str, Any]]:
+        buf, dbg = self.download_file_stream(file_id=file_id)
+        return buf.getvalue(), dbg
 
-    def extract_text_from_docx_bytes(self, data: bytes) -> str:
+    def extract_text_from_docx_bytes(self, data: Union[bytes, BinaryIO]) -> str:
+        """
+        Accepts raw bytes or a file-like object (e.g. from download_file_stream).
+        """
         if not data:
             return ""
-        doc = DocxDocument(BytesIO(data))
-        paras = [p.text.strip() for p in doc.paragraphs if p.text and p.text.strip()]
-        return "\n".join(paras).strip()
\ No newline at end of file
+        from docx import Document as DocxDocument  # python-docx; lazy, only .docx ingest needs it
+
+        fh = BytesIO(data) if isinstance(data, (bytes, bytearray)) else data
+        doc = DocxDocument(fh)
+        return "\n".join(t for p in doc.paragraphs if (t := (p.text or "").strip()))
+
+    def fetch_text(self, *, file_id: str, mime: str) -> str:
+        """
+        Plain text for a Google Doc (export) or .docx (download + extract). "" for other mime types.
+        """
+        if mime == self.GOOGLE_DOC_MIME:
+            text, _dbg = self.export_google_doc_text(file_id=file_id)
+            return text
+        if mime == self.DOCX_MIME:
+            buf, _dbg = self.download_file_stream(file_id=file_id)
+            if not buf.getbuffer().nbytes:
+                return ""
+            return self.extract_text_from_docx_bytes(buf)
+        return ""
+
+    def export_many(
+        self,
+        files: Iterable[Tuple[str, str]],
+        *,
+        max_workers: int = 8,
+    ) -> Iterator[Tuple[str, str, Optional[GoogleAPIError]]]:
+        """
+        Fan out fetch_text over (file_id, mime) pairs on a bounded thread pool that
+        shares this client's connection pool. Yields (file_id, text, error) in completion order.
+
+        Transient failures (429/5xx left after retries) are yielded per file as `error`
+        so one slow/failed file does not sink the batch; anything else (bad creds,
+        permissions) is raised as before.
+        """
+        items = list(files)
+        if not items:
+            return
+
+        # Drive per-user quota is ~10 req/s; don't fan out wider than that.
+        workers = max(1, min(int(max_workers), 10, len(items)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(self.fetch_text, file_id=fid, mime=mime): fid for fid, mime in items}
+            for fut in as_completed(futures):
+                fid = futures[fut]
+                try:
+                    yield fid, fut.result(), None
+                except GoogleAPIError as e:
+                    if e.status_code == 429 or 500 <= e.status_code <= 599:
+                        yield fid, "", e
+                        continue
+                    for other in futures:
+                        other.cancel()
+                    raise
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import re
-import uuid
 from datetime import datetime, timezone, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.db.base import uuid7
 from app.db.models import GovernanceEvent, User, Workspace, WorkspaceMember
 
 
@@ -370,7 +370,7 @@ def _mk_event(
     meta: Optional[Dict[str, Any]] = None,
 ) -> GovernanceEvent:
     return GovernanceEvent(
-        id=uuid.uuid4(),
+        id=uuid7(),
         workspace_id=ws.id,
         user_id=user.id if user else None,
         action=str(action or "").strip()[:120],
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 from datetime import datetime
+import hashlib
+import json
 import uuid
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from sqlalchemy import select, text as sql_text
+from sqlalchemy import func, insert, literal_column, select, text as sql_text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.core.chunker import chunk_text
 from app.core.config import settings
 from app.core.embeddings import embed_texts
+from app.db.base import uuid7
 from app.db.retrieval_models import Source, Document, Chunk, Embedding
 
 
@@ -63,48 +67,147 @@ def upsert_document(
     """
     Returns (doc, created_new).
     Idempotency: if external_id exists for workspace+source, update existing.
+
+    Single INSERT ... ON CONFLICT DO UPDATE ... RETURNING round-trip, atomic against
+    concurrent ingests of the same doc (relies on uq_documents_workspace_source_external_id).
+    A NULL external_id never conflicts, so those always insert. `xmax = 0` only
+    holds for a freshly inserted row version.
+
+    meta["raw_text_sha256"] records the content hash; rebuild_chunks uses it to skip
+    re-chunking/re-embedding documents whose text has not changed.
     """
-    doc: Optional[Document] = None
-    if external_id:
-        doc = db.execute(
-            select(Document).where(
-                Document.workspace_id == workspace_id,
-                Document.source_id == source_id,
-                Document.external_id == external_id,
-            )
-        ).scalar_one_or_none()
-
-    if doc:
-        doc.title = title
-        doc.raw_text = raw_text
-        doc.meta = meta
-        doc.source_created_at = source_created_at
-        doc.source_updated_at = source_updated_at
-        db.add(doc)
-        db.commit()
-        db.refresh(doc)
-        return doc, False
-
-    doc = Document(
-        workspace_id=workspace_id,
-        source_id=source_id,
-        external_id=external_id,
-        title=title,
-        raw_text=raw_text,
-        meta=meta,
-        source_created_at=source_created_at,
-        source_updated_at=source_updated_at,
+    meta = {**meta, "raw_text_sha256": text_sha256(raw_text)}
+    stmt = (
+        pg_insert(Document)
+        .values(
+            workspace_id=workspace_id,
+            source_id=source_id,
+            external_id=external_id,
+            title=title,
+            raw_text=raw_text,
+            meta=meta,
+            source_created_at=source_created_at,
+            source_updated_at=source_updated_at,
+        )
+        .on_conflict_do_update(
+            index_elements=[Document.workspace_id, Document.source_id, Document.external_id],
+            set_={
+                "title": title,
+                "raw_text": raw_text,
+                "meta": meta,
+                "source_created_at": source_created_at,
+                "source_updated_at": source_updated_at,
+                "updated_at": func.now(),
+            },
+        )
+        .returning(Document, literal_column("(xmax = 0)").label("created"))
     )
-    db.add(doc)
+    doc, created = db.execute(stmt, execution_options={"populate_existing": True}).one()
+    # Detach before commit so the RETURNING values stay loaded (no expire-on-commit reload).
+    db.expunge(doc)
     db.commit()
-    db.refresh(doc)
-    return doc, True
+    return doc, bool(created)
+
+
+# Rows per multi-row upsert statement (9 bind params each; Postgres caps a statement at 65535).
+_UPSERT_DOCS_BATCH = 500
+
+
+def upsert_documents(
+    db: Session,
+    *,
+    workspace_id: uuid.UUID,
+    source_id: uuid.UUID,
+    docs: List[Dict[str, Any]],
+) -> List[Tuple[Document, bool]]:
+    """
+    Batch form of upsert_document for job payloads: multi-row INSERT ... ON CONFLICT
+    DO UPDATE ... RETURNING (one statement per _UPSERT_DOCS_BATCH docs), committed once.
+
+    Each dict carries upsert_document's keyword fields (external_id, title, raw_text,
+    meta, optional source_created_at/source_updated_at). Returns (doc, created_new)
+    per input dict, in input order. A repeated external_id would make ON CONFLICT hit
+    the same row twice in one statement (an error), so the last occurrence wins, as it
+    would with sequential upserts.
+    """
+    keys: List[Any] = []
+    unique: Dict[Any, Dict[str, Any]] = {}
+    for d in docs:
+        raw_text = d["raw_text"]
+        row = {
+            "id": uuid7(),
+            "workspace_id": workspace_id,
+            "source_id": source_id,
+            "external_id": d.get("external_id"),
+            "title": d["title"],
+            "raw_text": raw_text,
+            "meta": {**(d.get("meta") or {}), "raw_text_sha256": text_sha256(raw_text)},
+            "source_created_at": d.get("source_created_at"),
+            "source_updated_at": d.get("source_updated_at"),
+        }
+        # NULL external_ids never conflict; key those by their own (always inserted) id.
+        key = row["external_id"] if row["external_id"] is not None else row["id"]
+        keys.append(key)
+        unique[key] = row
+
+    rows = list(unique.values())
+    by_key: Dict[Any, Tuple[Document, bool]] = {}
+    for i in range(0, len(rows), _UPSERT_DOCS_BATCH):
+        ins = pg_insert(Document).values(rows[i : i + _UPSERT_DOCS_BATCH])
+        stmt = ins.on_conflict_do_update(
+            index_elements=[Document.workspace_id, Document.source_id, Document.external_id],
+            set_={
+                "title": ins.excluded.title,
+                "raw_text": ins.excluded.raw_text,
+                "meta": ins.excluded.meta,
+                "source_created_at": ins.excluded.source_created_at,
+                "source_updated_at": ins.excluded.source_updated_at,
+                "updated_at": func.now(),
+            },
+        ).returning(Document, literal_column("(xmax = 0)").label("created"))
+        for doc, created in db.execute(stmt, execution_options={"populate_existing": True}).all():
+            db.expunge(doc)
+            by_key[doc.external_id if doc.external_id is not None else doc.id] = (doc, bool(created))
+    db.commit()
+
+    out: List[Tuple[Document, bool]] = []
+    seen: set = set()
+    for key in keys:
+        doc, created = by_key[key]
+        out.append((doc, created and key not in seen))
+        seen.add(key)
+    return out
+
+
+def text_sha256(raw_text: str) -> str:
+    return hashlib.sha256((raw_text or "").encode("utf-8")).hexdigest()
+
+
+def _chunking_key() -> str:
+    return f"{settings.CHUNK_SIZE_CHARS}:{settings.CHUNK_OVERLAP_CHARS}"
 
 
 def rebuild_chunks(db: Session, *, document_id: uuid.UUID, raw_text: str) -> int:
     """
     Rebuild chunks for a document (delete old chunks + embeddings, then re-chunk).
+
+    Skipped (returns 0) when the existing chunks were built from the same text with the
+    same chunking settings, so unchanged documents keep their chunks and embeddings and
+    embed_document finds nothing to do.
     """
+    built_from = db.execute(
+        sql_text(
+            """
+            SELECT meta->>'raw_text_sha256' AS h, meta->>'chunking' AS chunking
+            FROM chunks
+            WHERE document_id = :doc_id AND chunk_index = 0
+            """
+        ),
+        {"doc_id": str(document_id)},
+    ).first()
+    if built_from and built_from.h == text_sha256(raw_text) and built_from.chunking == _chunking_key():
+        return 0
+
     # Delete embeddings for chunks of this doc
     db.execute(
         sql_text(
@@ -119,32 +222,40 @@ def rebuild_chunks(db: Session, *, document_id: uuid.UUID, raw_text: str) -> int
     db.execute(sql_text("DELETE FROM chunks WHERE document_id = :doc_id"), {"doc_id": str(document_id)})
     db.commit()
 
+    return insert_chunks(db, document_id=document_id, raw_text=raw_text)
+
+
+def insert_chunks(db: Session, *, document_id: uuid.UUID, raw_text: str) -> int:
+    """
+    Chunk raw_text and persist it with a single multi-row INSERT (no per-object
+    unit-of-work bookkeeping), committed once.
+    """
     parts = chunk_text(
         raw_text,
         chunk_size=settings.CHUNK_SIZE_CHARS,
         overlap=settings.CHUNK_OVERLAP_CHARS,
     )
-    chunks: List[Chunk] = []
-    for i, (start, end, txt) in enumerate(parts):
-        chunks.append(
-            Chunk(
-                document_id=document_id,
-                chunk_index=i,
-                text=txt,
-                meta={"start": start, "end": end},
-            )
-        )
-    if chunks:
-        db.add_all(chunks)
+    h = text_sha256(raw_text)
+    chunking = _chunking_key()
+    rows = [
+        {
+            "document_id": document_id,
+            "chunk_index": i,
+            "text": txt,
+            "meta": {"start": start, "end": end, "raw_text_sha256": h, "chunking": chunking},
+        }
+        for i, (start, end, txt) in enumerate(parts)
+    ]
+    if rows:
+        db.execute(insert(Chunk), rows)
         db.commit()
 
-    return len(chunks)
+    return len(rows)
 
 
 def embed_document(db: Session, *, document_id: uuid.UUID) -> int:
     """
     Embed all chunks for a document that don't already have embeddings for the current model.
-    Ensures embedding_vec is populated.
     """
     chunks = db.execute(select(Chunk).where(Chunk.document_id == document_id).order_by(Chunk.chunk_index.asc())).scalars().all()
     if not chunks:
@@ -152,48 +263,101 @@ def embed_document(db: Session, *, document_id: uuid.UUID) -> int:
 
     chunk_ids = [c.id for c in chunks]
 
-    # Backfill vector for existing rows (jsonb -> text -> vector)
-    db.execute(
-        sql_text(
-            """
-            UPDATE embeddings
-            SET embedding_vec = (embedding::text)::vector
-            WHERE model = :model
-              AND chunk_id = ANY(:chunk_ids)
-              AND embedding_vec IS NULL
-              AND embedding IS NOT NULL
-            """
-        ),
-        {"model": settings.EMBEDDINGS_MODEL, "chunk_ids": chunk_ids},
-    )
-    db.commit()
-
     existing_chunk_ids = set(
         db.execute(
             select(Embedding.chunk_id).where(
                 Embedding.model == settings.EMBEDDINGS_MODEL,
                 Embedding.chunk_id.in_(chunk_ids),
             )
-        ).scalars().all()
+        ).scalars()
     )
     todo = [c for c in chunks if c.id not in existing_chunk_ids]
     if not todo:
         return 0
 
-    vectors = embed_texts([c.text for c in todo])
+    vectors = embed_texts_cached(db, [c.text for c in todo])
+    return insert_embeddings(db, chunk_ids=[c.id for c in todo], vectors=vectors)
 
-    embedded = 0
-    for c, vec in zip(todo, vectors):
-        emb = Embedding(chunk_id=c.id, model=settings.EMBEDDINGS_MODEL, embedding=vec)
-        db.add(emb)
-        db.commit()
-        db.refresh(emb)
 
+def embed_texts_cached(db: Session, texts: List[str]) -> List[str]:
+    """
+    Embeddings for texts as pgvector literals, in input order, via embedding_cache.
+
+    One SELECT resolves cached (model, sha256(text)) keys; the remaining unique texts
+    go to embed_texts in a single batched call and are written back with
+    ON CONFLICT DO NOTHING (a concurrent ingest may have cached the same text).
+    Not committed here; the caller's insert_embeddings commits both.
+    """
+    if not texts:
+        return []
+
+    model = settings.EMBEDDINGS_MODEL
+    keys = [hashlib.sha256(t.encode("utf-8")).digest() for t in texts]
+    cached: Dict[bytes, str] = dict(
+        db.execute(
+            sql_text(
+                """
+                SELECT content_sha256, embedding_vec::text
+                FROM embedding_cache
+                WHERE model = :model AND content_sha256 = ANY(:keys)
+                """
+            ),
+            {"model": model, "keys": list(set(keys))},
+        ).all()
+    )
+
+    # In-batch dedup: repeated boilerplate chunks are embedded once.
+    misses: Dict[bytes, str] = {}
+    for key, t in zip(keys, texts):
+        if key not in cached and key not in misses:
+            misses[key] = t
+    if misses:
+        vectors = embed_texts(list(misses.values()))
+        fresh = {key: json.dumps(vec) for key, vec in zip(misses, vectors)}
         db.execute(
-            sql_text("UPDATE embeddings SET embedding_vec = CAST(:v AS vector) WHERE id = :id"),
-            {"v": vec, "id": str(emb.id)},
+            sql_text(
+                """
+                INSERT INTO embedding_cache (model, content_sha256, embedding_vec)
+                VALUES (:model, :key, CAST(:vec AS vector))
+                ON CONFLICT DO NOTHING
+                """
+            ),
+            [{"model": model, "key": key, "vec": vec} for key, vec in fresh.items()],
         )
-        db.commit()
-        embedded += 1
+        cached.update(fresh)
+
+    return [cached[key] for key in keys]
+
 
-    return embedded
\ No newline at end of file
+def insert_embeddings(db: Session, *, chunk_ids: List[uuid.UUID], vectors: List[Union[str, List[float]]]) -> int:
+    """
+    Persist embeddings for the current model with one bulk INSERT (executemany)
+    into embedding_vec, committed once.
+
+    vectors are float lists or pgvector literals (embed_texts_cached). The JSON array
+    text is a valid pgvector literal, so no pgvector SQLAlchemy type is needed;
+    embedding_vec_h is generated from it.
+    """
+    rows = [
+        {
+            "id": uuid7(),
+            "chunk_id": cid,
+            "model": settings.EMBEDDINGS_MODEL,
+            "vec": vec if isinstance(vec, str) else json.dumps(vec),
+        }
+        for cid, vec in zip(chunk_ids, vectors)
+    ]
+    if not rows:
+        return 0
+
+    db.execute(
+        sql_text(
+            """
+            INSERT INTO embeddings (id, chunk_id, model, embedding_vec)
+            VALUES (:id, :chunk_id, :model, CAST(:vec AS vector))
+            """
+        ),
+        rows,
+    )
+    db.commit()
+    return len(rows)
@@ -2,29 +2,46 @@ from __future__ import annotations
 
 import io
 import re
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.units import inch
-from reportlab.pdfbase.pdfmetrics import stringWidth
-from reportlab.pdfgen import canvas
+# reportlab is imported inside the functions below: it pulls in many submodules
+# and only the PDF export endpoint needs it.
+
+
+@lru_cache(maxsize=1 << 16)
+def _sw(word: str, font: str, font_size: int) -> float:
+    """
+    Cached stringWidth: word frequencies are Zipf-like, so most lookups hit.
+    """
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
+    return stringWidth(word, font, font_size)
 
 
 def _wrap_text(text: str, font: str, font_size: int, max_width: float) -> List[str]:
     """
     Simple word-wrap for PDF.
+
+    Measures each word once and keeps a running line width (Helvetica/Courier
+    widths are additive), instead of re-measuring the growing line per word.
     """
     words = text.split()
+    space_w = _sw(" ", font, font_size)
     lines: List[str] = []
     cur: List[str] = []
+    cur_w = 0.0
     for w in words:
-        trial = (" ".join(cur + [w])).strip()
-        if stringWidth(trial, font, font_size) <= max_width:
+        wv = _sw(w, font, font_size)
+        trial_w = cur_w + space_w + wv if cur else wv
+        if trial_w <= max_width:
             cur.append(w)
+            cur_w = trial_w
         else:
             if cur:
                 lines.append(" ".join(cur))
                 cur = [w]
+                cur_w = wv
             else:
                 lines.append(w)
     if cur:
@@ -45,6 +62,10 @@ def markdown_to_pdf_bytes(title: str, markdown: str) -> bytes:
     - fenced code blocks ``` ... ``` rendered in Courier
     - paragraphs
     """
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import inch
+    from reportlab.pdfgen import canvas
+
     buf = io.BytesIO()
     c = canvas.Canvas(buf, pagesize=A4)
 
@@ -57,19 +78,31 @@ def markdown_to_pdf_bytes(title: str, markdown: str) -> bytes:
 
     y = top
 
+    # Only emit a Tf operator when the font actually changes.
+    current_font: Tuple[str, int] = ("", 0)
+
+    def set_font(name: str, size: int) -> None:
+        nonlocal current_font
+        if current_font != (name, size):
+            c.setFont(name, size)
+            current_font = (name, size)
+
     def ensure_space(lines_needed: int, line_h: float):
         nonlocal y
         if y - (lines_needed * line_h) < bottom:
             c.showPage()
             y = top
+            # showPage() resets the canvas graphics state (font included)
+            if current_font[0]:
+                c.setFont(*current_font)
 
     # Title
-    c.setFont("Helvetica-Bold", 16)
+    set_font("Helvetica-Bold", 16)
     ensure_space(2, 18)
     c.drawString(left, y, title or "Export")
     y -= 22
 
-    c.setFont("Helvetica", 10)
+    set_font("Helvetica", 10)
     ensure_space(1, 12)
     c.drawString(left, y, "Exported from PM Agent OS")
     y -= 18
@@ -95,7 +128,7 @@ def markdown_to_pdf_bytes(title: str, markdown: str) -> bytes:
             continue
 
         if in_code:
-            c.setFont(code_font, code_size)
+            set_font(code_font, code_size)
             wrapped = _wrap_text(line, code_font, code_size, max_width)
             ensure_space(len(wrapped), 12)
             for w in wrapped:
@@ -106,33 +139,34 @@ def markdown_to_pdf_bytes(title: str, markdown: str) -> bytes:
         # Heading 1
         if line.startswith("# "):
             txt = line[2:].strip()
-            c.setFont("Helvetica-Bold", 14)
+            set_font("Helvetica-Bold", 14)
             wrapped = _wrap_text(txt, "Helvetica-Bold", 14, max_width)
             ensure_space(len(wrapped) + 1, 18)
             for w in wrapped:
                 c.drawString(left, y, w)
                 y -= 18
             y -= 4
-            c.setFont("Helvetica", 11)
+            set_font("Helvetica", 11)
             continue
 
         # Heading 2
         if line.startswith("## "):
             txt = line[3:].strip()
-            c.setFont("Helvetica-Bold", 12)
+            set_font("Helvetica-Bold", 12)
             wrapped = _wrap_text(txt, "Helvetica-Bold", 12, max_width)
             ensure_space(len(wrapped) + 1, 16)
             for w in wrapped:
                 c.drawString(left, y, w)
                 y -= 16
             y -= 2
-            c.setFont("Helvetica", 11)
+            set_font("Helvetica", 11)
             continue
 
         # Bullet
-        if _BULLET_RE.match(line):
-            txt = _BULLET_RE.sub("", line).strip()
-            c.setFont("Helvetica", 11)
+        bm = _BULLET_RE.match(line)
+        if bm:
+            txt = line[bm.end():].strip()
+            set_font("Helvetica", 11)
             wrapped = _wrap_text(txt, "Helvetica", 11, max_width - 18)
             ensure_space(len(wrapped), 14)
             if wrapped:
@@ -148,8 +182,8 @@ def markdown_to_pdf_bytes(title: str, markdown: str) -> bytes:
         nm = _NUM_RE.match(line)
         if nm:
             prefix = nm.group(1) + "."
-            txt = _NUM_RE.sub("", line).strip()
-            c.setFont("Helvetica", 11)
+            txt = line[nm.end():].strip()
+            set_font("Helvetica", 11)
             wrapped = _wrap_text(txt, "Helvetica", 11, max_width - 24)
             ensure_space(len(wrapped), 14)
             if wrapped:
@@ -162,7 +196,7 @@ def markdown_to_pdf_bytes(title: str, markdown: str) -> bytes:
             continue
 
         # Paragraph
-        c.setFont("Helvetica", 11)
+        set_font("Helvetica", 11)
         wrapped = _wrap_text(line.strip(), "Helvetica", 11, max_width)
         ensure_space(len(wrapped), 14)
         for w in wrapped:
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+# -------------------------
+# Canonical pipeline templates (V1)
+# Single source for the templates seed endpoint and scripts/seed_pipelines.py.
+# NOTE: agent_id must exist in AgentDefinition.id (seed_agents.py)
+# -------------------------
+CANONICAL_PIPELINES: List[Dict[str, Any]] = [
+    {
+        "key": "discovery_strategy_prd",
+        "name": "Discovery → Strategy → PRD",
+        "description": "End-to-end early phase flow: identify opportunities, pick direction, write PRD.",
+        "definition_json": {
+            "version": "v1",
+            "auto_regenerate_with_evidence": True,
+            "steps": [
+                {"name": "Discovery", "agent_id": "discovery"},
+                {"name": "Strategy & Roadmap", "agent_id": "strategy_roadmap"},
+                {"name": "PRD", "agent_id": "prd"},
+            ],
+        },
+    },
+    {
+        "key": "prd_ux_feasibility",
+        "name": "PRD → UX → Feasibility",
+        "description": "Turn PRD into UX flow spec, then validate feasibility and architecture.",
+        "definition_json": {
+            "version": "v1",
+            "auto_regenerate_with_evidence": True,
+            "steps": [
+                {"name": "PRD", "agent_id": "prd"},
+                {"name": "UX Flow", "agent_id": "ux_flow"},
+                {"name": "Feasibility & Architecture", "agent_id": "feasibility_architecture"},
+            ],
+        },
+    },
+    {
+        "key": "analytics_qa_launch",
+        "name": "Analytics → QA → Launch",
+        "description": "Operationalization flow: tracking + experiment plan → QA suite → launch plan/runbook.",
+        "definition_json": {
+            "version": "v1",
+            "auto_regenerate_with_evidence": True,
+            "steps": [
+                {"name": "Analytics & Experiment", "agent_id": "analytics_experiment"},
+                {"name": "QA & Test", "agent_id": "qa_test"},
+                {"name": "Launch", "agent_id": "launch"},
+            ],
+        },
+    },
+    {
+        "key": "launch_monitoring_stakeholder",
+        "name": "Launch → Monitoring → Stakeholders",
+        "description": "Post-release loop: launch → health monitoring → stakeholder update pack.",
+        "definition_json": {
+            "version": "v1",
+            "auto_regenerate_with_evidence": True,
+            "steps": [
+                {"name": "Launch", "agent_id": "launch"},
+                {"name": "Post-launch Monitoring", "agent_id": "post_launch_monitoring"},
+                {"name": "Stakeholder Alignment", "agent_id": "stakeholder_alignment"},
+            ],
+        },
+    },
+]
@@ -5,14 +5,17 @@ from typing import Any, Dict, List
 from app.core.generator import AGENT_TO_DEFAULT_ARTIFACT_TYPE
 
 
+_SYSTEM_PROMPT = (
+    "You are a senior Product Manager. "
+    "You write crisp, structured, execution-ready documents. "
+    "You never invent metrics, data, or citations. "
+    "If something is unknown, state it explicitly and ask for it under Open Questions. "
+    "Output only valid Markdown. No preamble."
+)
+
+
 def build_system_prompt() -> str:
-    return (
-        "You are a senior Product Manager. "
-        "You write crisp, structured, execution-ready documents. "
-        "You never invent metrics, data, or citations. "
-        "If something is unknown, state it explicitly and ask for it under Open Questions. "
-        "Output only valid Markdown. No preamble."
-    )
+    return _SYSTEM_PROMPT
 
 
 _AGENT_PLAYBOOK: dict[str, str] = {
@@ -48,16 +51,21 @@ def _s(v: Any) -> str:
 
 
 def build_user_prompt(agent_id: str, input_payload: Dict[str, Any], evidence_text: str = "") -> str:
-    artifact_type = AGENT_TO_DEFAULT_ARTIFACT_TYPE.get(agent_id, "strategy_memo")
-    goal = _s(input_payload.get("goal"))
-    context = _s(input_payload.get("context"))
-    constraints = _s(input_payload.get("constraints"))
-
-    agent_instruction = _AGENT_PLAYBOOK.get(agent_id, "")
+    template = _USER_PROMPT_TEMPLATES.get(agent_id) or _DEFAULT_USER_PROMPT_TEMPLATE
 
     evidence_block = ""
     if evidence_text.strip():
-        evidence_block = f"""
+        evidence_block = _EVIDENCE_BLOCK_TEMPLATE.format(evidence_text=evidence_text)
+
+    return template.format(
+        goal=_s(input_payload.get("goal")) or "(not provided)",
+        context=_s(input_payload.get("context")) or "(not provided)",
+        constraints=_s(input_payload.get("constraints")) or "(not provided)",
+        evidence_block=evidence_block,
+    )
+
+
+_EVIDENCE_BLOCK_TEMPLATE = """
 Known Evidence (only use what is provided below; do not invent anything):
 {evidence_text}
 
@@ -67,31 +75,39 @@ Evidence Rules:
 - If you need data not present, list it under Open Questions.
 """.strip()
 
-    common_requirements = f"""
+
+def _compile_user_prompt_template(agent_id: str) -> str:
+    """
+    Inline the per-agent parts (artifact type, playbook focus, heading structure)
+    once; only goal/context/constraints/evidence are filled per call.
+    """
+
+    def esc(v: str) -> str:
+        return v.replace("{", "{{").replace("}", "}}")
+
+    artifact_type = esc(AGENT_TO_DEFAULT_ARTIFACT_TYPE.get(agent_id, "strategy_memo"))
+    agent_instruction = esc(_AGENT_PLAYBOOK.get(agent_id, ""))
+    structure = esc(_structure_for_artifact_type(AGENT_TO_DEFAULT_ARTIFACT_TYPE.get(agent_id, "strategy_memo")))
+
+    return f"""
 You must produce a **{artifact_type}** draft for the user's goal.
 
 User goal:
-{goal or "(not provided)"}
+{{goal}}
 
 Context:
-{context or "(not provided)"}
+{{context}}
 
 Constraints:
-{constraints or "(not provided)"}
+{{constraints}}
 
-{evidence_block}
+{{evidence_block}}
 
 Rules:
 - Use the goal/context/constraints explicitly in the draft (do not ignore them).
 - No fake metrics, no fake baselines. If unknown, mark as unknown.
 - End with: Assumptions and Open Questions.
 - Output must be actionable (decisions, next actions).
-""".strip()
-
-    structure = _structure_for_artifact_type(artifact_type)
-
-    return f"""
-{common_requirements}
 
 Agent focus:
 {agent_instruction}
@@ -101,10 +117,8 @@ Required structure (use these headings in order):
 """.strip()
 
 
-def _structure_for_artifact_type(artifact_type: str) -> str:
-    # Keep headings stable for consistent downstream parsing later.
-    if artifact_type == "prd":
-        return """
+# Keep headings stable for consistent downstream parsing later.
+_PRD_STRUCTURE = """
 # Summary
 # Problem
 # Users / Segments
@@ -118,8 +132,7 @@ def _structure_for_artifact_type(artifact_type: str) -> str:
 # Next Actions
 """.strip()
 
-    if artifact_type in ("problem_brief",):
-        return """
+_PROBLEM_BRIEF_STRUCTURE = """
 # Summary
 # Problem Statements
 # Who is impacted (Segments)
@@ -132,8 +145,7 @@ def _structure_for_artifact_type(artifact_type: str) -> str:
 # Next Actions
 """.strip()
 
-    if artifact_type in ("qa_suite",):
-        return """
+_QA_SUITE_STRUCTURE = """
 # Summary
 # Test Scenarios (Happy Path)
 # Edge Cases
@@ -145,8 +157,7 @@ def _structure_for_artifact_type(artifact_type: str) -> str:
 # Next Actions
 """.strip()
 
-    if artifact_type in ("launch_plan",):
-        return """
+_LAUNCH_PLAN_STRUCTURE = """
 # Summary
 # Launch Type & Cohort
 # Rollout Plan (Flags / Phases)
@@ -158,8 +169,7 @@ def _structure_for_artifact_type(artifact_type: str) -> str:
 # Next Actions
 """.strip()
 
-    if artifact_type in ("experiment_plan", "tracking_spec"):
-        return """
+_EXPERIMENT_STRUCTURE = """
 # Summary
 # Primary KPI + Guardrails
 # Hypothesis
@@ -172,8 +182,8 @@ def _structure_for_artifact_type(artifact_type: str) -> str:
 # Next Actions
 """.strip()
 
-    # Default generic memo
-    return """
+# Default generic memo
+_DEFAULT_STRUCTURE = """
 # Summary
 # Context
 # Proposed Approach
@@ -184,6 +194,26 @@ def _structure_for_artifact_type(artifact_type: str) -> str:
 # Next Actions
 """.strip()
 
+_STRUCTURE_BY_TYPE: dict[str, str] = {
+    "prd": _PRD_STRUCTURE,
+    "problem_brief": _PROBLEM_BRIEF_STRUCTURE,
+    "qa_suite": _QA_SUITE_STRUCTURE,
+    "launch_plan": _LAUNCH_PLAN_STRUCTURE,
+    "experiment_plan": _EXPERIMENT_STRUCTURE,
+    "tracking_spec": _EXPERIMENT_STRUCTURE,
+}
+
+
+def _structure_for_artifact_type(artifact_type: str) -> str:
+    return _STRUCTURE_BY_TYPE.get(artifact_type, _DEFAULT_STRUCTURE)
+
+
+_USER_PROMPT_TEMPLATES: dict[str, str] = {
+    agent_id: _compile_user_prompt_template(agent_id)
+    for agent_id in set(AGENT_TO_DEFAULT_ARTIFACT_TYPE) | set(_AGENT_PLAYBOOK)
+}
+_DEFAULT_USER_PROMPT_TEMPLATE = _compile_user_prompt_template("")
+
 
 # -------------------------
 # Custom agent prompt builder
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
-import base64
 import hashlib
-import hmac
-import os
+import secrets
+import threading
 import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Tuple
+from typing import Any, Iterable, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, delete, insert, select, update
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
@@ -29,20 +28,54 @@ def _expiry_dt() -> datetime:
 
 
 def generate_refresh_token() -> str:
-    # opaque token, not JWT
-    raw = os.urandom(48)
-    return base64.urlsafe_b64encode(raw).decode("utf-8").rstrip("=")
-
-
-def hash_refresh_token(token: str) -> str:
-    # HMAC with JWT_SECRET to avoid raw token storage
-    key = settings.JWT_SECRET.encode("utf-8")
-    msg = token.encode("utf-8")
-    digest = hmac.new(key, msg, hashlib.sha256).hexdigest()
-    return digest
-
-
-def store_refresh_token(db: Session, *, user_id: uuid.UUID, token: str) -> RefreshToken:
+    # opaque token, not JWT (48 random bytes -> 64 url-safe chars, same format as before)
+    return secrets.token_urlsafe(48)
+
+
+# HMAC-SHA256 inlined as two hashlib states with the key pads already absorbed
+# (RFC 2104), cloned per token. Same digest as hmac.new(secret, token, sha256), but
+# skips the hmac module's per-call wrapper; hashlib dispatches to OpenSSL (SHA-NI).
+# Rebuilt if JWT_SECRET changes (e.g. settings reloaded in tests).
+_SHA256_BLOCK = 64
+_TRANS_36 = bytes(x ^ 0x36 for x in range(256))
+_TRANS_5C = bytes(x ^ 0x5C for x in range(256))
+_HMAC_LOCK = threading.Lock()
+_HMAC_PADS: Optional[Tuple[str, Any, Any]] = None
+
+
+def _hmac_pads() -> Tuple[Any, Any]:
+    global _HMAC_PADS
+    secret = settings.JWT_SECRET
+    cached = _HMAC_PADS
+    if cached is not None and cached[0] == secret:
+        return cached[1], cached[2]
+    with _HMAC_LOCK:
+        if _HMAC_PADS is None or _HMAC_PADS[0] != secret:
+            key = secret.encode("utf-8")
+            if len(key) > _SHA256_BLOCK:
+                key = hashlib.sha256(key).digest()
+            key = key.ljust(_SHA256_BLOCK, b"\0")
+            inner = hashlib.sha256(key.translate(_TRANS_36))
+            outer = hashlib.sha256(key.translate(_TRANS_5C))
+            _HMAC_PADS = (secret, inner, outer)
+        return _HMAC_PADS[1], _HMAC_PADS[2]
+
+
+def hash_refresh_token(token: str) -> bytes:
+    # HMAC with JWT_SECRET to avoid raw token storage (32 raw bytes, stored as bytea)
+    inner, outer = _hmac_pads()
+    ih = inner.copy()
+    ih.update(token.encode("utf-8"))
+    oh = outer.copy()
+    oh.update(ih.digest())
+    return oh.digest()
+
+
+def store_refresh_token(db: Session, *, user_id: uuid.UUID, token: str, commit: bool = True) -> RefreshToken:
+    """
+    No refresh() after commit: callers never read DB-generated columns off the row.
+    With commit=False the row is only added, for the caller to commit with other changes.
+    """
     rt = RefreshToken(
         user_id=user_id,
         token_hash=hash_refresh_token(token),
@@ -50,31 +83,69 @@ def store_refresh_token(db: Session, *, user_id: uuid.UUID, token: str) -> Refre
         revoked_at=None,
     )
     db.add(rt)
-    db.commit()
-    db.refresh(rt)
+    if commit:
+        db.commit()
     return rt
 
 
+def store_refresh_tokens_bulk(db: Session, pairs: Iterable[Tuple[uuid.UUID, str]], *, commit: bool = True) -> int:
+    """
+    Stores many (user_id, token) pairs with one executemany INSERT and one commit,
+    for burst issuance instead of looping store_refresh_token. Returns rows written.
+    """
+    expires_at = _expiry_dt()
+    rows = [
+        {"user_id": user_id, "token_hash": hash_refresh_token(token), "expires_at": expires_at}
+        for user_id, token in pairs
+    ]
+    if not rows:
+        return 0
+    db.execute(insert(RefreshToken), rows)
+    if commit:
+        db.commit()
+    return len(rows)
+
+
+# Built once; both hit the partial unique index ux_refresh_tokens_live
+# (token_hash WHERE revoked_at IS NULL), which only holds live tokens.
+_ACTIVE_LOOKUP_STMT = select(RefreshToken).where(
+    RefreshToken.token_hash == bindparam("h"),
+    RefreshToken.revoked_at.is_(None),
+    RefreshToken.expires_at > bindparam("now"),
+)
+_REVOKE_STMT = (
+    update(RefreshToken)
+    .where(RefreshToken.token_hash == bindparam("h"), RefreshToken.revoked_at.is_(None))
+    .values(revoked_at=bindparam("now"))
+    .execution_options(synchronize_session=False)
+)
+
+
 def revoke_refresh_token(db: Session, token: str) -> None:
-    h = hash_refresh_token(token)
-    rt = db.execute(select(RefreshToken).where(RefreshToken.token_hash == h)).scalar_one_or_none()
-    if not rt:
-        return
-    rt.revoked_at = _now()
-    db.add(rt)
+    # Single UPDATE instead of SELECT + UPDATE; no-op for unknown/already revoked tokens.
+    db.execute(_REVOKE_STMT, {"h": hash_refresh_token(token), "now": _now()})
+    db.commit()
+
+
+def delete_expired_refresh_tokens(db: Session) -> int:
+    """
+    Janitor: removes every expired token, revoked or not (each rotation leaves a
+    revoked row behind). Range scan on ix_refresh_tokens_expires_at. Returns rows deleted.
+    Run via `python -m app.scripts.purge_refresh_tokens`.
+    """
+    res = db.execute(
+        delete(RefreshToken)
+        .where(RefreshToken.expires_at <= _now())
+        .execution_options(synchronize_session=False)
+    )
     db.commit()
+    return int(res.rowcount or 0)
 
 
 def validate_refresh_token(db: Session, token: str) -> Optional[RefreshToken]:
-    h = hash_refresh_token(token)
-    rt = db.execute(select(RefreshToken).where(RefreshToken.token_hash == h)).scalar_one_or_none()
-    if not rt:
-        return None
-    if rt.revoked_at is not None:
-        return None
-    if rt.expires_at <= _now():
-        return None
-    return rt
+    return db.execute(
+        _ACTIVE_LOOKUP_STMT, {"h": hash_refresh_token(token), "now": _now()}
+    ).scalar_one_or_none()
 
 
 def rotate_refresh_token(db: Session, old_token: str) -> Tuple[Optional[uuid.UUID], Optional[str]]:
@@ -88,12 +159,11 @@ def rotate_refresh_token(db: Session, old_token: str) -> Tuple[Optional[uuid.UUI
 
     user_id = existing.user_id
 
-    # revoke old
+    # revoke old + issue new in one transaction
     existing.revoked_at = _now()
     db.add(existing)
-    db.commit()
 
-    # issue new
     new_token = generate_refresh_token()
-    store_refresh_token(db, user_id=user_id, token=new_token)
+    store_refresh_token(db, user_id=user_id, token=new_token, commit=False)
+    db.commit()
     return user_id, new_token
\ No newline at end of file
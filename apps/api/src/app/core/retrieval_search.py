@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import re
+import threading
+import time
+from array import array
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 from sqlalchemy import text as sql_text
 from sqlalchemy.orm import Session
 
@@ -11,19 +16,41 @@ from app.core.config import settings
 from app.core.embeddings import embed_texts
 
 
-def _normalize_scores(pairs: List[Tuple[str, float]]) -> Dict[str, float]:
-    """
-    Normalize scores to 0..1 using min-max. If all equal, return 1.0 for all.
-    """
-    if not pairs:
-        return {}
-    scores = [s for _, s in pairs]
-    lo = min(scores)
-    hi = max(scores)
-    if hi == lo:
-        return {k: 1.0 for k, _ in pairs}
-    return {k: (s - lo) / (hi - lo) for k, s in pairs}
+# Query-embedding cache: repeated searches (pagination, re-runs, related views) skip
+# the embeddings API round-trip. LRU + TTL, keyed by (model, query); vectors are held
+# as compact double arrays (~12KB each at 1536 dims) instead of lists of floats.
+_QVEC_CACHE_MAX = 2048
+_QVEC_CACHE_TTL_S = 600.0
+_QVEC_CACHE: "OrderedDict[Tuple[str, str], Tuple[float, array]]" = OrderedDict()
+_QVEC_LOCK = threading.Lock()
+
+
+def _query_embedding(q: str) -> List[float]:
+    key = (settings.EMBEDDINGS_MODEL, q)
+    now = time.monotonic()
+    with _QVEC_LOCK:
+        hit = _QVEC_CACHE.get(key)
+        if hit is not None:
+            if now < hit[0]:
+                _QVEC_CACHE.move_to_end(key)
+                return hit[1].tolist()
+            del _QVEC_CACHE[key]
+
+    vec = embed_texts([q])[0]
+
+    with _QVEC_LOCK:
+        _QVEC_CACHE[key] = (now + _QVEC_CACHE_TTL_S, array("d", vec))
+        if len(_QVEC_CACHE) > _QVEC_CACHE_MAX:
+            _QVEC_CACHE.popitem(last=False)
+    return vec
+
 
+# hnsw.ef_search bounds for the vector CTE (pgvector default 40, hard max 1000).
+_HNSW_EF_SEARCH_MIN = 40
+_HNSW_EF_SEARCH_MAX = 1000
+
+# Reciprocal Rank Fusion constant (standard value from Cormack et al.)
+_RRF_K = 60
 
 _word_re = re.compile(r"[A-Za-z0-9_]+")
 
@@ -32,12 +59,11 @@ def _tokenize(s: str) -> List[str]:
     return [m.group(0).lower() for m in _word_re.finditer(s or "")]
 
 
-def _overlap_bonus(q: str, title: str, snippet: str) -> float:
+def _overlap_bonus_tokens(qt: set[str], title: str, snippet: str) -> float:
     """
-    Lightweight rerank signal (non-LLM):
-    Adds a small bonus based on token overlap between query and (title+snippet).
+    Lightweight rerank signal (non-LLM): token overlap between the query tokens
+    (tokenized once per request) and title+snippet, scaled 0..1.
     """
-    qt = set(_tokenize(q))
     if not qt:
         return 0.0
     tt = set(_tokenize(title))
@@ -117,168 +143,230 @@ def hybrid_retrieve(
     candidate_k = min(200, k * overfetch_k)
     sql_limit = candidate_k * 3
 
-    timeframe_sql = ""
     params: Dict[str, Any] = {"workspace_id": workspace_id, "q": q, "limit": sql_limit}
 
+    # Which optional filters are present selects one of the precompiled statements.
+    mask = 0
     if stypes:
-        timeframe_sql += " AND s.type = ANY(:source_types) "
+        mask |= _F_STYPES
         params["source_types"] = stypes
 
-    ts_expr = "COALESCE(d.source_updated_at, d.source_created_at, d.updated_at, d.created_at)"
-
     if start_ts is not None:
-        timeframe_sql += f" AND {ts_expr} >= :start_ts "
+        mask |= _F_START
         params["start_ts"] = start_ts
 
     if end_ts is not None:
-        timeframe_sql += f" AND {ts_expr} <= :end_ts "
+        mask |= _F_END
         params["end_ts"] = end_ts
 
-    # -----------------------------
-    # 1) FTS search
-    # -----------------------------
-    fts_rows = db.execute(
-        sql_text(
-            f"""
-            SELECT
-              c.id::text AS chunk_id,
-              d.id::text AS document_id,
-              d.source_id::text AS source_id,
-              d.title AS document_title,
-              c.chunk_index AS chunk_index,
-              left(c.text, 240) AS snippet,
-              c.meta AS meta,
-              ts_rank_cd(c.tsv_tsvector, websearch_to_tsquery('english', :q)) AS score_fts
-            FROM chunks c
-            JOIN documents d ON d.id = c.document_id
-            JOIN sources s ON s.id = d.source_id
-            WHERE d.workspace_id = :workspace_id
-              AND c.tsv_tsvector @@ websearch_to_tsquery('english', :q)
-              {timeframe_sql}
-            ORDER BY score_fts DESC
-            LIMIT :limit
-            """
-        ),
-        params,
-    ).mappings().all()
-
-    fts_scores = _normalize_scores([(r["chunk_id"], float(r["score_fts"])) for r in fts_rows])
-
-    # -----------------------------
-    # 2) Vector search (optional)
-    # -----------------------------
-    vec_rows = []
-    vec_scores: Dict[str, float] = {}
-
     can_embed = bool(settings.OPENAI_API_KEY) and bool(settings.EMBEDDINGS_MODEL)
 
+    q_vec: Optional[List[float]] = None
     if can_embed:
         try:
-            q_vec = embed_texts([q])[0]
-            vec_params = {
-                "workspace_id": workspace_id,
-                "qvec": q_vec,
-                "model": settings.EMBEDDINGS_MODEL,
-                "limit": sql_limit,
-            }
-
-            # include only relevant optional params
-            if stypes:
-                vec_params["source_types"] = stypes
-            if start_ts is not None:
-                vec_params["start_ts"] = start_ts
-            if end_ts is not None:
-                vec_params["end_ts"] = end_ts
-
-            vec_rows = db.execute(
-                sql_text(
-                    f"""
-                    SELECT
-                      c.id::text AS chunk_id,
-                      d.id::text AS document_id,
-                      d.source_id::text AS source_id,
-                      d.title AS document_title,
-                      c.chunk_index AS chunk_index,
-                      left(c.text, 240) AS snippet,
-                      c.meta AS meta,
-                      (1 - (e.embedding_vec <=> CAST(:qvec AS vector))) AS score_vec
-                    FROM embeddings e
-                    JOIN chunks c ON c.id = e.chunk_id
-                    JOIN documents d ON d.id = c.document_id
-                    JOIN sources s ON s.id = d.source_id
-                    WHERE d.workspace_id = :workspace_id
-                      AND e.model = :model
-                      AND e.embedding_vec IS NOT NULL
-                      {timeframe_sql}
-                    ORDER BY e.embedding_vec <=> CAST(:qvec AS vector) ASC
-                    LIMIT :limit
-                    """
-                ),
-                vec_params,
-            ).mappings().all()
-
-            vec_scores = _normalize_scores([(r["chunk_id"], float(r["score_vec"])) for r in vec_rows])
+            q_vec = _query_embedding(q)
         except Exception:
-            vec_rows = []
-            vec_scores = {}
-
-    # -----------------------------
-    # 3) Merge candidates by chunk_id
-    # -----------------------------
-    by_id: Dict[str, Dict[str, Any]] = {}
-
-    def upsert(row: Dict[str, Any], score_fts: float, score_vec: float):
-        cid = row["chunk_id"]
-        if cid not in by_id:
-            by_id[cid] = {
-                "chunk_id": cid,
-                "document_id": row["document_id"],
-                "source_id": row["source_id"],
-                "document_title": row["document_title"],
-                "chunk_index": int(row["chunk_index"]),
-                "snippet": row["snippet"],
-                "meta": row["meta"] or {},
-                "score_fts": 0.0,
-                "score_vec": 0.0,
-            }
-        by_id[cid]["score_fts"] = max(float(by_id[cid]["score_fts"]), float(score_fts))
-        by_id[cid]["score_vec"] = max(float(by_id[cid]["score_vec"]), float(score_vec))
-
-    for r in fts_rows:
-        upsert(r, fts_scores.get(r["chunk_id"], 0.0), 0.0)
-
-    for r in vec_rows:
-        upsert(r, 0.0, vec_scores.get(r["chunk_id"], 0.0))
-
-    # -----------------------------
-    # 4) Hybrid score + filter + rerank
-    # -----------------------------
-    items: List[Dict[str, Any]] = []
-    for _, item in by_id.items():
-        s_fts = float(item["score_fts"])
-        s_vec = float(item["score_vec"])
-        item["score_hybrid"] = alpha * s_vec + (1.0 - alpha) * s_fts
-
-        # helpful for debugging downstream
-        item["knobs"] = {
-            "min_score": float(min_score),
-            "overfetch_k": int(overfetch_k),
-            "rerank": bool(rerank),
-        }
-        items.append(item)
+            q_vec = None
 
-    # filter on min_score
-    items = [it for it in items if float(it.get("score_hybrid") or 0.0) >= float(min_score)]
+    # Rerank can lift candidates by at most 0.10, so it needs every candidate that
+    # passes min_score; without it the DB returns exactly k rows.
+    params["out_limit"] = sql_limit * 2 if rerank else k
+    params["alpha"] = alpha
+    params["min_score"] = min_score
 
-    # optional lightweight rerank
+    rows = None
+    if q_vec is not None:
+        try:
+            # Savepoint: a vector-side failure (e.g. pgvector missing) must not abort
+            # the caller's transaction; fall back to FTS-only below.
+            with db.begin_nested():
+                # HNSW returns at most ef_search (default 40) neighbours before the
+                # workspace/model/timeframe filters run; widen it to the candidate limit
+                # so small workspaces still get vector candidates. Transaction-local.
+                db.execute(
+                    sql_text("SELECT set_config('hnsw.ef_search', :ef, true)"),
+                    {"ef": str(min(_HNSW_EF_SEARCH_MAX, max(_HNSW_EF_SEARCH_MIN, sql_limit)))},
+                )
+                rows = db.execute(
+                    _HYBRID_STMTS[(mask, True)],
+                    {**params, "qvec": q_vec, "model": settings.EMBEDDINGS_MODEL},
+                ).mappings().all()
+        except Exception:
+            rows = None
+
+    if rows is None:
+        rows = db.execute(_HYBRID_STMTS[(mask, False)], params).mappings().all()
+
+    # min_score/overfetch_k were normalized to float/int above.
+    knobs = {
+        "min_score": min_score,
+        "overfetch_k": overfetch_k,
+        "rerank": bool(rerank),
+    }
+    items: List[Dict[str, Any]] = [
+        {
+            "chunk_id": r["chunk_id"],
+            "document_id": r["document_id"],
+            "source_id": r["source_id"],
+            "document_title": r["document_title"],
+            "chunk_index": r["chunk_index"],
+            "snippet": r["snippet"],
+            "meta": r["meta"] or {},
+            "score_fts": r["score_fts"],
+            "score_vec": r["score_vec"],
+            "score_hybrid": r["score_hybrid"],
+            # helpful for debugging downstream
+            "knobs": dict(knobs),
+        }
+        for r in rows
+    ]
+
+    # optional lightweight rerank: bonus per candidate, then a vectorized blend and
+    # partial top-k (argpartition) instead of a full sort over every candidate.
     if rerank and items:
-        for it in items:
-            bonus = _overlap_bonus(q, str(it.get("document_title") or ""), str(it.get("snippet") or ""))
-            it["score_rerank_bonus"] = float(bonus)
-            it["score_final"] = float(it["score_hybrid"]) + 0.10 * float(bonus)
-        items.sort(key=lambda x: float(x.get("score_final") or 0.0), reverse=True)
-    else:
-        items.sort(key=lambda x: float(x.get("score_hybrid") or 0.0), reverse=True)
+        qt = set(_tokenize(q))
+        n = len(items)
+        bonus = np.fromiter(
+            (_overlap_bonus_tokens(qt, str(it.get("document_title") or ""), str(it.get("snippet") or "")) for it in items),
+            dtype=np.float64,
+            count=n,
+        )
+        final = np.fromiter((it["score_hybrid"] for it in items), dtype=np.float64, count=n) + 0.10 * bonus
+        for it, b, f in zip(items, bonus.tolist(), final.tolist()):
+            it["score_rerank_bonus"] = b
+            it["score_final"] = f
+
+        top = np.argpartition(-final, k - 1)[:k] if n > k else np.arange(n)
+        top = top[np.argsort(-final[top], kind="stable")]
+        return [items[i] for i in top.tolist()]
 
     # cap and return
-    return items[:k]
\ No newline at end of file
+    return items[:k]
+
+
+# Optional filter bits for _filter_sql / _HYBRID_STMTS.
+_F_STYPES = 4
+_F_START = 2
+_F_END = 1
+
+_TS_EXPR = "COALESCE(d.source_updated_at, d.source_created_at, d.updated_at, d.created_at)"
+
+
+def _filter_sql(mask: int) -> str:
+    out = ""
+    if mask & _F_STYPES:
+        out += " AND s.type = ANY(:source_types) "
+    if mask & _F_START:
+        out += f" AND {_TS_EXPR} >= :start_ts "
+    if mask & _F_END:
+        out += f" AND {_TS_EXPR} <= :end_ts "
+    return out
+
+
+def _hybrid_sql(timeframe_sql: str, *, with_vec: bool) -> str:
+    """
+    FTS + vector candidates fused in one statement: each side is scored by Reciprocal
+    Rank Fusion, FULL OUTER JOINed on chunk_id, blended as alpha*vec + (1-alpha)*fts,
+    filtered on min_score, and only the surviving rows are joined back for
+    chunk/document metadata.
+
+    RRF is scaled by (K+1) so rank 1 scores 1.0 and scores stay in (0, 1] like the
+    min_score knob expects: (K+1)/(K+rank). Ties share a rank.
+    """
+    if with_vec:
+        # fp16 copy (embedding_vec_h, generated from embedding_vec): half the bytes
+        # scanned/compared, HNSW-indexed; ranking precision is unaffected in practice.
+        vec_cte = f"""
+        vec_raw AS (
+            SELECT e.chunk_id, (1 - (e.embedding_vec_h <=> CAST(:qvec AS halfvec(1536))))::float8 AS raw
+            FROM embeddings e
+            JOIN chunks c ON c.id = e.chunk_id
+            JOIN documents d ON d.id = c.document_id
+            JOIN sources s ON s.id = d.source_id
+            WHERE d.workspace_id = :workspace_id
+              AND e.model = :model
+              AND e.embedding_vec_h IS NOT NULL
+              {timeframe_sql}
+            ORDER BY e.embedding_vec_h <=> CAST(:qvec AS halfvec(1536)) ASC
+            LIMIT :limit
+        ),
+        vec AS (
+            SELECT chunk_id, MAX(score_vec) AS score_vec
+            FROM (
+                SELECT chunk_id,
+                       ({_RRF_K + 1}.0 / ({_RRF_K} + rank() OVER (ORDER BY raw DESC)))::float8 AS score_vec
+                FROM vec_raw
+            ) v
+            GROUP BY chunk_id
+        )"""
+    else:
+        vec_cte = """
+        vec AS (
+            SELECT NULL::uuid AS chunk_id, NULL::float8 AS score_vec WHERE false
+        )"""
+
+    return f"""
+    WITH
+        tsq AS (
+            SELECT websearch_to_tsquery('english', :q) AS query
+        ),
+        fts_raw AS (
+            SELECT c.id AS chunk_id, ts_rank_cd(c.tsv_tsvector, tsq.query)::float8 AS raw
+            FROM tsq
+            CROSS JOIN chunks c
+            JOIN documents d ON d.id = c.document_id
+            JOIN sources s ON s.id = d.source_id
+            WHERE d.workspace_id = :workspace_id
+              AND c.tsv_tsvector @@ tsq.query
+              {timeframe_sql}
+            ORDER BY raw DESC
+            LIMIT :limit
+        ),
+        fts AS (
+            SELECT chunk_id,
+                   ({_RRF_K + 1}.0 / ({_RRF_K} + rank() OVER (ORDER BY raw DESC)))::float8 AS score_fts
+            FROM fts_raw
+        ),
+        {vec_cte},
+        scored AS (
+            SELECT chunk_id, score_fts, score_vec,
+                   CAST(:alpha AS float8) * score_vec + (1 - CAST(:alpha AS float8)) * score_fts AS score_hybrid
+            FROM (
+                SELECT COALESCE(fts.chunk_id, vec.chunk_id) AS chunk_id,
+                       COALESCE(fts.score_fts, 0.0) AS score_fts,
+                       COALESCE(vec.score_vec, 0.0) AS score_vec
+                FROM fts
+                FULL OUTER JOIN vec ON vec.chunk_id = fts.chunk_id
+            ) m
+        ),
+        best AS (
+            SELECT * FROM scored
+            WHERE score_hybrid >= :min_score
+            ORDER BY score_hybrid DESC
+            LIMIT :out_limit
+        )
+    SELECT
+      c.id::text AS chunk_id,
+      d.id::text AS document_id,
+      d.source_id::text AS source_id,
+      d.title AS document_title,
+      c.chunk_index AS chunk_index,
+      c.snippet AS snippet,
+      -- ingest bookkeeping keys (content hash / chunking params) never leave the DB
+      c.meta - 'raw_text_sha256' - 'chunking' AS meta,
+      t.score_fts, t.score_vec, t.score_hybrid
+    FROM best t
+    JOIN chunks c ON c.id = t.chunk_id
+    JOIN documents d ON d.id = c.document_id
+    ORDER BY t.score_hybrid DESC
+    """
+
+
+# Every filter shape (source types? x start? x end?) x (with/without vectors), built once
+# at import: no per-request SQL assembly, and each shape keeps a stable statement text
+# (and so a stable server-side prepared statement).
+_HYBRID_STMTS = {
+    (mask, with_vec): sql_text(_hybrid_sql(_filter_sql(mask), with_vec=with_vec))
+    for mask in range(8)
+    for with_vec in (False, True)
+}
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import threading
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from fastapi import Request
-from jose import jwt
-from sqlalchemy.orm import Session
+from jose import jwk, jwt
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from app.core.config import settings
 from app.db.models import User
@@ -16,6 +19,23 @@ ACCESS_COOKIE_PATH = "/"
 ACCESS_COOKIE_HTTPONLY = True
 
 
+# python-jose rebuilds a key object from the raw secret on every encode/decode unless
+# handed a jwk Key; build it once per (secret, alg) and reuse it.
+_JWT_KEY: Optional[Tuple[str, str, Any]] = None
+_JWT_KEY_LOCK = threading.Lock()
+
+
+def _jwt_key() -> Any:
+    global _JWT_KEY
+    secret, alg = settings.JWT_SECRET, settings.JWT_ALG
+    cached = _JWT_KEY
+    if cached is not None and cached[0] == secret and cached[1] == alg:
+        return cached[2]
+    with _JWT_KEY_LOCK:
+        _JWT_KEY = (secret, alg, jwk.construct(secret, alg))
+        return _JWT_KEY[2]
+
+
 def create_access_token(*, user_id: uuid.UUID, email: str) -> str:
     now = datetime.now(timezone.utc)
     exp = now + timedelta(minutes=settings.ACCESS_EXPIRES_MINUTES)
@@ -27,16 +47,88 @@ def create_access_token(*, user_id: uuid.UUID, email: str) -> str:
         "exp": int(exp.timestamp()),
         "type": "access",
     }
-    return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALG)
+    return jwt.encode(payload, _jwt_key(), algorithm=settings.JWT_ALG)
+
+
+# Verified access-token payloads keyed by the token string: a token's claims are
+# fixed until `exp`, so repeat requests skip base64 + HMAC verify + JSON parse.
+# Entries are (secret, exp, payload); LRU-bounded.
+_DECODE_CACHE_MAX = 4096
+_DECODE_CACHE: "OrderedDict[str, Tuple[str, float, Dict[str, Any]]]" = OrderedDict()
+_DECODE_LOCK = threading.Lock()
 
 
 def decode_access_token(token: str) -> Dict[str, Any]:
-    payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALG])
+    secret = settings.JWT_SECRET
+    with _DECODE_LOCK:
+        hit = _DECODE_CACHE.get(token)
+        if hit is not None:
+            if hit[0] == secret and time.time() < hit[1]:
+                _DECODE_CACHE.move_to_end(token)
+                return dict(hit[2])
+            del _DECODE_CACHE[token]
+
+    payload = jwt.decode(token, _jwt_key(), algorithms=[settings.JWT_ALG])
     if payload.get("type") != "access":
         raise ValueError("Not an access token")
+
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        with _DECODE_LOCK:
+            _DECODE_CACHE[token] = (secret, float(exp), dict(payload))
+            if len(_DECODE_CACHE) > _DECODE_CACHE_MAX:
+                _DECODE_CACHE.popitem(last=False)
     return payload
 
 
+# Current-user cache: every authenticated request otherwise does a PK SELECT on users.
+# Holds detached column snapshots (never a session's own instance); each request gets
+# its own copy via merge(load=False), which does not hit the DB. Short TTL bounds
+# staleness; invalidate_user_cache() drops an entry after the user row is changed.
+_USER_CACHE_MAX = 10_000
+_USER_CACHE_TTL_S = 30.0
+_USER_CACHE: "OrderedDict[uuid.UUID, Tuple[float, User]]" = OrderedDict()
+_USER_LOCK = threading.Lock()
+
+
+def invalidate_user_cache(user_id: uuid.UUID) -> None:
+    with _USER_LOCK:
+        _USER_CACHE.pop(user_id, None)
+
+
+def _get_user_cached(db: Session, user_id: uuid.UUID) -> Optional[User]:
+    now = time.monotonic()
+    snapshot: Optional[User] = None
+    with _USER_LOCK:
+        hit = _USER_CACHE.get(user_id)
+        if hit is not None:
+            if now < hit[0]:
+                _USER_CACHE.move_to_end(user_id)
+                snapshot = hit[1]
+            else:
+                del _USER_CACHE[user_id]
+    if snapshot is not None:
+        return db.merge(snapshot, load=False)
+
+    user = db.get(User, user_id)
+    if user is None:
+        return None
+
+    snapshot = User(
+        id=user.id,
+        email=user.email,
+        password_hash=user.password_hash,
+        created_at=user.created_at,
+        updated_at=user.updated_at,
+    )
+    make_transient_to_detached(snapshot)
+    with _USER_LOCK:
+        _USER_CACHE[user_id] = (now + _USER_CACHE_TTL_S, snapshot)
+        if len(_USER_CACHE) > _USER_CACHE_MAX:
+            _USER_CACHE.popitem(last=False)
+    return user
+
+
 def get_access_token_from_request(request: Request) -> Optional[str]:
     return request.cookies.get(ACCESS_COOKIE_NAME)
 
@@ -51,6 +143,6 @@ def get_current_user_from_cookie(db: Session, request: Request) -> Optional[User
         user_id = payload.get("sub")
         if not user_id:
             return None
-        return db.get(User, uuid.UUID(user_id))
+        return _get_user_cached(db, uuid.UUID(user_id))
     except Exception:
         return None
\ No newline at end of file
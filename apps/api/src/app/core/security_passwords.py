@@ -1,6 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+
 import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+# argon2id; parameters are encoded in each hash, so they can be retuned later and
+# existing hashes keep verifying (check_needs_rehash upgrades them on login).
+_HASHER = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=2)
+
+_ARGON2_PREFIX = "$argon2"
 
 
 def _ensure_bcrypt_limit(password: str) -> bytes:
@@ -11,15 +21,43 @@ def _ensure_bcrypt_limit(password: str) -> bytes:
 
 
 def hash_password(password: str) -> str:
-    pw_bytes = _ensure_bcrypt_limit(password)
-    salt = bcrypt.gensalt(rounds=12)
-    hashed = bcrypt.hashpw(pw_bytes, salt)
-    return hashed.decode("utf-8")
+    return _HASHER.hash(password)
 
 
 def verify_password(password: str, password_hash: str) -> bool:
+    if password_hash.startswith(_ARGON2_PREFIX):
+        try:
+            return _HASHER.verify(password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+
+    # Legacy bcrypt hashes (verify only); checkpw raises ValueError on a malformed hash
     try:
         pw_bytes = _ensure_bcrypt_limit(password)
+        return bcrypt.checkpw(pw_bytes, password_hash.encode("utf-8"))
     except ValueError:
         return False
-    return bcrypt.checkpw(pw_bytes, password_hash.encode("utf-8"))
\ No newline at end of file
+
+
+def password_needs_rehash(password_hash: str) -> bool:
+    """
+    True for legacy bcrypt hashes and argon2 hashes with outdated parameters.
+    Call after a successful verify_password to upgrade the stored hash.
+    """
+    if not password_hash.startswith(_ARGON2_PREFIX):
+        return True
+    try:
+        return _HASHER.check_needs_rehash(password_hash)
+    except InvalidHashError:
+        return True
+
+
+# Async variants for `async def` callers: the KDF runs in a worker thread (argon2-cffi
+# and bcrypt release the GIL), so the event loop keeps serving other requests.
+# Sync `def` endpoints already run in FastAPI's threadpool and use the plain versions.
+async def ahash_password(password: str) -> str:
+    return await asyncio.to_thread(hash_password, password)
+
+
+async def averify_password(password: str, password_hash: str) -> bool:
+    return await asyncio.to_thread(verify_password, password, password_hash)
@@ -4,17 +4,49 @@ import uuid
 from datetime import datetime
 from typing import Any, Dict, Optional, List
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, Integer, Float, func, Boolean
+from sqlalchemy import (
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    Integer,
+    Float,
+    REAL,
+    func,
+    Boolean,
+    CheckConstraint,
+    LargeBinary,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
-from app.db.base import Base
+from app.db.base import Base, uuid7
+
+# Max excerpt length fed into LLM prompts (keeps prompts bounded)
+EVIDENCE_PROMPT_EXCERPT_CHARS = 600
+
+# Native Postgres ENUMs for closed vocabularies (4 bytes/row, integer compares);
+# the types are created by migration. Adding a value needs ALTER TYPE ... ADD VALUE.
+# Free-form statuses (runs, pipelines, schedules, action items) stay strings.
+WORKSPACE_ROLE_ENUM = Enum("admin", "member", "viewer", name="workspace_role")
+AGENT_VERSION_STATUS_ENUM = Enum("draft", "published", "archived", name="agent_version_status")
+ARTIFACT_STATUS_ENUM = Enum("draft", "in_review", "final", name="artifact_status")
+REVIEW_STATE_ENUM = Enum("requested", "approved", "rejected", name="review_state")
+LOG_LEVEL_ENUM = Enum("debug", "info", "warn", "error", name="log_level")
+CONNECTOR_STATUS_ENUM = Enum("connected", "disconnected", name="connector_status")
+INGESTION_JOB_STATUS_ENUM = Enum("queued", "running", "success", "failed", name="ingestion_job_status")
+# Shared by pipeline_runs and pipeline_steps.
+PIPELINE_STATUS_ENUM = Enum("created", "running", "completed", "failed", name="pipeline_status")
 
 
 class User(Base):
     __tablename__ = "users"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     email: Mapped[str] = mapped_column(String(320), unique=True, index=True, nullable=False)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -24,16 +56,21 @@ class User(Base):
         DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
     )
 
-    workspaces: Mapped[List["Workspace"]] = relationship(back_populates="owner", cascade="all, delete-orphan")
-    refresh_tokens: Mapped[List["RefreshToken"]] = relationship(back_populates="user", cascade="all, delete-orphan")
+    workspaces: Mapped[List["Workspace"]] = relationship(
+        back_populates="owner", cascade="all, delete-orphan", passive_deletes=True
+    )
+    refresh_tokens: Mapped[List["RefreshToken"]] = relationship(
+        back_populates="user", cascade="all, delete-orphan", passive_deletes=True
+    )
 
     workspace_memberships: Mapped[List["WorkspaceMember"]] = relationship(
-        back_populates="user", cascade="all, delete-orphan"
+        back_populates="user", cascade="all, delete-orphan", passive_deletes=True
     )
 
     created_action_items: Mapped[List["ActionItem"]] = relationship(
         back_populates="created_by_user",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         foreign_keys="ActionItem.created_by_user_id",
     )
 
@@ -53,12 +90,12 @@ class User(Base):
 class Workspace(Base):
     __tablename__ = "workspaces"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(200), nullable=False)
 
     template_admin_json: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False, default=dict)
     owner_user_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -67,21 +104,23 @@ class Workspace(Base):
     )
 
     owner: Mapped["User"] = relationship(back_populates="workspaces")
-    runs: Mapped[List["Run"]] = relationship(back_populates="workspace", cascade="all, delete-orphan")
+    runs: Mapped[List["Run"]] = relationship(
+        back_populates="workspace", cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
+    )
 
     members: Mapped[List["WorkspaceMember"]] = relationship(
-        back_populates="workspace", cascade="all, delete-orphan"
+        back_populates="workspace", cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
     )
 
     pipeline_templates: Mapped[List["PipelineTemplate"]] = relationship(
-        back_populates="workspace", cascade="all, delete-orphan"
+        back_populates="workspace", cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
     )
     pipeline_runs: Mapped[List["PipelineRun"]] = relationship(
-        back_populates="workspace", cascade="all, delete-orphan"
+        back_populates="workspace", cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
     )
 
     action_items: Mapped[List["ActionItem"]] = relationship(
-        back_populates="workspace", cascade="all, delete-orphan"
+        back_populates="workspace", cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
     )
 
     approvals_json: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False, default=dict)
@@ -91,37 +130,43 @@ class Workspace(Base):
     rbac_json: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False, default=dict)
 
     schedules: Mapped[List["Schedule"]] = relationship(
-        back_populates="workspace", cascade="all, delete-orphan"
+        back_populates="workspace", cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
     )
 
     agent_bases: Mapped[List["AgentBase"]] = relationship(
-        back_populates="workspace", cascade="all, delete-orphan"
+        back_populates="workspace", cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
     )
 
-    connectors: Mapped[List["Connector"]] = relationship(back_populates="workspace", cascade="all, delete-orphan")
-    ingestion_jobs: Mapped[List["IngestionJob"]] = relationship(back_populates="workspace", cascade="all, delete-orphan")
+    connectors: Mapped[List["Connector"]] = relationship(
+        back_populates="workspace", cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
+    )
+    ingestion_jobs: Mapped[List["IngestionJob"]] = relationship(
+        back_populates="workspace", cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
+    )
     retrieval_requests: Mapped[List["RetrievalRequest"]] = relationship(
-        back_populates="workspace", cascade="all, delete-orphan"
+        back_populates="workspace", cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
     )
 
     governance_events: Mapped[List["GovernanceEvent"]] = relationship(
-        back_populates="workspace", cascade="all, delete-orphan"
+        back_populates="workspace", cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
     )
 
 
 class WorkspaceMember(Base):
     __tablename__ = "workspace_members"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (Index("ux_workspace_members_workspace_user", "workspace_id", "user_id", unique=True),)
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     workspace_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
-    role: Mapped[str] = mapped_column(String(16), nullable=False, default="member")  # admin|member|viewer
+    role: Mapped[str] = mapped_column(WORKSPACE_ROLE_ENUM, nullable=False, default="member")
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
@@ -135,7 +180,7 @@ class WorkspaceMember(Base):
 class GovernanceEvent(Base):
     __tablename__ = "governance_events"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     workspace_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -164,13 +209,14 @@ class GovernanceEvent(Base):
 class AgentBase(Base):
     __tablename__ = "agent_bases"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (UniqueConstraint("workspace_id", "key", name="uq_agent_bases_workspace_key"),)
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     workspace_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("workspaces.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     key: Mapped[str] = mapped_column(String(120), nullable=False)
@@ -190,23 +236,27 @@ class AgentBase(Base):
     )
 
     workspace: Mapped["Workspace"] = relationship(back_populates="agent_bases")
-    versions: Mapped[List["AgentVersion"]] = relationship(back_populates="agent_base", cascade="all, delete-orphan")
+    versions: Mapped[List["AgentVersion"]] = relationship(
+        back_populates="agent_base", cascade="all, delete-orphan", passive_deletes=True,
+        order_by="AgentVersion.version.desc()",
+    )
 
 
 class AgentVersion(Base):
     __tablename__ = "agent_versions"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (UniqueConstraint("agent_base_id", "version", name="uq_agent_versions_base_version"),)
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     agent_base_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("agent_bases.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     version: Mapped[int] = mapped_column(Integer, nullable=False)
-    status: Mapped[str] = mapped_column(String(16), nullable=False, default="draft")  # draft|published|archived
+    status: Mapped[str] = mapped_column(AGENT_VERSION_STATUS_ENUM, nullable=False, default="draft")
 
     definition_json: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False, default=dict)
 
@@ -244,10 +294,12 @@ class AgentDefinition(Base):
 class Run(Base):
     __tablename__ = "runs"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (Index("ix_runs_ws_created", "workspace_id", "created_at"),)
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     workspace_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("workspaces.id"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False
     )
     agent_id: Mapped[str] = mapped_column(String(64), ForeignKey("agent_definitions.id"), nullable=False, index=True)
 
@@ -268,22 +320,40 @@ class Run(Base):
     workspace: Mapped["Workspace"] = relationship(back_populates="runs")
     agent: Mapped["AgentDefinition"] = relationship(back_populates="runs")
 
-    artifacts: Mapped[List["Artifact"]] = relationship(back_populates="run", cascade="all, delete-orphan")
-    evidence_items: Mapped[List["Evidence"]] = relationship(back_populates="run", cascade="all, delete-orphan")
-    logs: Mapped[List["RunLog"]] = relationship(back_populates="run", cascade="all, delete-orphan")
+    artifacts: Mapped[List["Artifact"]] = relationship(
+        back_populates="run", cascade="all, delete-orphan", passive_deletes=True, lazy="raise",
+        order_by="Artifact.created_at.desc()",
+    )
+    evidence_items: Mapped[List["Evidence"]] = relationship(
+        back_populates="run", cascade="all, delete-orphan", passive_deletes=True, lazy="raise",
+        order_by="Evidence.created_at.desc()",
+    )
+    logs: Mapped[List["RunLog"]] = relationship(
+        back_populates="run", cascade="all, delete-orphan", passive_deletes=True, lazy="raise",
+        order_by="RunLog.created_at.desc()",
+    )
     status_events: Mapped[List["RunStatusEvent"]] = relationship(
-        back_populates="run", cascade="all, delete-orphan"
+        back_populates="run", cascade="all, delete-orphan", passive_deletes=True, lazy="raise",
+        order_by="RunStatusEvent.created_at",
     )
 
-    pipeline_steps: Mapped[List["PipelineStep"]] = relationship(back_populates="run")
+    pipeline_steps: Mapped[List["PipelineStep"]] = relationship(
+        back_populates="run", lazy="raise"
+    )
 
 
 class Artifact(Base):
     __tablename__ = "artifacts"
+    # Serves both run_id lookups and "latest version of a logical_key in a run".
+    __table_args__ = (
+        Index("uq_artifacts_run_logical_version", "run_id", "logical_key", "version", unique=True),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
-    run_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("runs.id"), nullable=False, index=True)
+    run_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("runs.id", ondelete="CASCADE"), nullable=False
+    )
 
     type: Mapped[str] = mapped_column(String(64), nullable=False)
     title: Mapped[str] = mapped_column(String(240), nullable=False, default="Untitled")
@@ -292,7 +362,7 @@ class Artifact(Base):
     logical_key: Mapped[str] = mapped_column(String(64), nullable=False)
     version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
 
-    status: Mapped[str] = mapped_column(String(32), nullable=False, default="draft")  # draft|in_review|final
+    status: Mapped[str] = mapped_column(ARTIFACT_STATUS_ENUM, nullable=False, default="draft")
 
     assigned_to_user_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
@@ -306,7 +376,8 @@ class Artifact(Base):
     )
 
     comments: Mapped[List["ArtifactComment"]] = relationship(
-        back_populates="artifact", cascade="all, delete-orphan"
+        back_populates="artifact", cascade="all, delete-orphan", passive_deletes=True, lazy="raise",
+        order_by="ArtifactComment.created_at",
     )
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -316,22 +387,26 @@ class Artifact(Base):
 
     run: Mapped["Run"] = relationship(back_populates="artifacts")
 
-    reviews: Mapped[List["ArtifactReview"]] = relationship(back_populates="artifact", cascade="all, delete-orphan")
+    reviews: Mapped[List["ArtifactReview"]] = relationship(
+        back_populates="artifact", cascade="all, delete-orphan", passive_deletes=True, lazy="raise",
+        order_by="ArtifactReview.requested_at.desc()",
+    )
 
 
 class ArtifactReview(Base):
     __tablename__ = "artifact_reviews"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (Index("ix_artifact_reviews_artifact_requested", "artifact_id", "requested_at"),)
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     artifact_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("artifacts.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
-    state: Mapped[str] = mapped_column(String(16), nullable=False, default="requested")  # requested|approved|rejected
+    state: Mapped[str] = mapped_column(REVIEW_STATE_ENUM, nullable=False, default="requested")
 
     requested_by_user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -356,30 +431,50 @@ class ArtifactReview(Base):
 
 class Evidence(Base):
     __tablename__ = "evidence"
+    # Per-run listing ordered by created_at is an index range scan (no sort).
+    __table_args__ = (Index("ix_evidence_run_created", "run_id", "created_at"),)
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
-    run_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("runs.id"), nullable=False, index=True)
+    run_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("runs.id", ondelete="CASCADE"), nullable=False
+    )
 
     kind: Mapped[str] = mapped_column(String(32), nullable=False)
     source_name: Mapped[str] = mapped_column(String(120), nullable=False, default="manual")
     source_ref: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     excerpt: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    # Prompt-ready excerpt (trimmed + bounded), computed once on write for format_evidence_for_prompt
+    excerpt_prompt: Mapped[str] = mapped_column(Text, nullable=False, default="")
     meta: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False, default=dict)
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     run: Mapped["Run"] = relationship(back_populates="evidence_items")
 
+    @validates("excerpt")
+    def _sync_excerpt_prompt(self, _key: str, value: Optional[str]) -> Optional[str]:
+        self.excerpt_prompt = (value or "").strip()[:EVIDENCE_PROMPT_EXCERPT_CHARS]
+        return value
+
 
 class RefreshToken(Base):
     __tablename__ = "refresh_tokens"
+    # Only live (unrevoked) tokens are in the token_hash index: lookups and revokes always filter on
+    # revoked_at IS NULL, and revoked history doesn't bloat the hot index.
+    __table_args__ = (
+        Index("ux_refresh_tokens_live", "token_hash", unique=True, postgresql_where=text("revoked_at IS NULL")),
+        # Purge of expired rows (revoked or not).
+        Index("ix_refresh_tokens_expires_at", "expires_at"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
-    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
 
-    token_hash: Mapped[str] = mapped_column(String(64), nullable=False, unique=True, index=True)
+    token_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False)
     expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     revoked_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
@@ -390,17 +485,18 @@ class RefreshToken(Base):
 
 class RunLog(Base):
     __tablename__ = "run_logs"
+    # Per-run timeline ordered by created_at is an index range scan (no sort).
+    __table_args__ = (Index("ix_run_logs_run_created", "run_id", "created_at"),)
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     run_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("runs.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
-    level: Mapped[str] = mapped_column(String(16), nullable=False, default="info")
+    level: Mapped[str] = mapped_column(LOG_LEVEL_ENUM, nullable=False, default="info")
     message: Mapped[str] = mapped_column(Text, nullable=False, default="")
     meta: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False, default=dict)
 
@@ -412,7 +508,7 @@ class RunLog(Base):
 class RunStatusEvent(Base):
     __tablename__ = "run_status_events"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     run_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -439,15 +535,17 @@ class RunStatusEvent(Base):
 class Connector(Base):
     __tablename__ = "connectors"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (UniqueConstraint("workspace_id", "type", "name", name="uq_connectors_ws_type_name"),)
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     workspace_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False
     )
 
     type: Mapped[str] = mapped_column(String(32), nullable=False)  # docs|jira|github|slack|support|analytics
     name: Mapped[str] = mapped_column(String(200), nullable=False, default="")
-    status: Mapped[str] = mapped_column(String(32), nullable=False, default="disconnected")  # connected|disconnected
+    status: Mapped[str] = mapped_column(CONNECTOR_STATUS_ENUM, nullable=False, default="disconnected")
     config: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False, default=dict)
 
     last_sync_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -459,16 +557,20 @@ class Connector(Base):
     )
 
     workspace: Mapped["Workspace"] = relationship(back_populates="connectors")
-    ingestion_jobs: Mapped[List["IngestionJob"]] = relationship(back_populates="connector")
+    ingestion_jobs: Mapped[List["IngestionJob"]] = relationship(
+        back_populates="connector", lazy="raise"
+    )
 
 
 class IngestionJob(Base):
     __tablename__ = "ingestion_jobs"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (Index("ix_ingestion_jobs_ws_created", "workspace_id", "created_at"),)
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     workspace_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False
     )
     connector_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True), ForeignKey("connectors.id", ondelete="SET NULL"), nullable=True, index=True
@@ -478,7 +580,7 @@ class IngestionJob(Base):
     )
 
     kind: Mapped[str] = mapped_column(String(64), nullable=False, default="manual")  # docs_sync|jira_sync|manual_ingest
-    status: Mapped[str] = mapped_column(String(32), nullable=False, default="queued")  # queued|running|success|failed
+    status: Mapped[str] = mapped_column(INGESTION_JOB_STATUS_ENUM, nullable=False, default="queued")
 
     timeframe: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False, default=dict)
     params: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False, default=dict)
@@ -503,10 +605,12 @@ class IngestionJob(Base):
 class RetrievalRequest(Base):
     __tablename__ = "retrieval_requests"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (Index("ix_retrieval_requests_ws_created", "workspace_id", "created_at"),)
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     workspace_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False
     )
     created_by_user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True
@@ -523,17 +627,20 @@ class RetrievalRequest(Base):
 
     workspace: Mapped["Workspace"] = relationship(back_populates="retrieval_requests")
     items: Mapped[List["RetrievalRequestItem"]] = relationship(
-        back_populates="request", cascade="all, delete-orphan"
+        back_populates="request", cascade="all, delete-orphan", passive_deletes=True, lazy="raise",
+        order_by="RetrievalRequestItem.rank",
     )
 
 
 class RetrievalRequestItem(Base):
     __tablename__ = "retrieval_request_items"
+    # Items are listed per request in rank order: an ordered range scan, no sort.
+    __table_args__ = (Index("ix_rri_request_rank", "request_id", "rank"),)
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     request_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("retrieval_requests.id", ondelete="CASCADE"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("retrieval_requests.id", ondelete="CASCADE"), nullable=False
     )
 
     rank: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -551,9 +658,10 @@ class RetrievalRequestItem(Base):
     snippet: Mapped[str] = mapped_column(Text, nullable=False, default="")
     meta: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False, default=dict)
 
-    score_fts: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
-    score_vec: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
-    score_hybrid: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    # float4: ranking scores don't need double precision, and there are k rows per request
+    score_fts: Mapped[float] = mapped_column(REAL, nullable=False, default=0.0)
+    score_vec: Mapped[float] = mapped_column(REAL, nullable=False, default=0.0)
+    score_hybrid: Mapped[float] = mapped_column(REAL, nullable=False, default=0.0)
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
@@ -565,9 +673,11 @@ class RetrievalRequestItem(Base):
 # ------------------------
 class PipelineTemplate(Base):
     __tablename__ = "pipeline_templates"
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # ON CONFLICT target for template seeding; also serves workspace_id lookups.
+    __table_args__ = (Index("uq_pipeline_templates_workspace_name", "workspace_id", "name", unique=True),)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     workspace_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("workspaces.id"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False
     )
     name: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False, default="")
@@ -577,22 +687,25 @@ class PipelineTemplate(Base):
         DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
     )
     workspace: Mapped["Workspace"] = relationship(back_populates="pipeline_templates")
-    runs: Mapped[List["PipelineRun"]] = relationship(back_populates="template", cascade="all, delete-orphan")
+    runs: Mapped[List["PipelineRun"]] = relationship(
+        back_populates="template", cascade="all, delete-orphan", passive_deletes=True
+    )
 
 
 class PipelineRun(Base):
     __tablename__ = "pipeline_runs"
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (Index("ix_pipeline_runs_ws_created", "workspace_id", "created_at"),)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     workspace_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("workspaces.id"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False
     )
     template_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("pipeline_templates.id"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("pipeline_templates.id", ondelete="CASCADE"), nullable=False, index=True
     )
     created_by_user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True
     )
-    status: Mapped[str] = mapped_column(String(32), nullable=False, default="created")
+    status: Mapped[str] = mapped_column(PIPELINE_STATUS_ENUM, nullable=False, default="created")
     current_step_index: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     input_payload: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False, default=dict)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -601,21 +714,27 @@ class PipelineRun(Base):
     )
     workspace: Mapped["Workspace"] = relationship(back_populates="pipeline_runs")
     template: Mapped["PipelineTemplate"] = relationship(back_populates="runs")
-    steps: Mapped[List["PipelineStep"]] = relationship(back_populates="pipeline_run", cascade="all, delete-orphan")
+    steps: Mapped[List["PipelineStep"]] = relationship(
+        back_populates="pipeline_run", cascade="all, delete-orphan", passive_deletes=True, lazy="raise",
+        order_by="PipelineStep.step_index",
+    )
 
 
 class PipelineStep(Base):
     __tablename__ = "pipeline_steps"
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (Index("ix_pipeline_steps_run_idx", "pipeline_run_id", "step_index"),)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     pipeline_run_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("pipeline_runs.id"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("pipeline_runs.id", ondelete="CASCADE"), nullable=False
     )
     step_index: Mapped[int] = mapped_column(Integer, nullable=False)
     step_name: Mapped[str] = mapped_column(String(200), nullable=False, default="")
     agent_id: Mapped[str] = mapped_column(String(64), nullable=False)
     input_payload: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False, default=dict)
-    status: Mapped[str] = mapped_column(String(32), nullable=False, default="created")
-    run_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("runs.id"), nullable=True, index=True)
+    status: Mapped[str] = mapped_column(PIPELINE_STATUS_ENUM, nullable=False, default="created")
+    run_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("runs.id", ondelete="SET NULL"), nullable=True, index=True
+    )
     started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -626,7 +745,17 @@ class PipelineStep(Base):
 class ActionItem(Base):
     __tablename__ = "action_items"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('queued', 'approved', 'rejected', 'cancelled')", name="ck_action_items_status"
+        ),
+        # Approval inbox: open items per workspace, newest first.
+        Index(
+            "ix_action_items_ws_queued", "workspace_id", "created_at", postgresql_where=text("status = 'queued'")
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     workspace_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -670,12 +799,13 @@ class ActionItem(Base):
 class ActionItemDecision(Base):
     __tablename__ = "action_item_decisions"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (UniqueConstraint("action_id", "reviewer_user_id", name="uq_action_reviewer_once"),)
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     action_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("action_items.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     reviewer_user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -692,7 +822,7 @@ class ActionItemDecision(Base):
 class Schedule(Base):
     __tablename__ = "schedules"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     workspace_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("workspaces.id", ondelete="CASCADE"),
@@ -734,13 +864,14 @@ class Schedule(Base):
     runs: Mapped[List["ScheduleRun"]] = relationship(
         back_populates="schedule",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
 class ScheduleRun(Base):
     __tablename__ = "schedule_runs"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     schedule_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("schedules.id", ondelete="CASCADE"),
@@ -764,7 +895,7 @@ class ScheduleRun(Base):
 class ArtifactComment(Base):
     __tablename__ = "artifact_comments"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     artifact_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -790,14 +921,14 @@ class ArtifactComment(Base):
     author: Mapped["User"] = relationship(foreign_keys=[author_user_id])
 
     mentions: Mapped[List["ArtifactCommentMention"]] = relationship(
-        back_populates="comment", cascade="all, delete-orphan"
+        back_populates="comment", cascade="all, delete-orphan", passive_deletes=True
     )
 
 
 class ArtifactCommentMention(Base):
     __tablename__ = "artifact_comment_mentions"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     comment_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -4,11 +4,11 @@ import uuid
 from datetime import datetime
 from typing import Any, Dict, Optional, List
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, LargeBinary, String, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, uuid7
 
 
 class Source(Base):
@@ -21,7 +21,7 @@ class Source(Base):
     """
     __tablename__ = "sources"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     workspace_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("workspaces.id"), nullable=False, index=True
@@ -34,19 +34,32 @@ class Source(Base):
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
-    documents: Mapped[List["Document"]] = relationship(back_populates="source", cascade="all, delete-orphan")
+    documents: Mapped[List["Document"]] = relationship(
+        back_populates="source", cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
+    )
 
 
 class Document(Base):
     __tablename__ = "documents"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # ON CONFLICT target for connector upserts; also serves workspace_id lookups.
+    __table_args__ = (
+        Index("uq_documents_workspace_source_external_id", "workspace_id", "source_id", "external_id", unique=True),
+        # Retrieval timeframe filters compare this exact expression (retrieval_search._TS_EXPR).
+        Index(
+            "ix_documents_ws_effective_ts",
+            "workspace_id",
+            text("COALESCE(source_updated_at, source_created_at, updated_at, created_at)"),
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     workspace_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("workspaces.id"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("workspaces.id"), nullable=False
     )
     source_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("sources.id"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("sources.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     external_id: Mapped[Optional[str]] = mapped_column(String(256), nullable=True, index=True)
@@ -65,16 +78,18 @@ class Document(Base):
     )
 
     source: Mapped["Source"] = relationship(back_populates="documents")
-    chunks: Mapped[List["Chunk"]] = relationship(back_populates="document", cascade="all, delete-orphan")
+    chunks: Mapped[List["Chunk"]] = relationship(
+        back_populates="document", cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
+    )
 
 
 class Chunk(Base):
     __tablename__ = "chunks"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     document_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("documents.id"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("documents.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     chunk_index: Mapped[int] = mapped_column(nullable=False)  # 0..N per document
@@ -84,23 +99,41 @@ class Chunk(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     document: Mapped["Document"] = relationship(back_populates="chunks")
-    embeddings: Mapped[List["Embedding"]] = relationship(back_populates="chunk", cascade="all, delete-orphan")
+    embeddings: Mapped[List["Embedding"]] = relationship(
+        back_populates="chunk", cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
+    )
 
 
 class Embedding(Base):
     __tablename__ = "embeddings"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     chunk_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("chunks.id"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("chunks.id", ondelete="CASCADE"), nullable=False, index=True
     )
     model: Mapped[str] = mapped_column(String(80), nullable=False)
 
-    # Placeholder: the real vector column is created via migration as embedding_vec vector(1536).
-    # Keeping this field avoids SQLAlchemy type dependency on pgvector for now.
-    embedding: Mapped[Optional[List[float]]] = mapped_column(JSONB, nullable=True)
+    # The vectors live in columns created via migration: embedding_vec vector(1536) and its
+    # generated fp16 copy embedding_vec_h halfvec(1536) (used for search). They are not
+    # mapped here, which keeps the ORM free of a pgvector type dependency and keeps
+    # ~6 KB vectors out of every ORM load; raw SQL reads/writes them.
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
-    chunk: Mapped["Chunk"] = relationship(back_populates="embeddings")
\ No newline at end of file
+    chunk: Mapped["Chunk"] = relationship(back_populates="embeddings")
+
+
+class EmbeddingCache(Base):
+    """
+    Content-addressed vectors: (model, sha256(chunk text)) -> embedding_vec.
+    Re-ingesting identical text reuses the stored vector instead of calling the
+    embeddings API again. The vector column is unmapped, as on Embedding.
+    """
+
+    __tablename__ = "embedding_cache"
+
+    model: Mapped[str] = mapped_column(String(80), primary_key=True)
+    content_sha256: Mapped[bytes] = mapped_column(LargeBinary(32), primary_key=True)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
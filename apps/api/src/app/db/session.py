@@ -1,11 +1,44 @@
 from __future__ import annotations
 
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
+# prepare_threshold=None disables server-side prepared statements in psycopg3.
+_prepare_threshold = settings.DB_PREPARE_THRESHOLD if settings.DB_PREPARE_THRESHOLD >= 0 else None
+
+
+def _json_dumps(value) -> bytes:
+    # psycopg3 accepts bytes from the dumps hook. OPT_NON_STR_KEYS keeps stdlib
+    # json's behaviour of stringifying int dict keys instead of raising.
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+
+_engine_kwargs = dict(
+    pool_pre_ping=True,
+    # json/jsonb columns (meta, payloads) are encoded/decoded with orjson instead of
+    # stdlib json; the dialect registers both on psycopg's json adapters.
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
+    connect_args={"prepare_threshold": _prepare_threshold},
+    # SQL compilation cache (per engine). ORM flushes add a statement variant per
+    # (table, changed-column set) on top of the ~120 query call sites, which can
+    # overrun the 500-entry default and force recompiles; keep headroom.
+    query_cache_size=1200,
+)
+if settings.DB_NULL_POOL:
+    _engine_kwargs["poolclass"] = NullPool
+else:
+    _engine_kwargs.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    )
+
+engine = create_engine(settings.DATABASE_URL, **_engine_kwargs)
 
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
@@ -15,4 +48,4 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
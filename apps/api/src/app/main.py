@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
@@ -23,7 +24,9 @@ from app.api.governance import router as governance_router
 from app.api.custom_agent_runs import router as custom_agent_runs_router
 from app.api.agent_builder import router as agent_builder_router
 
-app = FastAPI(title="PM Agent OS API", version="0.0.1")
+# orjson renders the response bodies (dict-heavy meta/payload JSONB, retrieval items)
+# instead of stdlib json; explicit JSONResponse/StreamingResponse returns are unaffected.
+app = FastAPI(title="PM Agent OS API", version="0.0.1", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
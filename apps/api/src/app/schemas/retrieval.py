@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import uuid
+from datetime import datetime
 from typing import Any, Dict, Optional, List
 from pydantic import BaseModel
 
@@ -68,30 +70,32 @@ class RetrieveResponse(BaseModel):
 # -------------------------
 # V1 traceability schemas
 # -------------------------
+# ids/timestamps are typed so pydantic-core serializes the ORM values directly
+# (canonical UUID string, ISO-8601 with "Z") instead of per-field str() calls.
 class RetrievalRequestOut(BaseModel):
-    id: str
-    workspace_id: str
-    created_by_user_id: str
+    id: uuid.UUID
+    workspace_id: uuid.UUID
+    created_by_user_id: uuid.UUID
     q: str
     k: int
     alpha: float
     source_types: Optional[str] = None
     timeframe: Dict[str, Any]
-    created_at: str
+    created_at: datetime
 
 
 class RetrievalRequestItemOut(BaseModel):
-    id: str
-    request_id: str
+    id: uuid.UUID
+    request_id: uuid.UUID
     rank: int
 
-    chunk_id: Optional[str] = None
-    document_id: Optional[str] = None
-    source_id: Optional[str] = None
+    chunk_id: Optional[uuid.UUID] = None
+    document_id: Optional[uuid.UUID] = None
+    source_id: Optional[uuid.UUID] = None
 
     snippet: str
     meta: Dict[str, Any]
     score_fts: float
     score_vec: float
     score_hybrid: float
-    created_at: str
\ No newline at end of file
+    created_at: datetime
\ No newline at end of file
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from app.core.refresh_tokens import delete_expired_refresh_tokens
+from app.db.session import SessionLocal
+
+
+def purge() -> int:
+    db = SessionLocal()
+    try:
+        return delete_expired_refresh_tokens(db)
+    finally:
+        db.close()
+
+
+# Run periodically (e.g. daily cron):
+#   PYTHONPATH=src python -m app.scripts.purge_refresh_tokens
+if __name__ == "__main__":
+    deleted = purge()
+    print(f"Purge refresh tokens complete. Deleted={deleted}")
@@ -50,7 +50,7 @@ DEFAULT_ARTIFACT_TYPES = [
 def seed() -> None:
     db: Session = SessionLocal()
     try:
-        existing = {a.id for a in db.execute(select(AgentDefinition)).scalars().all()}
+        existing = set(db.execute(select(AgentDefinition.id)).scalars())
 
         created = 0
         for agent_id, name, desc in AGENTS:
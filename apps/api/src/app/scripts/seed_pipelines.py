@@ -2,63 +2,33 @@ from __future__ import annotations
 
 import argparse
 import uuid
-from typing import Any, Dict, List, Tuple
-
-from sqlalchemy import select
-from sqlalchemy.orm import Session
-
-from app.db.session import SessionLocal
-from app.db.models import AgentDefinition, PipelineTemplate
-
-
-# ---------
-# Canonical pipelines (V1)
-# NOTE: agent_id must exist in AgentDefinition.id (seed_agents.py)
-# ---------
-CANONICAL_PIPELINES: List[Dict[str, Any]] = [
-    {
-        "name": "Discovery → Strategy → PRD",
-        "description": "End-to-end early phase flow: identify opportunities, pick direction, write PRD.",
-        "steps": [
-            {"name": "Discovery", "agent_id": "discovery"},
-            {"name": "Strategy & Roadmap", "agent_id": "strategy_roadmap"},
-            {"name": "PRD", "agent_id": "prd"},
-        ],
-    },
-    {
-        "name": "PRD → UX → Feasibility",
-        "description": "Turn PRD into UX flow spec, then validate feasibility and architecture.",
-        "steps": [
-            {"name": "PRD", "agent_id": "prd"},
-            {"name": "UX Flow", "agent_id": "ux_flow"},
-            {"name": "Feasibility & Architecture", "agent_id": "feasibility_architecture"},
-        ],
-    },
-    {
-        "name": "Analytics → QA → Launch",
-        "description": "Operationalization flow: tracking + experiment plan → QA suite → launch plan/runbook.",
-        "steps": [
-            {"name": "Analytics & Experiment", "agent_id": "analytics_experiment"},
-            {"name": "QA & Test", "agent_id": "qa_test"},
-            {"name": "Launch", "agent_id": "launch"},
-        ],
-    },
-    {
-        "name": "Launch → Monitoring → Stakeholders",
-        "description": "Post-release loop: launch → health monitoring → stakeholder update pack.",
-        "steps": [
-            {"name": "Launch", "agent_id": "launch"},
-            {"name": "Post-launch Monitoring", "agent_id": "post_launch_monitoring"},
-            {"name": "Stakeholder Alignment", "agent_id": "stakeholder_alignment"},
-        ],
-    },
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+from app.core.pipeline_templates import CANONICAL_PIPELINES
+
+# SQLAlchemy, the engine and the ORM models are imported inside the functions below,
+# so `--help` and argument errors return without loading (or connecting) anything.
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+
+# Derived once at import: CANONICAL_PIPELINES is constant.
+_NEEDED_AGENT_IDS: frozenset[str] = frozenset(
+    s["agent_id"] for p in CANONICAL_PIPELINES for s in p["definition_json"]["steps"]
+)
+_TEMPLATE_DEFS: List[Tuple[str, str, Dict[str, Any]]] = [
+    (p["name"], p["description"], p["definition_json"]) for p in CANONICAL_PIPELINES
 ]
 
 
 def _validate_agents_exist(db: Session) -> None:
-    needed = sorted({s["agent_id"] for p in CANONICAL_PIPELINES for s in p["steps"]})
-    existing = {a.id for a in db.execute(select(AgentDefinition)).scalars().all()}
-    missing = [a for a in needed if a not in existing]
+    from sqlalchemy import select
+
+    from app.db.models import AgentDefinition
+
+    # Existence probe on the primary key; no need to load full agent rows.
+    found = set(db.execute(select(AgentDefinition.id).where(AgentDefinition.id.in_(_NEEDED_AGENT_IDS))).scalars())
+    missing = sorted(_NEEDED_AGENT_IDS - found)
     if missing:
         raise RuntimeError(
             f"Missing AgentDefinition rows for: {missing}. "
@@ -70,47 +40,52 @@ def seed(workspace_id: uuid.UUID) -> Tuple[int, int]:
     """
     Upsert canonical pipeline templates for a workspace.
     Returns: (created_count, updated_count)
+
+    One INSERT ... ON CONFLICT (workspace_id, name) DO UPDATE for all templates;
+    existing rows keep their id. `xmax = 0` only holds for freshly inserted rows.
     """
+    from sqlalchemy import func, literal_column
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
+    from sqlalchemy.exc import IntegrityError
+
+    from app.db.base import uuid7
+    from app.db.models import PipelineTemplate
+    from app.db.session import SessionLocal
+
     db: Session = SessionLocal()
     try:
         _validate_agents_exist(db)
 
-        existing_by_name: Dict[str, PipelineTemplate] = {
-            t.name: t
-            for t in db.execute(
-                select(PipelineTemplate).where(PipelineTemplate.workspace_id == workspace_id)
-            ).scalars().all()
-        }
-
-        created = 0
-        updated = 0
-
-        for p in CANONICAL_PIPELINES:
-            definition_json = {
-                "version": "v1",
-                "steps": [{"name": s["name"], "agent_id": s["agent_id"]} for s in p["steps"]],
+        rows = [
+            {
+                "id": uuid7(),
+                "workspace_id": workspace_id,
+                "name": name,
+                "description": description,
+                "definition_json": definition_json,
             }
-
-            if p["name"] in existing_by_name:
-                t = existing_by_name[p["name"]]
-                # Update in-place (id stable)
-                t.description = p["description"]
-                t.definition_json = definition_json
-                db.add(t)
-                updated += 1
-            else:
-                t = PipelineTemplate(
-                    id=uuid.uuid4(),
-                    workspace_id=workspace_id,
-                    name=p["name"],
-                    description=p["description"],
-                    definition_json=definition_json,
-                )
-                db.add(t)
-                created += 1
+            for name, description, definition_json in _TEMPLATE_DEFS
+        ]
+        ins = pg_insert(PipelineTemplate).values(rows)
+        stmt = ins.on_conflict_do_update(
+            index_elements=[PipelineTemplate.workspace_id, PipelineTemplate.name],
+            set_={
+                "description": ins.excluded.description,
+                "definition_json": ins.excluded.definition_json,
+                "updated_at": func.now(),
+            },
+        ).returning(literal_column("(xmax = 0)"))
+        # No workspace pre-check: the FK on pipeline_templates.workspace_id rejects unknown ids.
+        try:
+            inserted = db.execute(stmt).scalars().all()
+        except IntegrityError as e:
+            if getattr(e.orig, "sqlstate", None) == "23503":  # foreign_key_violation
+                raise RuntimeError(f"Workspace not found: {workspace_id}") from e
+            raise
 
         db.commit()
-        return created, updated
+        created = sum(1 for x in inserted if x)
+        return created, len(inserted) - created
     finally:
         db.close()
 
@@ -120,7 +95,10 @@ def main() -> None:
     parser.add_argument("--workspace_id", required=True, help="Workspace UUID to seed templates into")
     args = parser.parse_args()
 
-    ws_id = uuid.UUID(args.workspace_id)
+    try:
+        ws_id = uuid.UUID(args.workspace_id)
+    except ValueError:
+        parser.error(f"--workspace_id is not a valid UUID: {args.workspace_id}")
     created, updated = seed(ws_id)
     print(f"Seed pipelines complete. Created={created}, Updated={updated}")
 
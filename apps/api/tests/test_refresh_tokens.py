@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+
+import pytest
+
+from app.core.config import settings
+from app.core.refresh_tokens import generate_refresh_token, hash_refresh_token
+
+
+@pytest.mark.parametrize(
+    "secret",
+    ["", "short", "k" * 64, "k" * 65 + "-longer-than-one-sha256-block", "ünïcödé-sëcret"],
+)
+def test_hash_refresh_token_matches_hmac(monkeypatch, secret):
+    monkeypatch.setattr(settings, "JWT_SECRET", secret)
+    for token in ["", "abc", generate_refresh_token(), "t" * 500]:
+        expected = hmac.new(secret.encode("utf-8"), token.encode("utf-8"), hashlib.sha256).digest()
+        assert hash_refresh_token(token) == expected
+
+
+def test_hash_refresh_token_follows_secret_rotation(monkeypatch):
+    token = generate_refresh_token()
+    monkeypatch.setattr(settings, "JWT_SECRET", "secret-a")
+    a = hash_refresh_token(token)
+    monkeypatch.setattr(settings, "JWT_SECRET", "secret-b")
+    b = hash_refresh_token(token)
+    assert a != b
+    assert b == hmac.new(b"secret-b", token.encode("utf-8"), hashlib.sha256).digest()
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import time
+import uuid
+
+import pytest
+from jose import JWTError, jwt
+from sqlalchemy import event
+
+from app.core import security
+from app.core.config import settings
+from app.core.security import create_access_token, decode_access_token
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    security._DECODE_CACHE.clear()
+    security._USER_CACHE.clear()
+    yield
+    security._DECODE_CACHE.clear()
+    security._USER_CACHE.clear()
+
+
+@pytest.fixture()
+def count_jwt_decodes(monkeypatch):
+    calls = []
+    real_decode = security.jwt.decode
+
+    def _decode(*args, **kwargs):
+        calls.append(args[0])
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(security.jwt, "decode", _decode)
+    return calls
+
+
+def test_decode_cache_hit_skips_verification(count_jwt_decodes):
+    token = create_access_token(user_id=uuid.uuid4(), email="a@example.com")
+
+    first = decode_access_token(token)
+    second = decode_access_token(token)
+
+    assert first == second
+    assert len(count_jwt_decodes) == 1
+
+
+def test_decode_cache_returns_copies():
+    token = create_access_token(user_id=uuid.uuid4(), email="a@example.com")
+
+    decode_access_token(token)["sub"] = "tampered"
+    assert decode_access_token(token)["sub"] != "tampered"
+
+
+def test_decode_cache_entry_dropped_after_exp(count_jwt_decodes):
+    token = create_access_token(user_id=uuid.uuid4(), email="a@example.com")
+    decode_access_token(token)
+
+    secret, _exp, payload = security._DECODE_CACHE[token]
+    security._DECODE_CACHE[token] = (secret, time.time() - 1, payload)
+
+    decode_access_token(token)
+    assert len(count_jwt_decodes) == 2
+
+
+def test_decode_cache_invalidated_by_secret_rotation(monkeypatch):
+    token = create_access_token(user_id=uuid.uuid4(), email="a@example.com")
+    decode_access_token(token)
+
+    monkeypatch.setattr(settings, "JWT_SECRET", settings.JWT_SECRET + "-rotated")
+    with pytest.raises(JWTError):
+        decode_access_token(token)
+    assert token not in security._DECODE_CACHE
+
+
+def test_decode_cache_skips_non_access_tokens():
+    now = int(time.time())
+    token = jwt.encode(
+        {"sub": str(uuid.uuid4()), "iat": now, "exp": now + 60, "type": "refresh"},
+        settings.JWT_SECRET,
+        algorithm=settings.JWT_ALG,
+    )
+    with pytest.raises(ValueError):
+        decode_access_token(token)
+    assert token not in security._DECODE_CACHE
+
+
+def test_decode_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(security, "_DECODE_CACHE_MAX", 2)
+    tokens = [create_access_token(user_id=uuid.uuid4(), email=f"{i}@example.com") for i in range(3)]
+    for t in tokens:
+        decode_access_token(t)
+
+    assert list(security._DECODE_CACHE) == tokens[1:]
+
+
+# --------------------------
+# Current-user cache
+# --------------------------
+@pytest.fixture()
+def count_user_selects(engine):
+    calls = []
+
+    def _before(conn, cursor, statement, params, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "users" in statement:
+            calls.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before)
+    yield calls
+    event.remove(engine, "before_cursor_execute", _before)
+
+
+def _make_user(db, email: str = "cached@example.com"):
+    from app.db.models import User
+    from app.core.security_passwords import hash_password
+
+    u = User(email=email, password_hash=hash_password("pw-cached"))
+    db.add(u)
+    db.flush()
+    user_id = u.id  # read before commit: the post-commit refresh would count as a users SELECT
+    db.commit()
+    return user_id
+
+
+def test_user_cache_hit_skips_select(db, SessionLocal, count_user_selects):
+    user_id = _make_user(db)
+
+    with SessionLocal() as s1:
+        u1 = security._get_user_cached(s1, user_id)
+    assert len(count_user_selects) == 1
+
+    with SessionLocal() as s2:
+        u2 = security._get_user_cached(s2, user_id)
+        # Session-bound copy, not the cached snapshot itself.
+        assert u2 in s2
+        assert u2 is not security._USER_CACHE[user_id][1]
+        assert u2.email == "cached@example.com"
+    assert len(count_user_selects) == 1
+    assert u1.id == u2.id
+
+
+def test_user_cache_missing_user_not_cached(db):
+    missing = uuid.uuid4()
+    assert security._get_user_cached(db, missing) is None
+    assert missing not in security._USER_CACHE
+
+
+def test_user_cache_ttl_expiry(db, SessionLocal, count_user_selects):
+    user_id = _make_user(db)
+    with SessionLocal() as s:
+        security._get_user_cached(s, user_id)
+
+    _exp, snapshot = security._USER_CACHE[user_id]
+    security._USER_CACHE[user_id] = (time.monotonic() - 1, snapshot)
+
+    with SessionLocal() as s:
+        security._get_user_cached(s, user_id)
+    assert len(count_user_selects) == 2
+
+
+def test_user_cache_invalidate_sees_row_change(db, SessionLocal):
+    from app.db.models import User
+
+    user_id = _make_user(db)
+    with SessionLocal() as s:
+        security._get_user_cached(s, user_id)
+
+    db.get(User, user_id).email = "renamed@example.com"
+    db.commit()
+
+    with SessionLocal() as s:
+        assert security._get_user_cached(s, user_id).email == "cached@example.com"
+
+    security.invalidate_user_cache(user_id)
+    with SessionLocal() as s:
+        assert security._get_user_cached(s, user_id).email == "renamed@example.com"
+
+
+def test_login_drops_cached_user(client, db):
+    user_id = _make_user(db)
+
+    r = client.post("/auth/login", json={"email": "cached@example.com", "password": "pw-cached"})
+    assert r.status_code == 200, r.text
+    r = client.get("/auth/me")
+    assert r.status_code == 200, r.text
+    assert user_id in security._USER_CACHE
+
+    r = client.post("/auth/login", json={"email": "cached@example.com", "password": "pw-cached"})
+    assert r.status_code == 200, r.text
+    assert user_id not in security._USER_CACHE
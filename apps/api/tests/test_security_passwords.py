@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import bcrypt
+import pytest
+
+from app.core.security_passwords import hash_password, password_needs_rehash, verify_password
+
+
+def _bcrypt_hash(password: str) -> str:
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=4)).decode("utf-8")
+
+
+def test_new_hashes_are_argon2id_and_verify():
+    h = hash_password("correct horse")
+    assert h.startswith("$argon2id$")
+    assert verify_password("correct horse", h)
+    assert not password_needs_rehash(h)
+
+
+def test_legacy_bcrypt_hash_verifies_and_needs_rehash():
+    h = _bcrypt_hash("correct horse")
+    assert verify_password("correct horse", h)
+    assert password_needs_rehash(h)
+
+
+@pytest.mark.parametrize("make_hash", [hash_password, _bcrypt_hash])
+def test_wrong_password_rejected(make_hash):
+    assert not verify_password("wrong horse", make_hash("correct horse"))
+
+
+@pytest.mark.parametrize(
+    "bad_hash",
+    ["", "not-a-hash", "$2b$12$tooshort", "$argon2id$garbage", "$argon2id$v=19$m=65536,t=2,p=2$AAAA"],
+)
+def test_malformed_hash_rejected(bad_hash):
+    assert not verify_password("correct horse", bad_hash)
+    assert password_needs_rehash(bad_hash)
+
+
+def test_overlong_password_rejected_for_bcrypt():
+    h = _bcrypt_hash("x" * 72)
+    assert not verify_password("x" * 73, h)
+
+
+def test_login_upgrades_bcrypt_hash(client, db):
+    from app.db.models import User
+
+    u = User(email="legacy@example.com", password_hash=_bcrypt_hash("pw-legacy"))
+    db.add(u)
+    db.commit()
+
+    r = client.post("/auth/login", json={"email": "legacy@example.com", "password": "pw-legacy"})
+    assert r.status_code == 200, r.text
+
+    db.expire_all()
+    new_hash = db.get(User, u.id).password_hash
+    assert new_hash.startswith("$argon2id$")
+    assert not password_needs_rehash(new_hash)
+
+    # The upgraded hash still logs in.
+    r = client.post("/auth/login", json={"email": "legacy@example.com", "password": "pw-legacy"})
+    assert r.status_code == 200, r.text